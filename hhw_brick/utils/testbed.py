@@ -7,11 +7,26 @@ Provides unified interface to access Brick models and timeseries data in Final_T
 Allows App developers to conveniently access test data
 """
 
-import random
+import os
+import re
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 from rdflib import Graph, Namespace
+from rdflib.plugins.sparql import prepareQuery
+
+# Attempt to import pyarrow (optional, multi-threaded CSV reader)
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+
+    _PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _PYARROW_AVAILABLE = False
 
 # Project root - testbed.py is under utils/, go up 4 levels to "Hot Water System"
 # testbed.py -> utils -> hhw_brick -> HHW_brick -> Hot Water System
@@ -19,6 +34,9 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 BRICK_MODELS_DIR = PROJECT_ROOT / "Final_Test_Output"
 TIMESERIES_DATA_DIR = PROJECT_ROOT / "Example_Input_Data" / "hhw_system_data"
 
+# Brick ontology shipped with the validation package (used for subclass lookups)
+BRICK_ONTOLOGY_PATH = Path(__file__).parent.parent / "validation" / "Brick_Self.ttl"
+
 # Commonly used Brick namespaces (simplifies SPARQL writing)
 BRICK = Namespace("https://brickschema.org/schema/Brick#")
 RDF = Namespace("http://www.w3.org/1999/02/22-rdf-syntax-ns#")
@@ -34,15 +52,157 @@ PREFIX ref: <https://brickschema.org/schema/Brick/ref#>
 PREFIX unit: <http://qudt.org/vocab/unit/>
 """
 
+# Same prefixes as a namespace mapping, for queries that declare only some PREFIXes
+_SPARQL_NAMESPACES = dict(re.findall(r"PREFIX (\w*): <([^>]*)>", SPARQL_PREFIXES))
+
+# Maximum number of (building, query) result sets kept in memory
+QUERY_CACHE_SIZE = 256
+
+# Default number of Brick graphs / timeseries DataFrames kept in memory
+GRAPH_CACHE_SIZE = 16
+TIMESERIES_CACHE_SIZE = 4
+
+
+def _normalize_query(sparql_query: str) -> str:
+    """Strip the query and prepend PREFIX declarations once (if not present)"""
+    sparql_query = sparql_query.strip()
+    if "PREFIX" not in sparql_query.upper():
+        sparql_query = SPARQL_PREFIXES.strip() + "\n" + sparql_query
+    return sparql_query
+
+
+def _query_digest(sparql_query: str) -> bytes:
+    """Short hash of a normalized query, used as cache key"""
+    return hashlib.blake2b(sparql_query.encode("utf-8"), digest_size=16).digest()
+
+
+def _lru_get(cache: OrderedDict, key):
+    """Get value from an LRU OrderedDict (None if missing), marking it most recently used"""
+    if key not in cache:
+        return None
+    cache.move_to_end(key)
+    return cache[key]
+
+
+def _lru_put(cache: OrderedDict, key, value, maxsize: int):
+    """Put value into an LRU OrderedDict, evicting least recently used entries beyond maxsize"""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > maxsize:
+        cache.popitem(last=False)
+
+
+@lru_cache(maxsize=64)
+def _prepare_query(sparql_query: str):
+    """
+    Compile a normalized query once so it can be reused across buildings
+
+    Prefixes from SPARQL_PREFIXES are available even when the query declares other
+    PREFIXes itself (the query's own declarations take precedence).
+    """
+    return prepareQuery(sparql_query, initNs=_SPARQL_NAMESPACES)
+
+
+@lru_cache(maxsize=1)
+def _load_brick_ontology() -> Graph:
+    """Load the Brick ontology once per process"""
+    g = Graph()
+    g.parse(str(BRICK_ONTOLOGY_PATH), format="turtle")
+    return g
+
+
+@lru_cache(maxsize=None)
+def _subclass_closure(class_name: str) -> frozenset:
+    """All Brick classes that are (transitively) subclasses of brick:<class_name>, inclusive"""
+    return frozenset(_load_brick_ontology().transitive_subjects(RDFS.subClassOf, BRICK[class_name]))
+
+
+def _dir_mtime(path: Path) -> Optional[int]:
+    """Modification time of a directory in ns (None if it does not exist)"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_timeseries_csv(path: str, parse_dates: bool = True) -> pd.DataFrame:
+    """
+    Read timeseries CSV, using pyarrow's multi-threaded reader when available
+
+    Produces the same frame as pd.read_csv (+ pd.to_datetime on datetime_UTC)
+
+    Args:
+        path: CSV file path
+        parse_dates: Whether to parse datetime_UTC column
+
+    Returns:
+        DataFrame
+    """
+    if _PYARROW_AVAILABLE:
+        convert_options = pacsv.ConvertOptions(
+            column_types={} if parse_dates else {"datetime_UTC": pa.string()},
+            strings_can_be_null=True,
+        )
+        try:
+            table = pacsv.read_csv(path, convert_options=convert_options)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            table = None
+
+        if table is not None:
+            for i, field in enumerate(table.schema):
+                if field.name == "datetime_UTC" and pa.types.is_timestamp(field.type):
+                    # Parsed directly by Arrow, match pandas nanosecond resolution
+                    target = pa.timestamp("ns", tz=field.type.tz)
+                elif pa.types.is_date(field.type) or pa.types.is_timestamp(field.type):
+                    # pandas keeps other date-like columns as strings
+                    target = pa.string()
+                elif pa.types.is_null(field.type):
+                    # All-empty columns are NaN floats in pandas, not None objects
+                    target = pa.float64()
+                else:
+                    continue
+                table = table.set_column(i, field.name, table.column(i).cast(target))
+
+            df = table.to_pandas(self_destruct=True)
+            if parse_dates and "datetime_UTC" in df.columns and df["datetime_UTC"].dtype == object:
+                df["datetime_UTC"] = pd.to_datetime(df["datetime_UTC"])
+            return df
+
+    df = pd.read_csv(path)
+    if parse_dates and "datetime_UTC" in df.columns:
+        df["datetime_UTC"] = pd.to_datetime(df["datetime_UTC"])
+    return df
+
 
 class TestDataset:
     """Test dataset class"""
 
-    def __init__(self):
-        """Initialize test dataset"""
+    def __init__(
+        self,
+        graph_cache_size: int = GRAPH_CACHE_SIZE,
+        ts_cache_size: int = TIMESERIES_CACHE_SIZE,
+    ):
+        """
+        Initialize test dataset
+
+        Args:
+            graph_cache_size: Maximum number of Brick graphs kept in memory
+            ts_cache_size: Maximum number of timeseries DataFrames kept in memory
+        """
         self.brick_models_dir = BRICK_MODELS_DIR
         self.timeseries_data_dir = TIMESERIES_DATA_DIR
-        self._cache = {}
+        self.graph_cache_size = graph_cache_size
+        self.ts_cache_size = ts_cache_size
+        self._graph_cache: "OrderedDict[str, Graph]" = OrderedDict()
+        self._ts_cache: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+        self._query_cache: "OrderedDict[Tuple[str, bytes], list]" = OrderedDict()
+        self._sensor_col_cache: Dict[str, Dict[str, str]] = {}
+
+        # Building index (rebuilt when either data directory changes)
+        self._index_key = None
+        self._buildings: List[Dict] = []
+        self._by_system: Dict[str, List[Dict]] = {}
+        self._by_id: Dict[str, Dict] = {}
 
     def list_buildings(self, system_type: Optional[str] = None) -> List[str]:
         """
@@ -54,37 +214,71 @@ class TestDataset:
         Returns:
             Building ID list
         """
+        self._ensure_index()
+
+        if not system_type:
+            records = self._buildings
+        else:
+            matches = [k for k in self._by_system if k.startswith(system_type)]
+            if len(matches) == 1:
+                records = self._by_system[matches[0]]
+            else:
+                records = sorted(
+                    (b for k in matches for b in self._by_system[k]), key=lambda x: int(x["id"])
+                )
+
+        # Return copies so callers can annotate records without touching the index
+        return [dict(b) for b in records]
+
+    def _ensure_index(self):
+        """(Re)build the building index if the data directories have changed since last scan"""
+        key = (
+            str(self.brick_models_dir),
+            str(self.timeseries_data_dir),
+            _dir_mtime(self.brick_models_dir),
+            _dir_mtime(self.timeseries_data_dir),
+        )
+        if key != self._index_key:
+            self._scan()
+            self._index_key = key
+
+    def _scan(self):
+        """Scan the Brick model directory and index buildings by ID and system type"""
         buildings = []
 
-        if not self.brick_models_dir.exists():
-            return buildings
+        if self.brick_models_dir.exists():
+            for file in self.brick_models_dir.glob("building_*.ttl"):
+                # Extract building ID and system type
+                stem = file.stem  # building_29_district_hw_z
+                parts = stem.split("_")
 
-        for file in self.brick_models_dir.glob("building_*.ttl"):
-            # Extract building ID and system type
-            stem = file.stem  # building_29_district_hw_z
-            parts = stem.split("_")
+                if len(parts) < 3:
+                    continue
 
-            if len(parts) < 3:
-                continue
+                building_id = parts[1]
+                file_system_type = "_".join(parts[2:-1]) if len(parts) > 3 else parts[2]
 
-            building_id = parts[1]
-            file_system_type = "_".join(parts[2:-1]) if len(parts) > 3 else parts[2]
+                buildings.append(
+                    {
+                        "id": building_id,
+                        "system_type": file_system_type,
+                        "organization": parts[-1] if len(parts) > 3 else "unknown",
+                        "brick_model": str(file),
+                        "timeseries_data": self._get_timeseries_path(building_id),
+                    }
+                )
 
-            # Filter system type
-            if system_type and not file_system_type.startswith(system_type):
-                continue
+        buildings.sort(key=lambda x: int(x["id"]))
 
-            buildings.append(
-                {
-                    "id": building_id,
-                    "system_type": file_system_type,
-                    "organization": parts[-1] if len(parts) > 3 else "unknown",
-                    "brick_model": str(file),
-                    "timeseries_data": self._get_timeseries_path(building_id),
-                }
-            )
+        by_system: Dict[str, List[Dict]] = {}
+        by_id: Dict[str, Dict] = {}
+        for record in buildings:
+            by_system.setdefault(record["system_type"], []).append(record)
+            by_id.setdefault(record["id"], record)
 
-        return sorted(buildings, key=lambda x: int(x["id"]))
+        self._buildings = buildings
+        self._by_system = by_system
+        self._by_id = by_id
 
     def _get_timeseries_path(self, building_id: str) -> Optional[str]:
         """Get timeseries data path"""
@@ -101,11 +295,9 @@ class TestDataset:
         Returns:
             Building information dict containing brick_model and timeseries_data paths
         """
-        buildings = self.list_buildings()
-        for building in buildings:
-            if building["id"] == str(building_id):
-                return building
-        return None
+        self._ensure_index()
+        building = self._by_id.get(str(building_id))
+        return dict(building) if building is not None else None
 
     def load_brick_model(self, building_id: str) -> Optional[Graph]:
         """
@@ -117,10 +309,11 @@ class TestDataset:
         Returns:
             RDF Graph object
         """
-        cache_key = f"brick_{building_id}"
+        cache_key = str(building_id)
 
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        g = _lru_get(self._graph_cache, cache_key)
+        if g is not None:
+            return g
 
         building = self.get_building(building_id)
         if not building or not building["brick_model"]:
@@ -129,11 +322,15 @@ class TestDataset:
         g = Graph()
         g.parse(building["brick_model"], format="turtle")
 
-        self._cache[cache_key] = g
+        _lru_put(self._graph_cache, cache_key, g, self.graph_cache_size)
         return g
 
     def load_timeseries(
-        self, building_id: str, parse_dates: bool = True, set_index: bool = True
+        self,
+        building_id: str,
+        parse_dates: bool = True,
+        set_index: bool = True,
+        copy: bool = True,
     ) -> Optional[pd.DataFrame]:
         """
         Load timeseries data for building
@@ -142,32 +339,36 @@ class TestDataset:
             building_id: Building ID
             parse_dates: Whether to parse date columns
             set_index: Whether to set datetime_UTC as index
+            copy: Whether to return a copy of the cached DataFrame (default). With
+                copy=False the shared cached DataFrame is returned and must not be
+                modified in place
 
         Returns:
             DataFrame
         """
-        cache_key = f"timeseries_{building_id}"
+        cache_key = str(building_id)
 
-        if cache_key in self._cache:
-            return self._cache[cache_key].copy()
+        df = _lru_get(self._ts_cache, cache_key)
+        if df is not None:
+            return df.copy() if copy else df
 
         building = self.get_building(building_id)
         if not building or not building["timeseries_data"]:
             return None
 
-        df = pd.read_csv(building["timeseries_data"])
-
-        if parse_dates and "datetime_UTC" in df.columns:
-            df["datetime_UTC"] = pd.to_datetime(df["datetime_UTC"])
+        df = _read_timeseries_csv(building["timeseries_data"], parse_dates=parse_dates)
 
         if set_index and "datetime_UTC" in df.columns:
             df.set_index("datetime_UTC", inplace=True)
 
-        self._cache[cache_key] = df
-        return df.copy()
+        _lru_put(self._ts_cache, cache_key, df, self.ts_cache_size)
+        return df.copy() if copy else df
 
     def get_sensor_columns(
-        self, building_id: str, sensor_types: Optional[List[str]] = None
+        self,
+        building_id: str,
+        sensor_types: Optional[List[str]] = None,
+        graph: Optional[Graph] = None,
     ) -> Dict[str, str]:
         """
         Extract sensor to CSV column mapping from Brick model
@@ -175,30 +376,61 @@ class TestDataset:
         Args:
             building_id: Building ID
             sensor_types: Sensor type list (optional), e.g. ['Temperature_Sensor', 'Flow_Sensor']
+            graph: Already loaded Brick model of the building (optional, avoids reloading it)
 
         Returns:
             Dict with sensor URI as key and CSV column name as value
         """
-        g = self.load_brick_model(building_id)
+        cache_key = str(building_id)
+        if cache_key in self._sensor_col_cache:
+            return dict(self._sensor_col_cache[cache_key])
+
+        g = graph if graph is not None else self.load_brick_model(building_id)
         if not g:
             return {}
 
-        # SPARQL query to get timeseries ID of sensors
-        query = """
-        PREFIX ref: <https://brickschema.org/schema/Brick/ref#>
-        PREFIX brick: <https://brickschema.org/schema/Brick#>
-        PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+        # Walk sensor -> external reference -> timeseries ID directly on the
+        # triple indexes (avoids SPARQL parse/plan overhead for this star pattern)
+        mapping = {}
+        for sensor, ref in g.subject_objects(REF.hasExternalReference):
+            column = g.value(ref, REF.hasTimeseriesId)
+            if column is not None:
+                mapping[str(sensor)] = str(column)
 
-        SELECT ?sensor ?column WHERE {
-            ?sensor ref:hasExternalReference ?ref .
-            ?ref ref:hasTimeseriesId ?column .
-        }
+        self._sensor_col_cache[cache_key] = mapping
+        return dict(mapping)
+
+    def _run_query(self, building_id: str, sparql_query: str) -> Optional[list]:
         """
+        Execute a normalized SPARQL query against a building model, with LRU caching
+
+        Args:
+            building_id: Building ID
+            sparql_query: Normalized SPARQL query (see _normalize_query)
 
+        Returns:
+            Materialized result rows, or None if the Brick model is not available
+        """
+        key = (str(building_id), _query_digest(sparql_query))
+
+        results = _lru_get(self._query_cache, key)
+        if results is not None:
+            return list(results)
+
+        g = self.load_brick_model(building_id)
+        if not g:
+            return None
+
+        try:
+            query = _prepare_query(sparql_query)
+        except Exception:
+            # E.g. a prefix bound only in the model itself: resolve with the graph's bindings
+            query = sparql_query
         results = list(g.query(query))
-        mapping = {str(row[0]): str(row[1]) for row in results}
 
-        return mapping
+        _lru_put(self._query_cache, key, results, QUERY_CACHE_SIZE)
+
+        return list(results)
 
     def filter_buildings_by_query(self, sparql_query: str) -> List[Dict]:
         """
@@ -211,18 +443,13 @@ class TestDataset:
             List of qualified buildings
         """
         # Automatically add PREFIX (if not present)
-        if "PREFIX" not in sparql_query.upper():
-            sparql_query = SPARQL_PREFIXES + sparql_query
+        sparql_query = _normalize_query(sparql_query)
 
         qualified_buildings = []
 
         for building in self.list_buildings():
             try:
-                g = self.load_brick_model(building["id"])
-                if not g:
-                    continue
-
-                results = list(g.query(sparql_query))
+                results = self._run_query(building["id"], sparql_query)
                 if results:
                     building["query_results"] = results
                     qualified_buildings.append(building)
@@ -252,24 +479,18 @@ class TestDataset:
             >>> # df contains 'sup' and 'ret' columns
         """
         # Automatically add PREFIX
-        if "PREFIX" not in sparql_query.upper():
-            sparql_query = SPARQL_PREFIXES + sparql_query
-
-        # Load Brick model
-        g = self.load_brick_model(building_id)
-        if not g:
-            return None
+        sparql_query = _normalize_query(sparql_query)
 
-        # Execute query
-        results = list(g.query(sparql_query))
+        # Execute query against the Brick model
+        results = self._run_query(building_id, sparql_query)
         if not results:
             return None
 
         # Get sensor column mapping
         sensor_columns = self.get_sensor_columns(building_id)
 
-        # Load timeseries data
-        df = self.load_timeseries(building_id)
+        # Load timeseries data (shared cached frame, only sliced below)
+        df = self.load_timeseries(building_id, copy=False)
         if df is None:
             return None
 
@@ -277,17 +498,21 @@ class TestDataset:
         # First row of results contains all sensor URIs
         sensor_uris = [str(uri) for uri in results[0]]
 
-        # Find corresponding column name
+        # Find corresponding column name: exact URI lookup first, then
+        # fall back to URIs containing (or contained in) the sensor URI
         columns_to_extract = []
         column_mapping = {}
 
         for sensor_uri in sensor_uris:
-            # Find from sensor column mapping
-            for uri, col_name in sensor_columns.items():
-                if sensor_uri in uri or uri in sensor_uri:
-                    columns_to_extract.append(col_name)
-                    column_mapping[col_name] = sensor_uri
-                    break
+            col_name = sensor_columns.get(sensor_uri)
+            if col_name is None:
+                for uri, candidate in sensor_columns.items():
+                    if sensor_uri in uri or uri in sensor_uri:
+                        col_name = candidate
+                        break
+            if col_name is not None:
+                columns_to_extract.append(col_name)
+                column_mapping[col_name] = sensor_uri
 
         if not columns_to_extract:
             return None
@@ -312,12 +537,14 @@ class TestDataset:
             List of randomly sampled buildings
         """
         buildings = self.list_buildings(system_type)
+        if not buildings:
+            return []
 
-        if random_seed is not None:
-            random.seed(random_seed)
-
+        # Local generator: no global RNG state is touched
+        rng = np.random.default_rng(random_seed)
         n = min(n, len(buildings))
-        return random.sample(buildings, n)
+        idx = rng.choice(len(buildings), size=n, replace=False)
+        return [buildings[i] for i in idx]
 
     def sample_buildings_per_system(
         self, n_per_system: int = 2, random_seed: Optional[int] = None
@@ -332,8 +559,7 @@ class TestDataset:
         Returns:
             Dict with system type as key and building list as value
         """
-        if random_seed is not None:
-            random.seed(random_seed)
+        rng = np.random.default_rng(random_seed)
 
         all_buildings = self.list_buildings()
 
@@ -349,7 +575,8 @@ class TestDataset:
         sampled = {}
         for system_type, buildings in by_system.items():
             n = min(n_per_system, len(buildings))
-            sampled[system_type] = random.sample(buildings, n)
+            idx = rng.choice(len(buildings), size=n, replace=False)
+            sampled[system_type] = [buildings[i] for i in idx]
 
         return sampled
 
@@ -363,17 +590,34 @@ class TestDataset:
         Returns:
             List of qualified buildings
         """
-        # Build SPARQL query
-        sensor_types_str = " ".join([f"brick:{st}" for st in sensor_types])
-
-        query = f"""
-        SELECT ?sensor WHERE {{
-            ?sensor rdf:type/rdfs:subClassOf* ?sensor_type .
-            VALUES ?sensor_type {{ {sensor_types_str} }}
-        }}
-        """
+        # Expand each sensor type to its subclass closure once (from the Brick
+        # ontology), then probe each building with plain rdf:type lookups
+        target_types = set()
+        for sensor_type in sensor_types:
+            target_types |= _subclass_closure(sensor_type)
+
+        qualified_buildings = []
+
+        for building in self.list_buildings():
+            try:
+                g = self.load_brick_model(building["id"])
+                if not g:
+                    continue
+
+                # Subclass axioms asserted in the model itself also count
+                types = set(target_types)
+                for sensor_type in sensor_types:
+                    types.update(g.transitive_subjects(RDFS.subClassOf, BRICK[sensor_type]))
 
-        return self.filter_buildings_by_query(query)
+                sensors = [s for t in types for s in g.subjects(RDF.type, t)]
+                if sensors:
+                    building["query_results"] = [(s,) for s in dict.fromkeys(sensors)]
+                    qualified_buildings.append(building)
+            except Exception as e:
+                print(f"Querying building {building['id']} error occurred: {e}")
+                continue
+
+        return qualified_buildings
 
 
 # Global singleton
@@ -11,12 +11,26 @@ Calculate validation baseline data from source CSV files:
 Author: Mingchen Li
 """
 
+import numpy as np
 import pandas as pd
 import logging
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+# Attempt to import pyarrow (optional, needed for Parquet output)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    _PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _PYARROW_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Number of buildings processed (and written) per chunk
+CHUNK_SIZE = 10_000
+
 
 class GroundTruthCalculator:
     """
@@ -31,7 +45,11 @@ class GroundTruthCalculator:
         self.logger = logging.getLogger(__name__)
 
     def calculate(
-        self, metadata_csv: str, vars_csv: str, output_csv: str = "ground_truth.csv"
+        self,
+        metadata_csv: str,
+        vars_csv: str,
+        output_csv: str = "ground_truth.csv",
+        chunk_size: int = CHUNK_SIZE,
     ) -> pd.DataFrame:
         """
         Calculate ground truth data for all buildings.
@@ -39,7 +57,9 @@ class GroundTruthCalculator:
         Args:
             metadata_csv: Path to metadata.csv file
             vars_csv: Path to vars_available_by_building.csv file
-            output_csv: Output path for ground_truth.csv (default: "ground_truth.csv")
+            output_csv: Output path for ground_truth.csv (default: "ground_truth.csv").
+                        A path ending in ".parquet" writes Parquet instead (requires pyarrow)
+            chunk_size: Number of buildings computed and written per chunk (default: 10000)
 
         Returns:
             DataFrame with columns: tag, system, point_count, boiler_count,
@@ -47,151 +67,178 @@ class GroundTruthCalculator:
         """
         self.logger.info("Starting ground truth calculation...")
 
-        # Load data
-        metadata_df = pd.read_csv(metadata_csv)
-        vars_df = pd.read_csv(vars_csv)
+        # Load data (the two files are independent, read them concurrently)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            metadata_future = executor.submit(pd.read_csv, metadata_csv)
+            vars_future = executor.submit(pd.read_csv, vars_csv)
+            metadata_df = metadata_future.result()
+            vars_df = vars_future.result()
 
         self.logger.info(f"Loaded {len(metadata_df)} metadata records")
         self.logger.info(f"Loaded {len(vars_df)} vars records")
 
+        # Coerce value columns to numbers once (non-numeric -> NaN), so the
+        # calculators below are plain comparisons with NaN counting as "not > 0"
+        self._coerce_numeric(metadata_df, ["b_number", "oper"])
+        self._coerce_numeric(vars_df, [c for c in vars_df.columns if c not in ("tag", "datetime")])
+
         # Merge data
         merged_df = pd.merge(metadata_df, vars_df, on="tag", how="inner")
         self.logger.info(f"Merged {len(merged_df)} records")
 
-        # Calculate ground truth for each building
-        ground_truth_data = []
-
-        for idx, row in merged_df.iterrows():
-            tag = str(int(row["tag"]))
-            system = str(row["system"]).strip()
-
-            # 1. Calculate point count
-            point_count = self._calculate_point_count(row, vars_df)
+        datetime_idx = vars_df.columns.get_loc("datetime")
+        point_columns = list(vars_df.columns[datetime_idx + 1 :])
+        write_parquet = str(output_csv).lower().endswith(".parquet")
+        if write_parquet and not _PYARROW_AVAILABLE:
+            raise ImportError("Parquet output requires pyarrow. Install with: pip install pyarrow")
+
+        # Compute and write in row chunks to bound intermediate memory on wide vars tables
+        chunk_size = max(1, int(chunk_size))
+        chunks = []
+        writer = None
+        try:
+            for start in range(0, max(len(merged_df), 1), chunk_size):
+                chunk_df = self._compute_chunk(
+                    merged_df.iloc[start : start + chunk_size], point_columns
+                )
+                chunks.append(chunk_df)
+
+                # Save to file (Parquet if requested by extension, CSV otherwise)
+                if write_parquet:
+                    table = pa.Table.from_pandas(chunk_df, preserve_index=False)
+                    if writer is None:
+                        writer = pq.ParquetWriter(output_csv, table.schema, compression="zstd")
+                    writer.write_table(table)
+                else:
+                    first = start == 0
+                    chunk_df.to_csv(
+                        output_csv, mode="w" if first else "a", header=first, index=False
+                    )
+        finally:
+            if writer is not None:
+                writer.close()
+
+        ground_truth_df = pd.concat(chunks, ignore_index=True)
+        self.logger.info(f"Ground truth saved to: {output_csv}")
+        self.logger.info(f"Total buildings: {len(ground_truth_df)}")
 
-            # 2. Calculate boiler count
-            boiler_count = self._calculate_boiler_count(row, system)
+        return ground_truth_df
 
-            # 3. Calculate pump count
-            pump_count = self._calculate_pump_count(row, system)
+    def _compute_chunk(self, merged_df: pd.DataFrame, point_columns: List[str]) -> pd.DataFrame:
+        """
+        Calculate ground truth rows for a slice of the merged metadata/vars data.
 
-            # 4. Calculate weather station count
-            weather_station_count = self._calculate_weather_station_count(row)
+        Args:
+            merged_df: Rows of the merged metadata/vars DataFrame
+            point_columns: Vars columns counted as points
 
-            ground_truth_data.append(
-                {
-                    "tag": tag,
-                    "system": system,
-                    "point_count": point_count,
-                    "boiler_count": boiler_count,
-                    "pump_count": pump_count,
-                    "weather_station_count": weather_station_count,
-                }
-            )
+        Returns:
+            DataFrame with columns: tag, system, point_count, boiler_count,
+                                   pump_count, weather_station_count
+        """
+        # Column-wise, no per-row loop. Only a handful of system types exist,
+        # so classify each one once
+        system = merged_df["system"].astype(str).str.strip().astype("category")
+        system_flags = self._get_system_flags(system)
+
+        return pd.DataFrame(
+            {
+                "tag": merged_df["tag"].astype(int).astype(str),
+                "system": system.astype(str),
+                "point_count": self._calculate_point_counts(merged_df, point_columns),
+                "boiler_count": self._calculate_boiler_counts(merged_df, system_flags),
+                "pump_count": self._calculate_pump_counts(merged_df, system_flags),
+                "weather_station_count": self._calculate_weather_station_counts(merged_df),
+            }
+        )
 
-        # Create DataFrame
-        ground_truth_df = pd.DataFrame(ground_truth_data)
+    def _coerce_numeric(self, df: pd.DataFrame, columns: List[str]) -> None:
+        """Convert the given columns (those present) of df to numeric dtypes in place."""
+        columns = [c for c in columns if c in df.columns]
+        if columns:
+            df[columns] = df[columns].apply(pd.to_numeric, errors="coerce")
 
-        # Save to file
-        ground_truth_df.to_csv(output_csv, index=False)
-        self.logger.info(f"Ground truth saved to: {output_csv}")
-        self.logger.info(f"Total buildings: {len(ground_truth_df)}")
+    def _calculate_point_counts(
+        self, merged_df: pd.DataFrame, point_columns: List[str]
+    ) -> pd.Series:
+        """
+        Calculate point counts from vars_available_by_building.csv for all buildings.
+        Counts values > 0 in the point columns (those after the 'datetime' column;
+        empty, NA/NULL and non-numeric values are ignored).
+        """
+        # Count positive values per row (NaN compares as False)
+        return merged_df[point_columns].gt(0).sum(axis=1).astype(int)
 
-        return ground_truth_df
+    def _max_positive_index(self, merged_df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+        """
+        For each building, return the 1-based position of the last column in `columns`
+        with a value > 0 (0 if none). Missing columns are treated as empty.
+        """
+        values = merged_df.reindex(columns=columns).to_numpy(dtype=float)
+        positions = np.arange(1, len(columns) + 1)
+        return np.where(values > 0, positions, 0).max(axis=1, initial=0)
 
-    def _calculate_point_count(self, row: pd.Series, vars_df: pd.DataFrame) -> int:
+    def _get_system_flags(self, system: pd.Series) -> pd.DataFrame:
         """
-        Calculate point count from vars_available_by_building.csv.
-        Counts non-empty values after the 'datetime' column.
+        Classify each system type category once and broadcast the flags to all buildings.
+
+        Returns:
+            DataFrame with boolean columns: is_district, has_boiler_system
         """
-        # Get column index for datetime
-        datetime_idx = vars_df.columns.get_loc("datetime")
-        point_columns = vars_df.columns[datetime_idx + 1 :]
-
-        # Count non-empty values with value > 0
-        point_count = 0
-        for col in point_columns:
-            val = row[col]
-            if pd.notna(val) and val != "" and str(val).strip().upper() not in ["NA", "NULL", ""]:
-                try:
-                    if float(val) > 0:
-                        point_count += 1
-                except (ValueError, TypeError):
-                    pass
-
-        return point_count
-
-    def _calculate_boiler_count(self, row: pd.Series, system: str) -> int:
+        categories = system.cat.categories.astype(str).str.lower()
+        is_district = np.asarray(categories.str.contains("district", regex=False), dtype=bool)
+        # Any boiler-based system (Boiler, Condensing, Non-condensing)
+        has_boiler_system = np.asarray(
+            categories.str.contains("boiler|condensing|non-condensing"), dtype=bool
+        )
+
+        codes = system.cat.codes.to_numpy()
+        return pd.DataFrame(
+            {"is_district": is_district[codes], "has_boiler_system": has_boiler_system[codes]},
+            index=system.index,
+        )
+
+    def _calculate_boiler_counts(
+        self, merged_df: pd.DataFrame, system_flags: pd.DataFrame
+    ) -> pd.Series:
         """
-        Calculate boiler count based on system type and metadata.
+        Calculate boiler counts based on system type and metadata.
         District systems have 0 boilers, others use b_number and fire/sup/ret columns.
         For 'Boiler' system type, at least 1 boiler is guaranteed.
         """
-        # Check if district system
-        if "district" in system.lower():
-            return 0
-
-        # For boiler systems, use b_number and fire/sup/ret columns
-        boiler_count = 0
-        b_number = row["b_number"]
+        is_district = system_flags["is_district"]
+        has_boiler_system = system_flags["has_boiler_system"]
+
+        # b_number from metadata (NA/invalid -> 0)
+        b_number = merged_df["b_number"].fillna(0).to_numpy(dtype=float)
+        b_number = np.maximum(np.trunc(b_number), 0)
+
+        # Take maximum of b_number and highest positive fire/sup/ret column (1-4)
+        boiler_count = pd.Series(
+            np.maximum.reduce(
+                [
+                    b_number,
+                    self._max_positive_index(merged_df, [f"fire{i}" for i in range(1, 5)]),
+                    self._max_positive_index(merged_df, [f"sup{i}" for i in range(1, 5)]),
+                    self._max_positive_index(merged_df, [f"ret{i}" for i in range(1, 5)]),
+                ]
+            ),
+            index=merged_df.index,
+        )
 
-        try:
-            if pd.notna(b_number) and str(b_number).strip().upper() not in ["NA", "NULL", ""]:
-                boiler_count = int(float(b_number))
-        except (ValueError, TypeError):
-            boiler_count = 0
-
-        # Check fire columns (fire1, fire2, fire3, fire4)
-        fire_count = 0
-        for i in range(1, 5):
-            col_name = f"fire{i}"
-            if col_name in row.index and pd.notna(row[col_name]):
-                try:
-                    if float(row[col_name]) > 0:
-                        fire_count = max(fire_count, i)
-                except (ValueError, TypeError):
-                    pass
-
-        # Check sup columns (sup1, sup2, sup3, sup4)
-        sup_count = 0
-        for i in range(1, 5):
-            col_name = f"sup{i}"
-            if col_name in row.index and pd.notna(row[col_name]):
-                try:
-                    if float(row[col_name]) > 0:
-                        sup_count = max(sup_count, i)
-                except (ValueError, TypeError):
-                    pass
-
-        # Check ret columns (ret1, ret2, ret3, ret4)
-        ret_count = 0
-        for i in range(1, 5):
-            col_name = f"ret{i}"
-            if col_name in row.index and pd.notna(row[col_name]):
-                try:
-                    if float(row[col_name]) > 0:
-                        ret_count = max(ret_count, i)
-                except (ValueError, TypeError):
-                    pass
-
-        # Take maximum
-        boiler_count = max(boiler_count, fire_count, sup_count, ret_count)
-
-        # For any boiler-based system (Boiler, Condensing, Non-condensing),
-        # ensure at least 1 boiler if count is still 0
         # These systems must have at least one boiler by definition
-        system_lower = system.lower()
-        has_boiler_system = any(
-            keyword in system_lower for keyword in ["boiler", "condensing", "non-condensing"]
-        )
+        boiler_count = boiler_count.mask(has_boiler_system & (boiler_count == 0), 1)
 
-        if has_boiler_system and boiler_count == 0:
-            boiler_count = 1
+        # District systems have no boilers
+        boiler_count = boiler_count.mask(is_district, 0)
 
-        return boiler_count
+        return boiler_count.astype(int)
 
-    def _calculate_pump_count(self, row: pd.Series, system: str) -> int:
+    def _calculate_pump_counts(
+        self, merged_df: pd.DataFrame, system_flags: pd.DataFrame
+    ) -> pd.Series:
         """
-        Calculate pump count based on system type and detected pumps.
+        Calculate pump counts based on system type and detected pumps.
 
         Logic:
         - District system: 1 loop, default 1 pump. If detected, use detected count.
@@ -199,60 +246,32 @@ class GroundTruthCalculator:
           If detected N pumps, means one loop has N pumps, other has 1 pump.
           Total = N + 1
         """
-        # First detect pump count from vars
-        vars_pump_count = 0
-
-        # Check pmpN_spd and pmpN_vfd
-        for i in range(1, 5):
-            spd_col = f"pmp{i}_spd"
-            vfd_col = f"pmp{i}_vfd"
-
-            has_spd = spd_col in row.index and pd.notna(row[spd_col])
-            has_vfd = vfd_col in row.index and pd.notna(row[vfd_col])
-
-            if has_spd or has_vfd:
-                try:
-                    if has_spd and float(row[spd_col]) > 0:
-                        vars_pump_count = max(vars_pump_count, i)
-                    if has_vfd and float(row[vfd_col]) > 0:
-                        vars_pump_count = max(vars_pump_count, i)
-                except (ValueError, TypeError):
-                    pass
-
-        # Check pmp_spd (single pump speed)
-        if "pmp_spd" in row.index and pd.notna(row["pmp_spd"]):
-            try:
-                if float(row["pmp_spd"]) > 0:
-                    vars_pump_count = max(vars_pump_count, 1)
-            except (ValueError, TypeError):
-                pass
-
-        # Determine final pump count based on system type
-        if "district" in system.lower():
-            # District system: 1 loop, use detected count or default 1
-            pump_count = max(1, vars_pump_count)
-        else:
-            # Boiler system: 2 loops
-            if vars_pump_count > 0:
-                # One loop has vars_pump_count pumps, other loop has 1 pump
-                pump_count = vars_pump_count + 1
-            else:
-                # Default: 2 loops with 1 pump each
-                pump_count = 2
-
-        return pump_count
-
-    def _calculate_weather_station_count(self, row: pd.Series) -> int:
+        # First detect pump count from vars (pmpN_spd, pmpN_vfd and single pmp_spd)
+        vars_pump_count = np.maximum.reduce(
+            [
+                self._max_positive_index(merged_df, [f"pmp{i}_spd" for i in range(1, 5)]),
+                self._max_positive_index(merged_df, [f"pmp{i}_vfd" for i in range(1, 5)]),
+                self._max_positive_index(merged_df, ["pmp_spd"]),
+            ]
+        )
+
+        # District system: 1 loop, use detected count or default 1
+        # Boiler system: 2 loops, detected count + 1, or default 2
+        pump_count = np.where(
+            system_flags["is_district"],
+            np.maximum(1, vars_pump_count),
+            np.where(vars_pump_count > 0, vars_pump_count + 1, 2),
+        )
+
+        return pd.Series(pump_count, index=merged_df.index).astype(int)
+
+    def _calculate_weather_station_counts(self, merged_df: pd.DataFrame) -> pd.Series:
         """
-        Calculate weather station count from oper column.
+        Calculate weather station counts from oper column.
         """
-        if "oper" in row.index and pd.notna(row["oper"]):
-            try:
-                if float(row["oper"]) > 0:
-                    return 1
-            except (ValueError, TypeError):
-                pass
-        return 0
+        if "oper" not in merged_df.columns:
+            return pd.Series(0, index=merged_df.index)
+        return merged_df["oper"].gt(0).astype(int)
 
     def get_statistics(self, ground_truth_df: pd.DataFrame) -> Dict:
         """
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Validation results cache
+SQLite cache of per-file validation results, shared by the batch methods of
+BrickModelValidator and SubgraphPatternValidator
+"""
+
+import os
+import json
+import hashlib
+import logging
+import sqlite3
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def open_results_cache(cache_path: str) -> sqlite3.Connection:
+    """Open (and create if needed) the SQLite results cache"""
+    cache_dir = os.path.dirname(os.path.abspath(cache_path))
+    os.makedirs(cache_dir, exist_ok=True)
+    conn = sqlite3.connect(cache_path)
+    conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, result TEXT NOT NULL)")
+    # Content digest of each TTL file as of its last (mtime, size), see _file_digest
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, "
+        "size INTEGER NOT NULL, digest TEXT NOT NULL)"
+    )
+    return conn
+
+
+def _file_digest(cache: sqlite3.Connection, path: str) -> Optional[str]:
+    """Content digest of a TTL file (None if it cannot be read)
+
+    The file is only read and hashed when its mtime or size differ from the ones recorded
+    with its last digest, so unchanged files cost a stat call and a lookup.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    row = cache.execute(
+        "SELECT mtime_ns, size, digest FROM files WHERE path = ?", (path,)
+    ).fetchone()
+    if row is not None and row[:2] == (stat.st_mtime_ns, stat.st_size):
+        return row[2]
+
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as f:
+            h.update(f.read())
+    except OSError:
+        return None
+    digest = h.hexdigest()
+    cache.execute(
+        "INSERT OR REPLACE INTO files (path, mtime_ns, size, digest) VALUES (?, ?, ?, ?)",
+        (path, stat.st_mtime_ns, stat.st_size, digest),
+    )
+    return digest
+
+
+def results_cache_key(
+    cache: sqlite3.Connection, ttl_file_path: str, fingerprint: str
+) -> Optional[str]:
+    """Cache key over the file path, the file content and the validator fingerprint
+    (None if the file cannot be read)"""
+    path = os.path.abspath(ttl_file_path)
+    digest = _file_digest(cache, path)
+    if digest is None:
+        return None
+    h = hashlib.blake2b(digest_size=16)
+    h.update(fingerprint.encode("utf-8"))
+    h.update(b"\0" + path.encode("utf-8") + b"\0" + digest.encode("ascii"))
+    return h.hexdigest()
+
+
+def _no_error(result: Dict) -> bool:
+    return "error" not in result
+
+
+def iter_with_results_cache(
+    cache_path: Optional[str],
+    ttl_files: List[str],
+    fingerprint: str,
+    run: Callable[[List[str]], Iterable[Dict]],
+    cacheable: Callable[[Dict], bool] = _no_error,
+):
+    """Yield the validation results of ttl_files in order
+
+    Without a cache_path this is run(ttl_files). Otherwise the results of files whose
+    content has not changed since they were cached (with the same fingerprint) are read
+    from the cache; a file is only read again to check its content when its mtime or size
+    changed. Only the other files are passed to run, and their results are written to the
+    cache if cacheable(result) holds; by default, results that report an error are
+    validated again on the next run.
+
+    Args:
+        cache_path: Optional SQLite results cache, e.g. ".validation_cache/results.db"
+        ttl_files: Paths of the TTL files to validate
+        fingerprint: Identifies the validator version and configuration behind a result
+        run: Function that validates a list of files and returns their results in order
+        cacheable: Whether a fresh result may be stored in the cache
+
+    Yields:
+        Dict with validation results, one per file in ttl_files
+    """
+    if not cache_path:
+        yield from run(ttl_files)
+        return
+
+    cache = open_results_cache(cache_path)
+    try:
+        keys = [results_cache_key(cache, path, fingerprint) for path in ttl_files]
+        cached = []
+        for key in keys:
+            row = None
+            if key is not None:
+                row = cache.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+            cached.append(json.loads(row[0]) if row is not None else None)
+
+        fresh = [path for path, result in zip(ttl_files, cached) if result is None]
+        logger.info(
+            f"{len(ttl_files) - len(fresh)} results loaded from cache, "
+            f"{len(fresh)} files to validate"
+        )
+        fresh_results = iter(run(fresh)) if fresh else iter(())
+
+        for key, result in zip(keys, cached):
+            if result is None:
+                result = next(fresh_results)
+                if key is not None and cacheable(result):
+                    cache.execute(
+                        "INSERT OR REPLACE INTO results (key, result) VALUES (?, ?)",
+                        (key, json.dumps(result, default=str)),
+                    )
+            yield result
+    finally:
+        cache.commit()
+        cache.close()
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Subgraph Pattern Validator for Brick Models
-Validates Hot Water System patterns using SPARQL queries
+Validates Hot Water System patterns by matching them directly against the graph
 
 Updated to match new pattern diagrams:
 - Pattern 1: Boiler System with Dual Loops (Primary + Secondary)
@@ -9,14 +9,65 @@ Updated to match new pattern diagrams:
 """
 
 import os
+import json
+import time
 import logging
-from typing import Dict
+from typing import Any, Dict, List, NamedTuple, Optional
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+from rdflib import OWL, RDF, RDFS, BNode, Literal, Namespace, URIRef
 from tqdm import tqdm
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 import multiprocessing
 
+from .result_cache import iter_with_results_cache
+
 logger = logging.getLogger(__name__)
 
+BRICK = Namespace("https://brickschema.org/schema/Brick#")
+REC = Namespace("https://w3id.org/rec#")
+
+# Terms used by the pattern matchers, created once instead of per Namespace lookup
+_BUILDING = REC.Building
+_IS_LOCATION_OF = REC.isLocationOf
+_HOT_WATER_SYSTEM = BRICK.Hot_Water_System
+_HOT_WATER_LOOP = BRICK.Hot_Water_Loop
+_PUMP = BRICK.Pump
+_WEATHER_STATION = BRICK.Weather_Station
+_HAS_PART = BRICK.hasPart
+_FEEDS = BRICK.feeds
+
+# Relationships followed by the pattern matchers (inverse/sub-properties are inferred)
+_MATCHED_PROPERTIES = (_IS_LOCATION_OF, _HAS_PART, _FEEDS)
+
+
+class _Pattern1Match(NamedTuple):
+    """One Pattern 1 (Boiler System) match: a primary loop feeding a secondary loop
+
+    The boilers and pumps of the match are grouped rather than expanded into one
+    binding per boiler x pump combination.
+    """
+
+    building: Any
+    hws: Any
+    primary_loop: Any
+    secondary_loop: Any
+    boiler_pumps: List  # (boiler, boiler_class, prim_pump) triples
+    sec_pumps: List
+    weather_station: Optional[Any]
+
+
+class _Pattern2Match(NamedTuple):
+    """One Pattern 2 (District System) match: a secondary loop and its pumps"""
+
+    building: Any
+    hws: Any
+    secondary_loop: Any
+    pumps: List
+    weather_station: Optional[Any]
+
+
 # Attempt to import brickschema
 try:
     from brickschema import Graph
@@ -26,9 +77,161 @@ except ImportError:  # pragma: no cover
     _BRICKSCHEMA_AVAILABLE = False
     Graph = None
 
+# Optional: pyoxigraph's native Turtle parser (much faster than rdflib's pure-Python one)
+try:
+    import pyoxigraph
+
+    _PYOXIGRAPH_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _PYOXIGRAPH_AVAILABLE = False
+
+_XSD_STRING = "http://www.w3.org/2001/XMLSchema#string"
+
+# Bump whenever the pattern matching logic or result format changes, so cached
+# batch results from an older version are not reused
+RESULTS_CACHE_VERSION = 1
+
+# Brick ontology graph, loaded lazily once per process (only used for class hierarchy lookups)
+_BRICK_TEMPLATE = None
+
+
+def _get_brick_graph():
+    """Return the per-process Brick ontology graph (loaded on first use)"""
+    global _BRICK_TEMPLATE
+    if _BRICK_TEMPLATE is None:
+        _BRICK_TEMPLATE = Graph(load_brick=True)
+    return _BRICK_TEMPLATE
+
+
+def _from_oxigraph(term):
+    """Convert a pyoxigraph term into the rdflib term rdflib's own parser would produce"""
+    if isinstance(term, pyoxigraph.NamedNode):
+        return URIRef(term.value)
+    if isinstance(term, pyoxigraph.BlankNode):
+        return BNode(term.value)
+    if term.language:
+        return Literal(term.value, lang=term.language)
+    # rdflib leaves plain literals untyped instead of xsd:string
+    datatype = term.datatype.value
+    return Literal(term.value, datatype=None if datatype == _XSD_STRING else URIRef(datatype))
+
+
+def _parse_turtle(g, ttl_file_path: str):
+    """Parse a Turtle file into g, using pyoxigraph's native parser when it is installed
+
+    Both parsers raise SyntaxError for malformed Turtle and OSError for I/O errors.
+    """
+    if not _PYOXIGRAPH_AVAILABLE:
+        g.parse(ttl_file_path, format="turtle")
+        return
+
+    terms = {}
+
+    def convert(term):
+        # IRIs repeat across many triples, so convert each distinct term once per file
+        converted = terms.get(term)
+        if converted is None:
+            converted = terms[term] = _from_oxigraph(term)
+        return converted
+
+    g.addN(
+        (convert(quad.subject), convert(quad.predicate), convert(quad.object), g)
+        for quad in pyoxigraph.parse(
+            path=ttl_file_path,
+            format=pyoxigraph.RdfFormat.TURTLE,
+            # Resolve relative IRIs against the file location, as rdflib does
+            base_iri=Path(ttl_file_path).absolute().as_uri(),
+        )
+    )
+
+
+def _get_superclasses(cls: URIRef) -> frozenset:
+    """Return cls and all its (transitive) superclasses in the Brick ontology"""
+    return frozenset(_get_brick_graph().transitive_objects(cls, RDFS.subClassOf))
+
+
+@lru_cache(maxsize=None)
+def _get_property_sources(prop: URIRef) -> tuple:
+    """Return (property, inverted) pairs whose triples imply prop triples in the Brick ontology
+
+    These are the sub-properties of prop and, inverted, the sub-properties of its
+    owl:inverseOf counterparts (e.g. brick:isPartOf for brick:hasPart). Only called
+    for the few _MATCHED_PROPERTIES, so the cache stays small.
+    """
+    brick = _get_brick_graph()
+    inverses = set(brick.objects(prop, OWL.inverseOf)) | set(brick.subjects(OWL.inverseOf, prop))
+
+    sources = {(p, False) for p in brick.transitive_subjects(RDFS.subPropertyOf, prop)}
+    for inverse in inverses:
+        sources.update((p, True) for p in brick.transitive_subjects(RDFS.subPropertyOf, inverse))
+    sources.discard((prop, False))
+    return tuple(sources)
+
+
+def _add_inferred_triples(g) -> None:
+    """Materialize the inferences the pattern matchers rely on
+
+    - rdf:type for every superclass of each asserted class (RDFS subclass rule), over
+      the Brick ontology plus any rdfs:subClassOf the model declares itself
+    - _MATCHED_PROPERTIES triples implied by inverse or sub-properties, e.g.
+      ``loop brick:hasPart pump`` from ``pump brick:isPartOf loop``
+
+    This replaces a full g.expand(profile="brick") run over the building graph plus the
+    whole ontology.
+    """
+    declared = {}
+    for subclass, superclass in g.subject_objects(RDFS.subClassOf):
+        declared.setdefault(subclass, set()).add(superclass)
+
+    superclasses = {}
+
+    def superclasses_of(cls):
+        result = superclasses.get(cls)
+        if result is None:
+            if not declared:
+                result = _get_superclasses(cls)
+            else:
+                # Fixpoint over ontology and model-declared subclass relations
+                result = set()
+                pending = [cls]
+                while pending:
+                    current = pending.pop()
+                    if current in result:
+                        continue
+                    result.add(current)
+                    pending.extend(_get_superclasses(current))
+                    pending.extend(declared.get(current, ()))
+            superclasses[cls] = result
+        return result
+
+    inferred = [
+        (s, RDF.type, sup)
+        for s, cls in g.subject_objects(RDF.type)
+        if isinstance(cls, URIRef)
+        for sup in superclasses_of(cls)
+        if sup != cls
+    ]
+    for prop in _MATCHED_PROPERTIES:
+        for source, inverted in _get_property_sources(prop):
+            inferred.extend(
+                (o, prop, s) if inverted else (s, prop, o) for s, o in g.subject_objects(source)
+            )
+
+    for triple in inferred:
+        g.add(triple)
+
+
+def _get_boiler_classes() -> List:
+    """Return brick:Boiler and all its (transitive) subclasses from the Brick ontology"""
+    return sorted(_get_brick_graph().transitive_subjects(RDFS.subClassOf, BRICK.Boiler))
+
 
 class SubgraphPatternValidator:
-    """Validator for matching subgraph patterns in Brick models using SPARQL queries
+    """Validator for matching subgraph patterns in Brick models
+
+    Patterns are matched with direct triple lookups (g.objects / g.subjects) on the
+    parsed building graph, which is much cheaper than running them through rdflib's
+    SPARQL engine.
 
     Pattern 1 (Boiler System - Dual Loop):
         - Building rec:isLocationOf Hot_Water_System (required)
@@ -63,6 +266,9 @@ class SubgraphPatternValidator:
                 "brickschema is not available. Please install with: pip install brickschema"
             )
 
+        # Resolve rdfs:subClassOf* brick:Boiler once instead of per building
+        self._boiler_classes = frozenset(_get_boiler_classes())
+
     def _parse_ttl_file(self, ttl_file_path: str, max_retries: int = 2):
         """Helper method to parse TTL file with retry logic
 
@@ -73,50 +279,29 @@ class SubgraphPatternValidator:
         Returns:
             Tuple of (Graph object, error message or None)
         """
-        import time
-
         for attempt in range(max_retries):
+            # No ontology in the building graph: class hierarchy inferences are
+            # materialized from the cached Brick ontology by _add_inferred_triples
+            g = Graph()
+
             try:
-                # Load Brick ontology to enable class hierarchy reasoning
-                g = Graph(load_brick=True)
-
-                try:
-                    g.parse(ttl_file_path, format="turtle")
-                    # Expand graph to include rdfs:subClassOf inferences
-                    try:
-                        g.expand(profile="brick")
-                    except Exception:
-                        # If expand fails, continue without it (basic validation still works)
-                        logger.debug(
-                            f"Graph expansion failed for {ttl_file_path}, continuing with basic graph"
-                        )
-                    return g, None
-                except Exception as parse_error:
-                    logger.warning(f"Standard parsing failed for {ttl_file_path}: {parse_error}")
-                    try:
-                        with open(ttl_file_path, "r", encoding="utf-8") as f:
-                            content = f.read()
-                        g.parse(data=content, format="turtle")
-                        try:
-                            g.expand(profile="brick")
-                        except Exception:
-                            logger.debug("Graph expansion failed, continuing with basic graph")
-                        return g, None
-                    except Exception as alt_error:
-                        if attempt < max_retries - 1:
-                            logger.warning(
-                                f"Retry attempt {attempt + 1}/{max_retries} for {ttl_file_path}"
-                            )
-                            time.sleep(0.05 * (attempt + 1))
-                            continue
-                        return None, f"Parsing failed: {alt_error}"
-
-            except Exception as e:
+                _parse_turtle(g, ttl_file_path)
+            except (SyntaxError, ValueError) as parse_error:
+                # Malformed Turtle (rdflib BadSyntax or pyoxigraph SyntaxError) or
+                # undecodable content: a retry would fail the same way
+                logger.warning(f"Parsing failed for {ttl_file_path}: {parse_error}")
+                return None, f"Parsing failed: {parse_error}"
+            except OSError as e:
+                # I/O errors may be transient (e.g. network filesystems), so retry
                 if attempt < max_retries - 1:
+                    logger.warning(f"Retry attempt {attempt + 1}/{max_retries} for {ttl_file_path}")
                     time.sleep(0.05 * (attempt + 1))
                     continue
                 return None, f"Error: {e}"
 
+            _add_inferred_triples(g)
+            return g, None
+
         return None, "All retry attempts failed"
 
     def check_pattern_1_boiler_system(self, ttl_file_path: str) -> Dict:
@@ -140,131 +325,125 @@ class SubgraphPatternValidator:
         """
         g, error = self._parse_ttl_file(ttl_file_path)
         if g is None:
-            return {
-                "pattern": "Pattern 1 - Boiler System",
-                "matched": False,
-                "error": error,
-                "details": {},
-            }
+            return self._parse_error_result("Pattern 1 - Boiler System", error)
 
-        sparql_query = """
-        PREFIX brick: <https://brickschema.org/schema/Brick#>
-        PREFIX rec:   <https://w3id.org/rec#>
-        PREFIX rdf:   <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-        PREFIX rdfs:  <http://www.w3.org/2000/01/rdf-schema#>
-
-        SELECT ?building ?hws ?primary_loop ?secondary_loop ?boiler ?boiler_class ?prim_pump ?sec_pump ?weather_station
-        WHERE {
-          # Required: Building
-          ?building rdf:type rec:Building .
-
-          # Required: Building has Hot_Water_System
-          ?building rec:isLocationOf ?hws .
-          ?hws rdf:type brick:Hot_Water_System .
-
-          # Required: Hot_Water_System has Primary_Loop
-          ?hws brick:hasPart ?primary_loop .
-          ?primary_loop rdf:type brick:Hot_Water_Loop .
-
-          # Required: Hot_Water_System has Secondary_Loop
-          ?hws brick:hasPart ?secondary_loop .
-          ?secondary_loop rdf:type brick:Hot_Water_Loop .
-
-          # Required: Primary_Loop feeds Secondary_Loop
-          ?primary_loop brick:feeds ?secondary_loop .
-
-          # Required: Primary_Loop has Boiler (using subClassOf reasoning)
-          ?primary_loop brick:hasPart ?boiler .
-          ?boiler rdf:type ?boiler_class .
-          ?boiler_class rdfs:subClassOf* brick:Boiler .
-
-          # Required: Primary_Loop has Pump
-          ?primary_loop brick:hasPart ?prim_pump .
-          ?prim_pump rdf:type brick:Pump .
-
-          # Required: Boiler feeds Pump
-          ?boiler brick:feeds ?prim_pump .
-
-          # Required: Secondary_Loop has Pump
-          ?secondary_loop brick:hasPart ?sec_pump .
-          ?sec_pump rdf:type brick:Pump .
-
-          # Optional: Weather_Station
-          OPTIONAL {
-            ?building rec:isLocationOf ?weather_station .
-            ?weather_station rdf:type brick:Weather_Station .
-          }
-        }
+        return self._query_pattern_1(g)
+
+    def _query_pattern_1(self, g, systems: List = None) -> Dict:
+        """Match Pattern 1 (Boiler System) against an already parsed graph
+
+        Args:
+            g: Parsed Brick graph
+            systems: Optional precomputed _find_hot_water_systems(g) skeleton
         """
+        return self._run_pattern(
+            g,
+            lambda g: self._match_pattern_1(g, systems),
+            "Pattern 1 - Boiler System",
+            self._extract_pattern_1_details,
+        )
 
-        try:
-            results = list(g.query(sparql_query))
-            matched = len(results) > 0
-
-            details = {
-                "has_building": False,
-                "has_hot_water_system": False,
-                "has_primary_loop": False,
-                "has_secondary_loop": False,
-                "has_boiler": False,
-                "has_primary_pump": False,
-                "has_secondary_pump": False,
-                "has_boiler_feeds_pump": False,
-                "has_primary_feeds_secondary": False,
-                "has_weather_station": False,
-                "boiler_count": 0,
-                "primary_pump_count": 0,
-                "secondary_pump_count": 0,
-            }
+    def _match_pattern_1(self, g, systems: List = None):
+        """Yield one _Pattern1Match per Pattern 1 match (weather_station None if absent)"""
+        if systems is None:
+            systems = self._find_hot_water_systems(g)
+
+        for building, weather_station, hws, hws_parts in systems:
+            loops = [loop for loop in hws_parts if (loop, RDF.type, _HOT_WATER_LOOP) in g]
+
+            for primary_loop in loops:
+                # Boiler (any Boiler class) -> Pump feeds inside the primary loop
+                parts = set(g.objects(primary_loop, _HAS_PART))
+                boiler_pumps = [
+                    (boiler, boiler_class, pump)
+                    for boiler in parts
+                    for boiler_class in g.objects(boiler, RDF.type)
+                    if boiler_class in self._boiler_classes
+                    for pump in g.objects(boiler, _FEEDS)
+                    if pump in parts and (pump, RDF.type, _PUMP) in g
+                ]
+                if not boiler_pumps:
+                    continue
 
-            if matched:
-                # Extract details from first result
-                row = results[0]
-                details["has_building"] = row["building"] is not None
-                details["has_hot_water_system"] = row["hws"] is not None
-                details["has_primary_loop"] = row["primary_loop"] is not None
-                details["has_secondary_loop"] = row["secondary_loop"] is not None
-                details["has_boiler"] = row["boiler"] is not None
-                details["has_primary_pump"] = row["prim_pump"] is not None
-                details["has_secondary_pump"] = row["sec_pump"] is not None
-                details["has_weather_station"] = row["weather_station"] is not None
-                details["has_boiler_feeds_pump"] = True  # Query enforces this
-                details["has_primary_feeds_secondary"] = True  # Query enforces this
-
-                # Count unique entities and collect types
-                boilers = set()
-                boiler_types = set()
-                prim_pumps = set()
-                sec_pumps = set()
-                for row in results:
-                    if row["boiler"]:
-                        boilers.add(str(row["boiler"]))
-                    if row.get("boiler_class"):
-                        # Extract just the class name from URI
-                        boiler_class_uri = str(row["boiler_class"])
-                        if "#" in boiler_class_uri:
-                            boiler_class_name = boiler_class_uri.split("#")[-1]
-                            boiler_types.add(boiler_class_name)
-                    if row["prim_pump"]:
-                        prim_pumps.add(str(row["prim_pump"]))
-                    if row["sec_pump"]:
-                        sec_pumps.add(str(row["sec_pump"]))
-
-                details["boiler_count"] = len(boilers)
-                details["primary_pump_count"] = len(prim_pumps)
-                details["secondary_pump_count"] = len(sec_pumps)
-                details["boiler_types"] = sorted(list(boiler_types))
-
-            return {"pattern": "Pattern 1 - Boiler System", "matched": matched, "details": details}
+                for secondary_loop in loops:
+                    if (primary_loop, _FEEDS, secondary_loop) not in g:
+                        continue
+
+                    sec_pumps = [
+                        pump
+                        for pump in g.objects(secondary_loop, _HAS_PART)
+                        if (pump, RDF.type, _PUMP) in g
+                    ]
+                    if sec_pumps:
+                        yield _Pattern1Match(
+                            building,
+                            hws,
+                            primary_loop,
+                            secondary_loop,
+                            boiler_pumps,
+                            sec_pumps,
+                            weather_station,
+                        )
 
-        except Exception as e:
-            logger.error(f"Error checking Pattern 1: {e}")
-            return {
-                "pattern": "Pattern 1 - Boiler System",
-                "matched": False,
-                "error": str(e),
-                "details": {},
-            }
+    def _extract_pattern_1_details(self, first, matches) -> Dict:
+        """Build the Pattern 1 details dict from the pattern matches
+
+        Args:
+            first: First match, or None if the pattern did not match
+            matches: Iterator over all matches (including first), consumed once
+        """
+        details = {
+            "has_building": False,
+            "has_hot_water_system": False,
+            "has_primary_loop": False,
+            "has_secondary_loop": False,
+            "has_boiler": False,
+            "has_primary_pump": False,
+            "has_secondary_pump": False,
+            "has_boiler_feeds_pump": False,
+            "has_primary_feeds_secondary": False,
+            "has_weather_station": False,
+            "boiler_count": 0,
+            "primary_pump_count": 0,
+            "secondary_pump_count": 0,
+        }
+
+        if first is not None:
+            # Extract details from first result
+            row = first
+            details["has_building"] = row.building is not None
+            details["has_hot_water_system"] = row.hws is not None
+            details["has_primary_loop"] = row.primary_loop is not None
+            details["has_secondary_loop"] = row.secondary_loop is not None
+            details["has_boiler"] = bool(row.boiler_pumps)
+            details["has_primary_pump"] = bool(row.boiler_pumps)
+            details["has_secondary_pump"] = bool(row.sec_pumps)
+            details["has_weather_station"] = row.weather_station is not None
+            details["has_boiler_feeds_pump"] = True  # Matcher enforces this
+            details["has_primary_feeds_secondary"] = True  # Matcher enforces this
+
+            # Count unique entities and collect types
+            boilers = set()
+            boiler_types = set()
+            prim_pumps = set()
+            sec_pumps = set()
+            for row in matches:
+                for boiler, boiler_class, prim_pump in row.boiler_pumps:
+                    boilers.add(str(boiler))
+                    # Extract just the class name from URI
+                    boiler_class_uri = str(boiler_class)
+                    if "#" in boiler_class_uri:
+                        boiler_class_name = boiler_class_uri.split("#")[-1]
+                        boiler_types.add(boiler_class_name)
+                    prim_pumps.add(str(prim_pump))
+                sec_pumps.update(str(pump) for pump in row.sec_pumps)
+
+            details["boiler_count"] = len(boilers)
+            details["primary_pump_count"] = len(prim_pumps)
+            details["secondary_pump_count"] = len(sec_pumps)
+            details["boiler_types"] = sorted(list(boiler_types))
+
+        return details
 
     def check_pattern_2_district_system(self, ttl_file_path: str) -> Dict:
         """Check if TTL file matches Pattern 2 (District System - Single Loop)
@@ -284,104 +463,150 @@ class SubgraphPatternValidator:
         """
         g, error = self._parse_ttl_file(ttl_file_path)
         if g is None:
-            return {
-                "pattern": "Pattern 2 - District System",
-                "matched": False,
-                "error": error,
-                "details": {},
-            }
+            return self._parse_error_result("Pattern 2 - District System", error)
 
-        sparql_query = """
-        PREFIX brick: <https://brickschema.org/schema/Brick#>
-        PREFIX rec:   <https://w3id.org/rec#>
-        PREFIX rdf:   <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-        PREFIX rdfs:  <http://www.w3.org/2000/01/rdf-schema#>
-
-        SELECT ?building ?hws ?secondary_loop ?pump ?weather_station
-        WHERE {
-          # Required: Building
-          ?building rdf:type rec:Building .
-
-          # Required: Building has Hot_Water_System
-          ?building rec:isLocationOf ?hws .
-          ?hws rdf:type brick:Hot_Water_System .
-
-          # Required: Hot_Water_System has Hot_Water_Loop (Secondary)
-          ?hws brick:hasPart ?secondary_loop .
-          ?secondary_loop rdf:type brick:Hot_Water_Loop .
-
-          # Required: Secondary_Loop has Pump
-          ?secondary_loop brick:hasPart ?pump .
-          ?pump rdf:type brick:Pump .
-
-          # Check NO boiler exists (key for district system)
-          FILTER NOT EXISTS {
-            ?hws brick:hasPart ?loop .
-            ?loop brick:hasPart ?boiler .
-            ?boiler rdf:type ?boiler_class .
-            ?boiler_class rdfs:subClassOf* brick:Boiler .
-          }
-
-          # Check NO Primary Loop exists (only Secondary)
-          FILTER NOT EXISTS {
-            ?hws brick:hasPart ?prim_loop .
-            ?prim_loop brick:feeds ?secondary_loop .
-          }
-
-          # Optional: Weather_Station
-          OPTIONAL {
-            ?building rec:isLocationOf ?weather_station .
-            ?weather_station rdf:type brick:Weather_Station .
-          }
-        }
+        return self._query_pattern_2(g)
+
+    def _query_pattern_2(self, g, systems: List = None) -> Dict:
+        """Match Pattern 2 (District System) against an already parsed graph
+
+        Args:
+            g: Parsed Brick graph
+            systems: Optional precomputed _find_hot_water_systems(g) skeleton
         """
+        return self._run_pattern(
+            g,
+            lambda g: self._match_pattern_2(g, systems),
+            "Pattern 2 - District System",
+            self._extract_pattern_2_details,
+        )
 
-        try:
-            results = list(g.query(sparql_query))
-            matched = len(results) > 0
-
-            details = {
-                "has_building": False,
-                "has_hot_water_system": False,
-                "has_secondary_loop": False,
-                "has_pump": False,
-                "has_boiler": False,  # Should be False for district system
-                "has_primary_loop": False,  # Should be False for district system
-                "has_weather_station": False,
-                "pump_count": 0,
-            }
+    def _match_pattern_2(self, g, systems: List = None):
+        """Yield one _Pattern2Match per Pattern 2 match (weather_station None if absent)"""
+        if systems is None:
+            systems = self._find_hot_water_systems(g)
+
+        for building, weather_station, hws, hws_parts in systems:
+            # NO boiler in any part of the system (district heating from central plant)
+            has_boiler = any(
+                boiler_class in self._boiler_classes
+                for loop in hws_parts
+                for boiler in g.objects(loop, _HAS_PART)
+                for boiler_class in g.objects(boiler, RDF.type)
+            )
+            if has_boiler:
+                continue
+
+            for secondary_loop in hws_parts:
+                if (secondary_loop, RDF.type, _HOT_WATER_LOOP) not in g:
+                    continue
+
+                # NO primary loop feeding this loop (only Secondary)
+                if any((prim_loop, _FEEDS, secondary_loop) in g for prim_loop in hws_parts):
+                    continue
+
+                pumps = [
+                    pump
+                    for pump in g.objects(secondary_loop, _HAS_PART)
+                    if (pump, RDF.type, _PUMP) in g
+                ]
+                if pumps:
+                    yield _Pattern2Match(building, hws, secondary_loop, pumps, weather_station)
+
+    def _find_hot_water_systems(self, g) -> List:
+        """Collect the Building -> Hot_Water_System skeleton shared by both patterns
+
+        Returns:
+            List of (building, weather_station, hws, hws_parts) tuples, one per
+            Hot_Water_System located in a Building; weather_station may be None
+        """
+        systems = []
+        for building in g.subjects(RDF.type, _BUILDING):
+            weather_station = self._find_weather_station(g, building)
+
+            for hws in g.objects(building, _IS_LOCATION_OF):
+                if (hws, RDF.type, _HOT_WATER_SYSTEM) in g:
+                    systems.append(
+                        (building, weather_station, hws, list(g.objects(hws, _HAS_PART)))
+                    )
+        return systems
+
+    def _find_weather_station(self, g, building):
+        """Return a Weather_Station located in the building, or None"""
+        for candidate in g.objects(building, _IS_LOCATION_OF):
+            if (candidate, RDF.type, _WEATHER_STATION) in g:
+                return candidate
+        return None
+
+    def _extract_pattern_2_details(self, first, matches) -> Dict:
+        """Build the Pattern 2 details dict from the pattern matches
+
+        Args:
+            first: First match, or None if the pattern did not match
+            matches: Iterator over all matches (including first), consumed once
+        """
+        details = {
+            "has_building": False,
+            "has_hot_water_system": False,
+            "has_secondary_loop": False,
+            "has_pump": False,
+            "has_boiler": False,  # Should be False for district system
+            "has_primary_loop": False,  # Should be False for district system
+            "has_weather_station": False,
+            "pump_count": 0,
+        }
+
+        if first is not None:
+            # Extract details from first result
+            row = first
+            details["has_building"] = row.building is not None
+            details["has_hot_water_system"] = row.hws is not None
+            details["has_secondary_loop"] = row.secondary_loop is not None
+            details["has_pump"] = bool(row.pumps)
+            details["has_weather_station"] = row.weather_station is not None
+
+            # Count unique pumps
+            pumps = set()
+            for row in matches:
+                pumps.update(str(pump) for pump in row.pumps)
+
+            details["pump_count"] = len(pumps)
 
-            if matched:
-                # Extract details from first result
-                row = results[0]
-                details["has_building"] = row["building"] is not None
-                details["has_hot_water_system"] = row["hws"] is not None
-                details["has_secondary_loop"] = row["secondary_loop"] is not None
-                details["has_pump"] = row["pump"] is not None
-                details["has_weather_station"] = row["weather_station"] is not None
+        return details
 
-                # Count unique pumps
-                pumps = set()
-                for row in results:
-                    if row["pump"]:
-                        pumps.add(str(row["pump"]))
+    def _run_pattern(self, g, matcher, pattern_name: str, extractor) -> Dict:
+        """Match a pattern on a parsed graph and build its result dict
 
-                details["pump_count"] = len(pumps)
+        Args:
+            g: Parsed Brick graph (with superclass types materialized)
+            matcher: Callable yielding one match tuple per pattern match
+            pattern_name: Display name of the pattern, e.g. "Pattern 1 - Boiler System"
+            extractor: Callable turning the matches into the pattern details dict
+
+        Returns:
+            Dict with match results and details
+        """
+        try:
+            # Consume the matches lazily: the first match decides "matched", and the
+            # extractor accumulates its unique sets while the rest are generated
+            matches = iter(matcher(g))
+            first = next(matches, None)
+            if first is None:
+                return {"pattern": pattern_name, "matched": False, "details": extractor(None, ())}
 
             return {
-                "pattern": "Pattern 2 - District System",
-                "matched": matched,
-                "details": details,
+                "pattern": pattern_name,
+                "matched": True,
+                "details": extractor(first, chain([first], matches)),
             }
 
         except Exception as e:
-            logger.error(f"Error checking Pattern 2: {e}")
-            return {
-                "pattern": "Pattern 2 - District System",
-                "matched": False,
-                "error": str(e),
-                "details": {},
-            }
+            logger.error(f"Error checking {pattern_name}: {e}")
+            return {"pattern": pattern_name, "matched": False, "error": str(e), "details": {}}
+
+    def _parse_error_result(self, pattern_name: str, error: str) -> Dict:
+        """Result dict for a pattern that could not be checked because parsing failed"""
+        return {"pattern": pattern_name, "matched": False, "error": error, "details": {}}
 
     def validate_building(self, ttl_file_path: str) -> Dict:
         """Validate a single building TTL file against both patterns
@@ -418,12 +643,32 @@ class SubgraphPatternValidator:
             "patterns": {},
         }
 
-        # Check Pattern 1: Boiler System (all boiler types)
-        pattern_1 = self.check_pattern_1_boiler_system(ttl_file_path)
-        results["patterns"]["pattern_1_boiler"] = pattern_1
+        # Parse the TTL file once, shared by both pattern checks
+        g, error = self._parse_ttl_file(ttl_file_path)
+        if g is None:
+            pattern_1 = self._parse_error_result("Pattern 1 - Boiler System", error)
+            pattern_2 = self._parse_error_result("Pattern 2 - District System", error)
+        else:
+            # Walk the shared Building -> Hot_Water_System skeleton once for both patterns
+            systems = self._find_hot_water_systems(g)
+            # Check Pattern 1: Boiler System (all boiler types)
+            pattern_1 = self._query_pattern_1(g, systems)
+            # Check Pattern 2: District System. Its "no boiler in the system" rule rejects
+            # any Hot_Water_System Pattern 1 matched, so with a single system a Pattern 1
+            # match means Pattern 2 cannot match and the check is skipped
+            if pattern_1["matched"] and len({system[2] for system in systems}) == 1:
+                pattern_2 = {
+                    "pattern": "Pattern 2 - District System",
+                    "matched": False,
+                    "details": self._extract_pattern_2_details(None, ()),
+                    "skipped": True,
+                }
+            else:
+                pattern_2 = self._query_pattern_2(g, systems)
+            # Release the graph before building the result
+            del g
 
-        # Check Pattern 2: District System
-        pattern_2 = self.check_pattern_2_district_system(ttl_file_path)
+        results["patterns"]["pattern_1_boiler"] = pattern_1
         results["patterns"]["pattern_2_district"] = pattern_2
 
         # Determine which pattern this building matches
@@ -451,12 +696,32 @@ class SubgraphPatternValidator:
 
         return results
 
-    def batch_validate_all_buildings(self, ttl_directory: str, max_workers: int = None) -> Dict:
+    def _results_cache_fingerprint(self) -> str:
+        """Identify the validator configuration that produced a cached result"""
+        return f"{RESULTS_CACHE_VERSION}|" + "|".join(sorted(self._boiler_classes))
+
+    def batch_validate_all_buildings(
+        self,
+        ttl_directory: str,
+        max_workers: int = None,
+        results_jsonl: str = None,
+        cache_path: str = None,
+    ) -> Dict:
         """Validate all building TTL files in a directory with parallel processing
 
+        Statistics and the pattern distribution are aggregated while results stream in.
+        If results_jsonl is given, each per-building result is written to that file as
+        one JSON line instead of being kept in memory, and "results" is left empty.
+
+        If cache_path is given, results are cached in an SQLite database keyed on the
+        file path, the file content hash and the validator version, so unchanged files
+        are not parsed again on the next run (see result_cache.iter_with_results_cache).
+
         Args:
             ttl_directory: Directory containing TTL files
             max_workers: Number of parallel workers (default: CPU count - 1)
+            results_jsonl: Optional path of a JSONL file to stream per-building results to
+            cache_path: Optional SQLite results cache, e.g. ".validation_cache/results.db"
 
         Returns:
             Dict with comprehensive validation results and accuracy statistics
@@ -468,8 +733,8 @@ class SubgraphPatternValidator:
                 "results": [],
             }
 
-        # Find all TTL files
-        ttl_files = [f for f in os.listdir(ttl_directory) if f.endswith(".ttl")]
+        # Find all TTL files (full paths, collected in a single directory scan)
+        ttl_files = list(_iter_ttl_files(ttl_directory))
 
         logger.info(f"Found {len(ttl_files)} TTL files to validate")
 
@@ -481,6 +746,8 @@ class SubgraphPatternValidator:
         print(f"⚙️  Using {max_workers} parallel workers for faster processing")
 
         all_results = []
+        pattern_distribution = {}
+        processed_count = 0
         pattern_stats = {
             "pattern_1_any_boiler": {"matched": 0, "total": 0},
             "pattern_1_condensing": {"matched": 0, "total": 0},
@@ -495,23 +762,44 @@ class SubgraphPatternValidator:
         condensing_count = 0
         non_condensing_count = 0
 
+        results_file = open(results_jsonl, "w", encoding="utf-8") if results_jsonl else None
+
         # Validate each file with parallel processing and progress bar
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_file = {
-                executor.submit(
-                    validate_building_worker, os.path.join(ttl_directory, filename)
-                ): filename
-                for filename in ttl_files
-            }
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+                # Cached results are looked up in the parent process; only cache misses go
+                # to the workers, in batches so the per-task pickling/queue overhead is paid
+                # once per chunk rather than once per file
+                for result in tqdm(
+                    iter_with_results_cache(
+                        cache_path,
+                        ttl_files,
+                        self._results_cache_fingerprint(),
+                        lambda files: executor.map(
+                            validate_building_worker,
+                            files,
+                            chunksize=max(1, len(files) // (max_workers * 4)),
+                        ),
+                        cacheable=_is_cacheable,
+                    ),
+                    total=len(ttl_files),
+                    desc="Validating buildings",
+                ):
+                    processed_count += 1
+                    if "error" in result:
+                        # tqdm.write keeps the progress bar as the only terminal writer
+                        filename = result.get("filename") or os.path.basename(
+                            result.get("ttl_file_path", "")
+                        )
+                        tqdm.write(f"Error validating {filename}: {result['error']}")
+                    if results_file is not None:
+                        results_file.write(json.dumps(result, default=str) + "\n")
+                    else:
+                        all_results.append(result)
 
-            # Collect results with progress bar
-            for future in tqdm(
-                as_completed(future_to_file), total=len(ttl_files), desc="Validating buildings"
-            ):
-                try:
-                    result = future.result()
-                    all_results.append(result)
+                    # Count buildings by primary pattern
+                    primary = result.get("primary_pattern", "Unknown")
+                    pattern_distribution[primary] = pattern_distribution.get(primary, 0) + 1
 
                     # Track and display progress
                     if "patterns" in result:
@@ -533,15 +821,13 @@ class SubgraphPatternValidator:
                             pattern_1_count += 1
                         if "Pattern 2" in primary:
                             pattern_2_count += 1
-
-                except Exception as e:
-                    filename = future_to_file[future]
-                    logger.error(f"Error validating {filename}: {e}")
-                    all_results.append({"filename": filename, "error": str(e)})
+        finally:
+            if results_file is not None:
+                results_file.close()
 
         # Print progress summary after parallel processing
         print(f"\n✅ Validation Complete!")
-        print(f"   Processed: {len(all_results)} buildings")
+        print(f"   Processed: {processed_count} buildings")
         print(
             f"   🔥 Boiler Systems Found: {condensing_count + non_condensing_count + pattern_1_count}"
         )
@@ -591,32 +877,55 @@ class SubgraphPatternValidator:
 
         summary_lines.extend(["-" * 80, "", "Building Pattern Distribution:", "-" * 80])
 
-        # Count buildings by primary pattern
-        pattern_distribution = {}
-        for result in all_results:
-            primary = result.get("primary_pattern", "Unknown")
-            pattern_distribution[primary] = pattern_distribution.get(primary, 0) + 1
-
         for pattern, count in sorted(pattern_distribution.items()):
             percentage = (count / len(ttl_files)) * 100 if ttl_files else 0
             summary_lines.append(f"  {pattern}: {count} ({percentage:.1f}%)")
 
         summary_lines.append("=" * 80)
 
-        return {
+        batch_result = {
             "total_files": len(ttl_files),
             "results": all_results,
             "accuracies": accuracies,
             "pattern_distribution": pattern_distribution,
             "summary": "\n".join(summary_lines),
         }
+        if results_jsonl:
+            batch_result["results_jsonl"] = results_jsonl
+        return batch_result
+
+
+def _iter_ttl_files(ttl_directory: str):
+    """Yield the paths of the TTL files in a directory, using os.scandir's cached file types"""
+    with os.scandir(ttl_directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(".ttl") and entry.is_file():
+                yield entry.path
+
+
+def _is_cacheable(result: Dict) -> bool:
+    """Only cache complete results; errors (e.g. transient I/O failures) are retried next run"""
+    if "error" in result:
+        return False
+    return not any("error" in pattern for pattern in result.get("patterns", {}).values())
+
+
+# Per-process validator, created once by the pool initializer and reused across tasks
+_WORKER_VALIDATOR = None
+
+
+def _init_worker():
+    """Process pool initializer: build the validator (Brick ontology, boiler closure) once"""
+    global _WORKER_VALIDATOR
+    _WORKER_VALIDATOR = SubgraphPatternValidator()
 
 
 # Worker function for parallel processing (must be at module level for multiprocessing)
 def validate_building_worker(ttl_file_path: str) -> Dict:
     """Worker function to validate a single building (for parallel processing)
 
-    This function must be at module level to work with multiprocessing.
+    This function must be at module level to work with multiprocessing. Errors are
+    returned as a result dict so that one bad file does not abort an executor.map batch.
 
     Args:
         ttl_file_path: Path to TTL file
@@ -624,5 +933,10 @@ def validate_building_worker(ttl_file_path: str) -> Dict:
     Returns:
         Dict with validation results
     """
-    validator = SubgraphPatternValidator()
-    return validator.validate_building(ttl_file_path)
+    if _WORKER_VALIDATOR is None:
+        _init_worker()
+    try:
+        return _WORKER_VALIDATOR.validate_building(ttl_file_path)
+    except Exception as e:
+        # Reported by the parent through tqdm.write, so workers never write mid-bar
+        return {"filename": os.path.basename(ttl_file_path), "error": str(e)}
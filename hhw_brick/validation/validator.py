@@ -5,13 +5,22 @@ For validating the ontology integrity of generated TTL files using brickschema
 """
 
 import os
+import re
+import sys
+import json
 import logging
 import csv
 import multiprocessing
 import warnings
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
+from functools import lru_cache, partial
+from itertools import chain, islice, repeat
 from tqdm import tqdm
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from rdflib import OWL, RDF, RDFS, Namespace
+from rdflib import Graph as RDFLibGraph
+
+from .result_cache import iter_with_results_cache
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +33,363 @@ except ImportError:  # pragma: no cover
     _BRICKSCHEMA_AVAILABLE = False
     Graph = None  # Define Graph in except block
 
+# Building tag in TTL file names like "building_105.ttl" or "building_105_non-condensing_h.ttl"
+_TAG_RE = re.compile(r"^building_(\d+)")
+
+# Parsed Brick ontology graphs, keyed by (use_local_brick, local_brick_path). Parsing
+# Brick_Self.ttl is far more expensive than the building TTLs, so it is done once per
+# process and reused (see also _VALIDATION_GRAPH_CACHE).
+_BRICK_GRAPH_CACHE = {}
+
+BRICK = Namespace("https://brickschema.org/schema/Brick#")
+REF = Namespace("https://brickschema.org/schema/Brick/ref#")
+
+# Terms used when counting points and equipment
+_BRICK_POINT = BRICK.Point
+_BRICK_BOILER = BRICK.Boiler
+_BRICK_PUMP = BRICK.Pump
+_BRICK_WEATHER_STATION = BRICK.Weather_Station
+_REF_HAS_EXTERNAL_REFERENCE = REF.hasExternalReference
+_REF_TIMESERIES_REFERENCE = REF.TimeseriesReference
+_REF_HAS_TIMESERIES_ID = REF.hasTimeseriesId
+_REF_STORED_AT = REF.storedAt
+_COUNTED_CLASSES = (_BRICK_POINT, _BRICK_BOILER, _BRICK_PUMP, _BRICK_WEATHER_STATION)
+
+# Each counted class and all of its subclasses, per cached Brick ontology (same keys as
+# _BRICK_GRAPH_CACHE); computed once when the ontology is loaded
+_BRICK_CLASS_CLOSURES = {}
+
+# Brick ontology plus the QUDT vocabularies used for ontology validation, one graph per
+# process (same keys as _BRICK_GRAPH_CACHE). It is only read: each validation works on a
+# copy of it together with the file's triples.
+_VALIDATION_GRAPH_CACHE = {}
+
+
+def _file_key(path: Optional[str]) -> Optional[Tuple[str, int]]:
+    """Cache key for a data file: (absolute path, mtime in ns), or None if it does not exist"""
+    if not path:
+        return None
+    try:
+        return os.path.abspath(path), os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+# The CSV readers below are memoized per process on (path, mtime), so validators and
+# pool workers that share the same ground truth / metadata files read each of them once
+# and pick up changes when a file is rewritten. The caches are bounded so that results
+# for superseded versions of a file are dropped. The returned dicts are shared between
+# callers and must not be modified.
+_CSV_CACHE_SIZE = 4
+
+
+@lru_cache(maxsize=_CSV_CACHE_SIZE)
+def _read_ground_truth(path: str, mtime_ns: int) -> Dict[str, Dict]:
+    """Read ground_truth.csv (or .parquet) into a dict keyed by building tag"""
+    import pandas as pd
+
+    if str(path).lower().endswith(".parquet"):
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path)
+
+    count_columns = ["point_count", "boiler_count", "pump_count", "weather_station_count"]
+    df = df[["tag", *count_columns, "system"]].astype({column: int for column in count_columns})
+    df["system"] = df["system"].astype(str)
+    # Convert tags to string, ensuring they are integers first; a later row for the
+    # same tag replaces an earlier one
+    df["tag"] = df["tag"].astype(int).astype(str)
+    df = df.drop_duplicates("tag", keep="last")
+    return df.set_index("tag").to_dict(orient="index")
+
+
+@lru_cache(maxsize=_CSV_CACHE_SIZE)
+def _read_metadata(path: str, mtime_ns: int) -> Dict[str, Dict]:
+    """Read metadata.csv into a dict of b_number (boiler count) and system by building tag"""
+    metadata = {}
+    with open(path, "r") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            tag = row.get("tag", "").strip()
+            if not tag:
+                continue
+
+            # Extract b_number (boiler number)
+            b_number_str = row.get("b_number", "").strip()
+            b_number = None
+            if b_number_str and b_number_str != "NA":
+                try:
+                    b_number = int(float(b_number_str))
+                except ValueError:
+                    logger.warning(f"Invalid b_number for tag {tag}: {b_number_str}")
+
+            metadata[tag] = {"b_number": b_number, "system": row.get("system", "").strip()}
+    return metadata
+
+
+# Values marking a variable as available in vars_available_by_building.csv
+_AVAILABLE_VALUES = ["1", "1.0"]
+
+
+def _read_vars_csv(path: str):
+    """Read the variables CSV as strings, with surrounding whitespace stripped from tags"""
+    import pandas as pd
+
+    df = pd.read_csv(path, dtype=str, na_filter=False)
+    if "tag" not in df.columns:
+        return df.iloc[0:0]
+    df["tag"] = df["tag"].str.strip()
+    return df[df["tag"] != ""]
+
+
+def _available(df, columns: List[str]):
+    """Boolean array of shape (len(columns), rows): whether each row marks a column available
+
+    Columns missing from the CSV are treated as not available.
+    """
+    import numpy as np
+
+    present = [column for column in columns if column in df.columns]
+    flags = np.zeros((len(columns), len(df)), dtype=bool)
+    if present:
+        values = df[present].apply(lambda column: column.str.strip()).isin(_AVAILABLE_VALUES)
+        rows = [columns.index(column) for column in present]
+        flags[rows] = values.to_numpy().T
+    return flags
+
+
+def _join_metadata(df, metadata: Dict[str, Dict]):
+    """Left-join the system type and b_number from metadata onto the variables rows
+
+    Returns:
+        (system, b_number): system type strings ('' if unknown) and boiler numbers as an int
+        array (0 if unknown), aligned with the rows of df
+    """
+    import pandas as pd
+
+    meta_df = pd.DataFrame.from_dict(metadata, orient="index", columns=["system", "b_number"])
+    meta_df = meta_df.rename_axis("tag").reset_index().astype({"tag": str})
+    merged = df[["tag"]].merge(meta_df, on="tag", how="left")
+    system = merged["system"].fillna("").astype(str)
+    b_number = pd.to_numeric(merged["b_number"]).fillna(0).astype(int).to_numpy()
+    return system, b_number
+
+
+@lru_cache(maxsize=_CSV_CACHE_SIZE)
+def _read_pump_counts(
+    key: Tuple[str, int], metadata_key: Optional[Tuple[str, int]]
+) -> Dict[str, Dict]:
+    """Derive pump counts per building from vars_available_by_building.csv
+
+    New logic:
+    1. Each loop needs at least 1 pump (structural requirement)
+    2. Variables indicate pump count for ONE of the loops
+    3. Total pump count = (num_loops - 1) + variable_pump_count
+    4. District systems: 1 loop (secondary only)
+    5. Boiler/Condensing systems: 2 loops (primary + secondary)
+
+    Args:
+        key: _file_key of the variables CSV
+        metadata_key: _file_key of metadata.csv (None if unavailable)
+
+    Returns:
+        Dict mapping building tags to pump information
+    """
+    import numpy as np
+
+    metadata = _read_metadata(*metadata_key) if metadata_key else {}
+    df = _read_vars_csv(key[0])
+    tags = df["tag"].tolist()
+
+    # Determine number of loops based on system type
+    # District systems only have secondary loop, Boiler/Condensing systems have primary + secondary
+    system, _ = _join_metadata(df, metadata)
+    is_district = system.str.contains("District", regex=False).to_numpy()
+    num_loops = np.where(is_district, 1, 2)
+
+    # Determine pump count from variables
+    pump_columns = ["pmp_spd", "pmp1_spd", "pmp2_spd", "pmp1_vfd", "pmp2_vfd"]
+    has = dict(zip(pump_columns, _available(df, pump_columns)))
+
+    # Count individual pumps from numbered speed signals; only count pmp_spd if no numbered spd
+    spd_count = has["pmp1_spd"].astype(int) + has["pmp2_spd"].astype(int)
+    spd_count[(spd_count == 0) & has["pmp_spd"]] = 1
+
+    # Count individual pumps from VFD signals
+    vfd_count = has["pmp1_vfd"].astype(int) + has["pmp2_vfd"].astype(int)
+
+    # Variable pump count (for one loop) is the maximum of spd_count and vfd_count
+    variable_pump_count = np.maximum(spd_count, vfd_count)
+
+    # NEW LOGIC: Pump variables represent secondary loop pumps
+    # District systems: Only 1 loop (secondary), pump_count = variable_pump_count or 1
+    # Boiler systems: 2 loops (primary + secondary)
+    #   - Primary loop: always 1 pump (structural, no sensor points)
+    #   - Secondary loop: variable_pump_count or 1
+    #   - Total = 1 (primary) + variable_pump_count (secondary)
+    secondary_pump_count = np.maximum(variable_pump_count, 1)
+    pump_count = (num_loops - 1) + secondary_pump_count
+
+    # Check for potential error: all pump variables present
+    has_all = np.logical_and.reduce(list(has.values()))
+
+    columns = {
+        "pump_count": pump_count,
+        "num_loops": num_loops,
+        "variable_pump_count": variable_pump_count,
+        "has_potential_error": has_all,
+        **has,
+        "spd_count": spd_count,
+        "vfd_count": vfd_count,
+    }
+    values = [column.tolist() for column in columns.values()]
+    return {tag: dict(zip(columns, row)) for tag, row in zip(tags, zip(*values))}
+
+
+@lru_cache(maxsize=_CSV_CACHE_SIZE)
+def _read_boiler_counts(
+    key: Tuple[str, int], metadata_key: Optional[Tuple[str, int]]
+) -> Dict[str, Dict]:
+    """Derive boiler counts per building from vars_available_by_building.csv and metadata.csv
+
+    Logic:
+    1. District systems (District HW/Steam): 0 boilers (regardless of metadata)
+    2. Boiler systems: max(variable_inferred_count, b_number from metadata)
+
+    Args:
+        key: _file_key of the variables CSV
+        metadata_key: _file_key of metadata.csv (None if unavailable)
+
+    Returns:
+        Dict mapping building tags to boiler information
+    """
+    import numpy as np
+
+    metadata = _read_metadata(*metadata_key) if metadata_key else {}
+    df = _read_vars_csv(key[0])
+    tags = df["tag"].tolist()
+
+    # Get system type and b_number from metadata
+    system, b_number = _join_metadata(df, metadata)
+    system_type = system.tolist()
+    is_district = system.str.contains("District", regex=False).to_numpy()
+
+    # Infer from variables: boiler i has a sensor if any of sup{i}, ret{i}, fire{i} is
+    # available; the highest such i is the variable-inferred count
+    numbered_columns = [f"{sensor}{i}" for sensor in ("sup", "ret", "fire") for i in range(1, 10)]
+    numbered = _available(df, numbered_columns).reshape(3, 9, -1).any(axis=0)
+    max_boiler_from_vars = (numbered * np.arange(1, 10)[:, None]).max(axis=0, initial=0)
+
+    # Check for unnumbered boiler sensors
+    has_unnumbered = _available(df, ["sup", "ret", "fire", "supp", "retp"]).any(axis=0)
+    max_boiler_from_vars[(max_boiler_from_vars == 0) & has_unnumbered] = 1
+
+    # District systems always have 0 boilers; boiler systems take the maximum of the
+    # variable-inferred count and b_number
+    boiler_count = np.where(is_district, 0, np.maximum(max_boiler_from_vars, b_number))
+
+    return {
+        tag: {
+            "boiler_count": count,
+            "b_number": b,
+            "system_type": system,
+            "is_district": district,
+        }
+        for tag, count, b, system, district in zip(
+            tags, boiler_count.tolist(), b_number.tolist(), system_type, is_district.tolist()
+        )
+    }
+
+
+def _preload_csvs(
+    ground_truth_csv_path: Optional[str] = None, metadata_csv_path: Optional[str] = None
+):
+    """Pool initializer: fill the per-process CSV caches once when a worker starts"""
+    try:
+        key = _file_key(ground_truth_csv_path)
+        if key is not None:
+            _read_ground_truth(*key)
+        metadata_key = _file_key(metadata_csv_path)
+        if metadata_key is not None:
+            _read_metadata(*metadata_key)
+    except Exception as e:
+        # The validator reports loading errors itself when the data is first used
+        logger.debug(f"Could not preload CSV data: {e}")
+
+
+def _list_ttl_files(directory: str) -> List[str]:
+    """Paths of the .ttl files directly inside a directory"""
+    with os.scandir(directory) as entries:
+        return [entry.path for entry in entries if entry.name.endswith(".ttl") and entry.is_file()]
+
+
+def _pool_context():
+    """multiprocessing context for the validation pools: fork on Linux, so workers inherit
+    the ontology graphs already loaded in the parent (None = platform default)"""
+    if sys.platform.startswith("linux"):
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def _map_chunksize(num_items: int, max_workers: int) -> int:
+    """Chunk size for executor.map: about four chunks per worker"""
+    return max(1, num_items // (max_workers * 4))
+
+
+def _iter_chunks(items, size: int):
+    """Lists of up to ``size`` items from any iterable, consumed lazily"""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+# Result rows formatted and written per chunk by the print_batch_* reports
+_REPORT_CHUNK_SIZE = 500
+
+# Separator lines of the print_* reports
+_SEP = "=" * 80
+_SUB40 = "-" * 40
+_SUB50 = "-" * 50
+_SUB70 = "-" * 70
+
+
+# QUDT vocabularies added to the Brick ontology for ontology validation: (name, URL)
+_QUDT_SOURCES = (
+    ("schema", "http://qudt.org/schema/qudt/"),
+    ("quantity kinds", "http://qudt.org/vocab/quantitykind"),
+    ("units", "http://qudt.org/vocab/unit"),
+)
+
+
+def _fetch_rdf(url: str) -> RDFLibGraph:
+    """Download and parse an RDF document into a graph of its own"""
+    g = RDFLibGraph()
+    g.parse(url)
+    return g
+
+
+# Version of the validation results kept in a results cache (see
+# BrickModelValidator._iter_with_result_cache); increase it whenever the validation logic
+# or the result format changes, so results cached by older versions are not reused
+_RESULT_CACHE_VERSION = 1
+
+
+# Validator of a validation pool worker, created once by the pool initializer
+# (_init_ontology_worker or _init_count_worker)
+_WORKER_VALIDATOR = None
+
+
+def _init_ontology_worker(use_local_brick: bool = True):
+    """Pool initializer: create the worker's validator and parse the Brick ontology once"""
+    global _WORKER_VALIDATOR
+    try:
+        _WORKER_VALIDATOR = BrickModelValidator(use_local_brick=use_local_brick)
+        _WORKER_VALIDATOR._load_brick_ontology()
+    except Exception as e:
+        # Leave it to _validate_ontology_worker, which reports the error per file
+        logger.debug(f"Could not initialize ontology worker: {e}")
+        _WORKER_VALIDATOR = None
+
 
 def _validate_ontology_worker(ttl_file_path: str, use_local_brick: bool = True) -> Dict:
     """
@@ -37,8 +403,10 @@ def _validate_ontology_worker(ttl_file_path: str, use_local_brick: bool = True)
         Dict with validation results
     """
     try:
-        # Create a temporary validator instance for this worker
-        validator = BrickModelValidator(use_local_brick=use_local_brick)
+        # Reuse the validator set up by the pool initializer, if any
+        validator = _WORKER_VALIDATOR
+        if validator is None or validator.use_local_brick != use_local_brick:
+            validator = BrickModelValidator(use_local_brick=use_local_brick)
         return validator.validate_ontology(ttl_file_path)
     except Exception as e:
         return {
@@ -51,16 +419,88 @@ def _validate_ontology_worker(ttl_file_path: str, use_local_brick: bool = True)
         }
 
 
+def _init_count_worker(
+    ground_truth_csv_path: Optional[str] = None,
+    use_local_brick: bool = True,
+    metadata_csv_path: Optional[str] = None,
+):
+    """Pool initializer: create the worker's validator for point / equipment count
+    validation, with the CSV data and the Brick ontology loaded once"""
+    global _WORKER_VALIDATOR
+    _preload_csvs(ground_truth_csv_path, metadata_csv_path)
+    _WORKER_VALIDATOR = BrickModelValidator(
+        ground_truth_csv_path=ground_truth_csv_path,
+        use_local_brick=use_local_brick,
+        metadata_csv_path=metadata_csv_path,
+    )
+    try:
+        _WORKER_VALIDATOR._load_brick_ontology()
+    except Exception as e:
+        # Counting reports the error per file
+        logger.debug(f"Could not load Brick ontology in count worker: {e}")
+
+
+def _validate_count_worker(
+    ttl_file_path: str, method: str = "validate_point_count", include_report: bool = True
+) -> Dict:
+    """
+    Worker function for parallel point / equipment count validation
+
+    Args:
+        ttl_file_path: Path to TTL file to validate
+        method: Name of the validator method to call ('validate_point_count' or
+            'validate_equipment_count')
+        include_report: If False, skip formatting the 'validation_report'
+
+    Returns:
+        Dict with validation results
+    """
+    validate = getattr(_WORKER_VALIDATOR, method)
+    return validate(ttl_file_path, include_report=include_report)
+
+
+def _point_count_error(
+    ttl_file_path: str,
+    building_tag: Optional[str],
+    error: str,
+    expected_point_count: int = 0,
+    validation_report: str = "",
+) -> Dict:
+    """Result of a point count validation that could not be completed"""
+    return {
+        "ttl_file_path": ttl_file_path,
+        "building_tag": building_tag,
+        "expected_point_count": expected_point_count,
+        "actual_point_count": 0,
+        "match": False,
+        "accuracy_percentage": 0.0,
+        "success": False,
+        "validation_report": validation_report,
+        "error": error,
+    }
+
+
 class BrickModelValidator:
     """Brick model validator class using brickschema for ontology validation"""
 
-    def __init__(self, ground_truth_csv_path: str = None, use_local_brick: bool = True):
+    def __init__(
+        self,
+        ground_truth_csv_path: str = None,
+        use_local_brick: bool = True,
+        metadata_csv_path: str = None,
+        cache_path: str = None,
+    ):
         """Initialize validator
 
         Args:
             ground_truth_csv_path: Path to ground_truth.csv file with validation baseline data
                                   (columns: tag, system, point_count, boiler_count, pump_count, weather_station_count)
             use_local_brick: If True, use local Brick_Self.ttl; if False, use GitHub nightly version (default: False)
+            metadata_csv_path: Optional path to metadata.csv (columns: tag, system, b_number),
+                               used to derive pump and boiler counts from the variables CSV
+            cache_path: Optional SQLite results cache (e.g. ".validation_cache/results.db") in
+                        which the batch methods keep each file's result; files whose content
+                        has not changed since are not validated again on the next run
         """
         if not _BRICKSCHEMA_AVAILABLE:
             raise ImportError(
@@ -69,7 +509,12 @@ class BrickModelValidator:
 
         self.ground_truth_csv_path = ground_truth_csv_path
         self.use_local_brick = use_local_brick
+        self.metadata_csv_path = metadata_csv_path
+        self.cache_path = cache_path
         self._ground_truth_data = None
+        self._metadata_data = None
+        # (file key, counts) of the most recently counted TTL file, see _count_all_in_ttl
+        self._last_counts = None
 
         # Set up local Brick path if using local version
         if self.use_local_brick:
@@ -84,23 +529,116 @@ class BrickModelValidator:
             self.local_brick_path = None
             logger.info("Using GitHub nightly Brick Schema")
 
+    def __getstate__(self):
+        # Workers load the CSV data from their own per-process cache (see _preload_csvs)
+        # instead of receiving a pickled copy of it with every task
+        state = self.__dict__.copy()
+        state["_ground_truth_data"] = None
+        state["_metadata_data"] = None
+        state["_last_counts"] = None
+        return state
+
+    def _load_brick_ontology(self) -> Graph:
+        """Return the cached Brick ontology graph, parsing it on first use in this process
+
+        The returned graph is shared and must not be modified; use _create_brick_graph to
+        get a graph that data can be added to.
+
+        Returns:
+            Graph: The parsed Brick ontology (local or nightly)
+        """
+        key = (self.use_local_brick, self.local_brick_path)
+        brick = _BRICK_GRAPH_CACHE.get(key)
+        if brick is None:
+            if self.use_local_brick:
+                # Use local Brick_Self.ttl file
+                brick = Graph()
+                brick.load_file(self.local_brick_path, format="turtle")
+                logger.debug(f"Loaded local Brick Schema from {self.local_brick_path}")
+            else:
+                # Use GitHub nightly version
+                brick = Graph(load_brick_nightly=True)
+                logger.debug("Loaded Brick Schema from GitHub nightly release")
+            _BRICK_GRAPH_CACHE[key] = brick
+            _BRICK_CLASS_CLOSURES[key] = {
+                cls: frozenset(brick.transitive_subjects(RDFS.subClassOf, cls))
+                for cls in _COUNTED_CLASSES
+            }
+        return brick
+
     def _create_brick_graph(self) -> Graph:
         """Create a brickschema Graph with appropriate Brick ontology loaded
 
+        The ontology is parsed once per process and cached; every call returns a new
+        Graph holding a copy of the cached triples, so callers can add their own data.
+
         Returns:
             Graph: A brickschema Graph object with Brick ontology loaded
         """
+        brick = self._load_brick_ontology()
+
+        g = Graph()
+        for prefix, namespace in brick.namespaces():
+            g.bind(prefix, namespace, override=False)
+        g += brick
+        return g
+
+    def _load_validation_graph(self) -> Graph:
+        """Return the cached graph used for ontology validation, building it on first use
+
+        The graph holds the Brick ontology and the QUDT schema, quantity kinds and units
+        (falling back to a local unit.ttl if the units cannot be downloaded). It is shared
+        by every validate_ontology call in the process, which validates a copy of it.
+
+        Returns:
+            Graph: The Brick + QUDT graph for this validator's Brick source
+        """
+        key = (self.use_local_brick, self.local_brick_path)
+        g = _VALIDATION_GRAPH_CACHE.get(key)
+        if g is not None:
+            return g
+
+        # Create brickschema Graph with Brick ontology (local or nightly)
         if self.use_local_brick:
-            # Use local Brick_Self.ttl file
-            g = Graph()
-            g.load_file(self.local_brick_path, format="turtle")
-            logger.debug(f"Loaded local Brick Schema from {self.local_brick_path}")
+            logger.info(f"Loading local Brick Schema from: {self.local_brick_path}")
         else:
-            # Use GitHub nightly version
-            g = Graph(load_brick_nightly=True)
-            logger.debug("Loaded Brick Schema from GitHub nightly release")
+            logger.info("Loading latest Brick Schema from GitHub nightly release...")
+        g = self._create_brick_graph()
+
+        # Load QUDT ontologies (schema, quantity kinds, and units) from online sources. The
+        # downloads are independent, so they run concurrently and are merged in order
+        logger.info("Loading QUDT schema, quantity kinds and units from online sources...")
+        with ThreadPoolExecutor(max_workers=len(_QUDT_SOURCES)) as executor:
+            downloads = [executor.submit(_fetch_rdf, url) for _, url in _QUDT_SOURCES]
+
+        for (name, _), download in zip(_QUDT_SOURCES, downloads):
+            try:
+                qudt = download.result()
+                for prefix, namespace in qudt.namespaces():
+                    g.bind(prefix, namespace, override=False)
+                g += qudt
+                logger.info(f"✓ QUDT {name} loaded successfully")
+            except Exception as e:
+                logger.warning(f"Failed to load QUDT {name} from online: {e}")
+                if name == "units":
+                    self._load_local_units(g)
+
+        _VALIDATION_GRAPH_CACHE[key] = g
         return g
 
+    def _load_local_units(self, g: Graph):
+        """Fallback to local unit.ttl if the QUDT units cannot be loaded online"""
+        current_file_dir = os.path.dirname(__file__)
+        unit_file_path = os.path.join(current_file_dir, "unit.ttl")
+        if not os.path.exists(unit_file_path):
+            project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+            unit_file_path = os.path.join(project_root, "unit.ttl")
+        if os.path.exists(unit_file_path):
+            logger.info(f"Loading unit definitions from local file: {unit_file_path}")
+            g.load_file(unit_file_path, format="turtle")
+        else:
+            logger.warning("unit.ttl not found locally, validation may fail for QUDT units")
+
     def _load_ground_truth_data(self) -> Dict[str, Dict]:
         """Load ground truth data from ground_truth.csv file
 
@@ -119,34 +657,21 @@ class BrickModelValidator:
         if self._ground_truth_data is not None:
             return self._ground_truth_data
 
-        if not self.ground_truth_csv_path or not os.path.exists(self.ground_truth_csv_path):
+        key = _file_key(self.ground_truth_csv_path)
+        if key is None:
             logger.warning(f"Ground truth CSV file not found: {self.ground_truth_csv_path}")
             return {}
 
         try:
-            import pandas as pd
-
-            df = pd.read_csv(self.ground_truth_csv_path)
-
-            ground_truth = {}
-            for _, row in df.iterrows():
-                tag = str(int(row["tag"]))  # Convert to string, ensure it's an integer first
-                ground_truth[tag] = {
-                    "point_count": int(row["point_count"]),
-                    "boiler_count": int(row["boiler_count"]),
-                    "pump_count": int(row["pump_count"]),
-                    "weather_station_count": int(row["weather_station_count"]),
-                    "system": str(row["system"]),
-                }
-
-            self._ground_truth_data = ground_truth
-            logger.info(f"Loaded ground truth data for {len(ground_truth)} buildings")
-            return ground_truth
-
+            ground_truth = _read_ground_truth(*key)
         except Exception as e:
             logger.error(f"Error loading ground truth data: {e}")
             return {}
 
+        self._ground_truth_data = ground_truth
+        logger.info(f"Loaded ground truth data for {len(ground_truth)} buildings")
+        return ground_truth
+
     def _load_metadata_data(self) -> Dict[str, Dict]:
         """Load metadata from metadata.csv for equipment validation
 
@@ -156,398 +681,249 @@ class BrickModelValidator:
         if self._metadata_data is not None:
             return self._metadata_data
 
-        if not self.metadata_csv_path or not os.path.exists(self.metadata_csv_path):
+        key = _file_key(self.metadata_csv_path)
+        if key is None:
             logger.warning(f"Metadata CSV file not found: {self.metadata_csv_path}")
             return {}
 
         try:
-            metadata = {}
-            with open(self.metadata_csv_path, "r") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    tag = row.get("tag", "").strip()
-                    if not tag:
-                        continue
-
-                    # Extract b_number (boiler number)
-                    b_number_str = row.get("b_number", "").strip()
-                    b_number = None
-                    if b_number_str and b_number_str != "NA":
-                        try:
-                            b_number = int(float(b_number_str))
-                        except ValueError:
-                            logger.warning(f"Invalid b_number for tag {tag}: {b_number_str}")
-
-                    metadata[tag] = {"b_number": b_number, "system": row.get("system", "").strip()}
-
-            self._metadata_data = metadata
-            logger.info(f"Loaded metadata for {len(metadata)} buildings")
-            return metadata
-
+            metadata = _read_metadata(*key)
         except Exception as e:
             logger.error(f"Error loading metadata: {e}")
             return {}
 
+        self._metadata_data = metadata
+        logger.info(f"Loaded metadata for {len(metadata)} buildings")
+        return metadata
+
     def _load_pump_count_data(self) -> Dict[str, Dict]:
         """Load pump count data from vars_available_by_building.csv
 
-        New logic:
-        1. Each loop needs at least 1 pump (structural requirement)
-        2. Variables indicate pump count for ONE of the loops
-        3. Total pump count = (num_loops - 1) + variable_pump_count
-        4. District systems: 1 loop (secondary only)
-        5. Boiler/Condensing systems: 2 loops (primary + secondary)
+        See _read_pump_counts for how the pump count is derived.
 
         Returns:
             Dict mapping building tags to pump information
         """
-        if not self.ground_truth_csv_path or not os.path.exists(self.ground_truth_csv_path):
+        key = _file_key(self.ground_truth_csv_path)
+        if key is None:
             logger.warning(f"Ground truth CSV file not found: {self.ground_truth_csv_path}")
             return {}
 
         # Load metadata to determine system type and loop count
-        metadata = self._load_metadata_data()
+        metadata_key = _file_key(self.metadata_csv_path) if self._load_metadata_data() else None
 
         try:
-            pump_data = {}
-            with open(self.ground_truth_csv_path, "r") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    tag = row.get("tag", "").strip()
-                    if not tag:
-                        continue
-
-                    # Determine number of loops based on system type
-                    system_type = metadata.get(tag, {}).get("system", "")
-                    if "District" in system_type:
-                        num_loops = 1  # District systems only have secondary loop
-                    else:
-                        num_loops = 2  # Boiler/Condensing systems have primary + secondary loops
-
-                    # Check pump-related columns
-                    pmp_spd = row.get("pmp_spd", "").strip()
-                    pmp1_spd = row.get("pmp1_spd", "").strip()
-                    pmp2_spd = row.get("pmp2_spd", "").strip()
-                    pmp1_vfd = row.get("pmp1_vfd", "").strip()
-                    pmp2_vfd = row.get("pmp2_vfd", "").strip()
-
-                    # Determine pump count from variables
-                    has_pmp_spd = pmp_spd in ["1", "1.0"]
-                    has_pmp1_spd = pmp1_spd in ["1", "1.0"]
-                    has_pmp2_spd = pmp2_spd in ["1", "1.0"]
-                    has_pmp1_vfd = pmp1_vfd in ["1", "1.0"]
-                    has_pmp2_vfd = pmp2_vfd in ["1", "1.0"]
-
-                    # Count individual pumps from numbered speed signals
-                    spd_count = 0
-                    if has_pmp1_spd:
-                        spd_count += 1
-                    if has_pmp2_spd:
-                        spd_count += 1
-                    if has_pmp_spd and spd_count == 0:  # Only count pmp_spd if no numbered spd
-                        spd_count = 1
-
-                    # Count individual pumps from VFD signals
-                    vfd_count = 0
-                    if has_pmp1_vfd:
-                        vfd_count += 1
-                    if has_pmp2_vfd:
-                        vfd_count += 1
-
-                    # Variable pump count (for one loop) is the maximum of spd_count and vfd_count
-                    variable_pump_count = max(spd_count, vfd_count)
-
-                    # NEW LOGIC: Pump variables represent secondary loop pumps
-                    # District systems: Only 1 loop (secondary), pump_count = variable_pump_count or 1
-                    # Boiler systems: 2 loops (primary + secondary)
-                    #   - Primary loop: always 1 pump (structural, no sensor points)
-                    #   - Secondary loop: variable_pump_count or 1
-                    #   - Total = 1 (primary) + variable_pump_count (secondary)
-                    if num_loops == 1:
-                        # District systems: only secondary loop
-                        pump_count = variable_pump_count if variable_pump_count > 0 else 1
-                    else:
-                        # Boiler systems: primary (1 pump) + secondary (variable pumps)
-                        secondary_pump_count = variable_pump_count if variable_pump_count > 0 else 1
-                        pump_count = 1 + secondary_pump_count
-
-                    # Check for potential error: all pump variables present
-                    has_all = (
-                        has_pmp_spd
-                        and has_pmp1_spd
-                        and has_pmp2_spd
-                        and has_pmp1_vfd
-                        and has_pmp2_vfd
-                    )
-
-                    pump_data[tag] = {
-                        "pump_count": pump_count,
-                        "num_loops": num_loops,
-                        "variable_pump_count": variable_pump_count,
-                        "has_potential_error": has_all,
-                        "pmp_spd": has_pmp_spd,
-                        "pmp1_spd": has_pmp1_spd,
-                        "pmp2_spd": has_pmp2_spd,
-                        "pmp1_vfd": has_pmp1_vfd,
-                        "pmp2_vfd": has_pmp2_vfd,
-                        "spd_count": spd_count,
-                        "vfd_count": vfd_count,
-                    }
-
-            logger.info(f"Loaded pump count data for {len(pump_data)} buildings")
-            return pump_data
-
+            pump_data = _read_pump_counts(key, metadata_key)
         except Exception as e:
             logger.error(f"Error loading pump count data: {e}")
             return {}
 
+        logger.info(f"Loaded pump count data for {len(pump_data)} buildings")
+        return pump_data
+
     def _load_boiler_count_data(self) -> Dict[str, Dict]:
         """Load boiler count data from vars_available_by_building.csv and metadata.csv
 
-        Logic:
-        1. District systems (District HW/Steam): 0 boilers (regardless of metadata)
-        2. Boiler systems: max(variable_inferred_count, b_number from metadata)
+        See _read_boiler_counts for how the boiler count is derived.
 
         Returns:
             Dict mapping building tags to boiler information
         """
-        if not self.ground_truth_csv_path or not os.path.exists(self.ground_truth_csv_path):
+        key = _file_key(self.ground_truth_csv_path)
+        if key is None:
             logger.warning(f"Ground truth CSV file not found: {self.ground_truth_csv_path}")
             return {}
 
         # Load metadata to get b_number and system type
-        metadata = self._load_metadata_data()
+        metadata_key = _file_key(self.metadata_csv_path) if self._load_metadata_data() else None
 
         try:
-            boiler_data = {}
-            with open(self.ground_truth_csv_path, "r") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    tag = row.get("tag", "").strip()
-                    if not tag:
-                        continue
-
-                    # Get system type from metadata
-                    system_type = metadata.get(tag, {}).get("system", "")
-                    is_district_system = "District" in system_type
-
-                    # Get b_number from metadata
-                    b_number = metadata.get(tag, {}).get("b_number", 0) or 0
-
-                    if is_district_system:
-                        # District systems always have 0 boilers
-                        boiler_count = 0
-                    else:
-                        # Boiler systems: infer from variables
-                        # Check boiler-related sensors (sup1-9, ret1-9, fire1-9)
-                        max_boiler_from_vars = 0
-                        for i in range(1, 10):
-                            boiler_sensors = [f"sup{i}", f"ret{i}", f"fire{i}"]
-                            if any(
-                                row.get(sensor, "").strip() in ["1", "1.0"]
-                                for sensor in boiler_sensors
-                            ):
-                                max_boiler_from_vars = max(max_boiler_from_vars, i)
-
-                        # Check for unnumbered boiler sensors
-                        unnumbered_boiler_sensors = ["sup", "ret", "fire", "supp", "retp"]
-                        has_unnumbered = any(
-                            row.get(sensor, "").strip() in ["1", "1.0"]
-                            for sensor in unnumbered_boiler_sensors
-                        )
-
-                        if max_boiler_from_vars == 0 and has_unnumbered:
-                            max_boiler_from_vars = 1
-
-                        # Take maximum of variable-inferred count and b_number
-                        boiler_count = max(max_boiler_from_vars, b_number)
-
-                    boiler_data[tag] = {
-                        "boiler_count": boiler_count,
-                        "b_number": b_number,
-                        "system_type": system_type,
-                        "is_district": is_district_system,
-                    }
-
-            logger.info(f"Loaded boiler count data for {len(boiler_data)} buildings")
-            return boiler_data
-
+            boiler_data = _read_boiler_counts(key, metadata_key)
         except Exception as e:
             logger.error(f"Error loading boiler count data: {e}")
             return {}
 
-    def _count_points_in_ttl(self, ttl_file_path: str, max_retries: int = 2) -> int:
-        """Count points in TTL file using SPARQL query
+        logger.info(f"Loaded boiler count data for {len(boiler_data)} buildings")
+        return boiler_data
+
+    def _count_points_in_ttl(self, ttl_file_path: str, max_retries: int = None) -> int:
+        """Count points in TTL file
 
         Args:
             ttl_file_path: Path to TTL file
-            max_retries: Maximum number of retry attempts for parsing errors
+            max_retries: Deprecated and ignored; parse errors are not retried
 
         Returns:
             Number of points found in the TTL file
         """
-        import time
+        return self._count_all_in_ttl(ttl_file_path, max_retries)["point_count"]
 
-        for attempt in range(max_retries):
-            try:
-                # Create brickschema Graph with Brick ontology (local or nightly)
-                g = self._create_brick_graph()
+    def _count_equipment_in_ttl(self, ttl_file_path: str, max_retries: int = None) -> Dict:
+        """Count equipment in TTL file
 
-                # Try to load the TTL file
-                try:
-                    # Parse with standard turtle parser
-                    g.parse(ttl_file_path, format="turtle")
-                except Exception as parse_error:
-                    # If parsing fails, try alternative approach
-                    logger.warning(f"Standard parsing failed for {ttl_file_path}: {parse_error}")
-                    try:
-                        # Try reading file content and parsing as string
-                        with open(ttl_file_path, "r", encoding="utf-8") as f:
-                            content = f.read()
-                        g.parse(data=content, format="turtle")
-                    except Exception as alt_error:
-                        if attempt < max_retries - 1:
-                            logger.warning(
-                                f"Retry attempt {attempt + 1}/{max_retries} for {ttl_file_path}"
-                            )
-                            time.sleep(0.05 * (attempt + 1))  # Brief pause before retry
-                            continue
-                        logger.error(f"Parsing failed for {ttl_file_path}: {alt_error}")
-                        return -1  # Return -1 to indicate parsing error
-
-                # SPARQL query to count points
-                # Modified to handle owl:sameAs deduplication
-                sparql_query = """
-                PREFIX brick: <https://brickschema.org/schema/Brick#>
-                PREFIX rdf:   <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-                PREFIX rdfs:  <http://www.w3.org/2000/01/rdf-schema#>
-                PREFIX ref:   <https://brickschema.org/schema/Brick/ref#>
-                PREFIX owl:   <http://www.w3.org/2002/07/owl#>
-
-                SELECT (COUNT(DISTINCT ?canonical) AS ?count) WHERE {
-                  ?point rdf:type/rdfs:subClassOf* brick:Point .
-                  ?point ref:hasExternalReference [
-                    a ref:TimeseriesReference ;
-                    ref:hasTimeseriesId ?tsid ;
-                    ref:storedAt ?store
-                  ] .
-
-                  # Handle owl:sameAs - use canonical representation
-                  # If ?point has sameAs, use the object as canonical, otherwise use ?point itself
-                  OPTIONAL { ?point owl:sameAs ?same }
-                  BIND(COALESCE(?same, ?point) AS ?canonical)
-                }
-                """
+        Args:
+            ttl_file_path: Path to TTL file
+            max_retries: Deprecated and ignored; parse errors are not retried
 
-                result = g.query(sparql_query)
-                for row in result:
-                    return int(row[0])
+        Returns:
+            Dict with counts: {'boiler_count': int, 'pump_count': int, 'weather_station_count': int}
+        """
+        counts = self._count_all_in_ttl(ttl_file_path, max_retries)
+        return {
+            "boiler_count": counts["boiler_count"],
+            "pump_count": counts["pump_count"],
+            "weather_station_count": counts["weather_station_count"],
+        }
 
-                return 0
+    def _count_all_in_ttl(self, ttl_file_path: str, max_retries: int = None) -> Dict:
+        """Count points and equipment in a TTL file, parsing it only once
 
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    logger.warning(
-                        f"Error on attempt {attempt + 1}/{max_retries} for {ttl_file_path}: {e}"
-                    )
-                    time.sleep(0.05 * (attempt + 1))
-                    continue
+        The counts of the most recently counted file are kept, so validating point and
+        equipment counts of the same (unchanged) file builds and parses the graph once.
 
-                logger.error(
-                    f"Error counting points in TTL file {ttl_file_path} after {max_retries} attempts: {e}"
-                )
-                return -1  # Return -1 to indicate error
+        Args:
+            ttl_file_path: Path to TTL file
+            max_retries: Deprecated and ignored; parse errors are not retried
+
+        Returns:
+            Dict with 'point_count', 'boiler_count', 'pump_count' and
+            'weather_station_count' (-1 for counts that could not be determined)
+        """
+        if max_retries is not None:
+            warnings.warn(
+                "max_retries is deprecated and ignored; TTL parse errors are not retried",
+                DeprecationWarning,
+                stacklevel=3,
+            )
 
-        return -1  # Should not reach here, but return -1 if all retries failed
+        counts = {
+            "point_count": -1,
+            "boiler_count": -1,
+            "pump_count": -1,
+            "weather_station_count": -1,
+        }
 
-    def _count_equipment_in_ttl(self, ttl_file_path: str, max_retries: int = 2) -> Dict:
-        """Count equipment in TTL file using SPARQL query
+        try:
+            stat = os.stat(ttl_file_path)
+        except OSError as e:
+            logger.error(f"Error loading TTL file {ttl_file_path}: {e}")
+            return counts
+        key = (os.path.abspath(ttl_file_path), stat.st_mtime_ns, stat.st_size)
+        if self._last_counts is not None and self._last_counts[0] == key:
+            return dict(self._last_counts[1])
+
+        g = self._parse_ttl_for_counting(ttl_file_path)
+        if g is None:
+            # Parsing error: every count is -1. Parse errors are deterministic, so the
+            # failure is remembered like any other result and the file is not reparsed.
+            self._last_counts = (key, dict(counts))
+            return counts
+
+        try:
+            counts["point_count"] = self._query_point_count(g)
+        except Exception as e:
+            logger.error(f"Error counting points in TTL file {ttl_file_path}: {e}")
+
+        try:
+            counts.update(self._query_equipment_counts(g))
+        except Exception as e:
+            logger.error(f"Error counting equipment in TTL file {ttl_file_path}: {e}")
+
+        self._last_counts = (key, dict(counts))
+        return counts
+
+    def _parse_ttl_for_counting(self, ttl_file_path: str):
+        """Parse a TTL file on its own, without the Brick ontology, for counting
+
+        The counts only need the class hierarchy below the counted classes, which is
+        precomputed from the ontology (see _instances_of), so the ontology triples do not
+        have to be copied into every file's graph.
+
+        The file is streamed to the parser from a binary handle. Parse errors are
+        deterministic, so a file that fails to parse is reported without further attempts.
 
         Args:
             ttl_file_path: Path to TTL file
-            max_retries: Maximum number of retry attempts for parsing errors
 
         Returns:
-            Dict with counts: {'boiler_count': int, 'pump_count': int, 'weather_station_count': int}
+            rdflib Graph with the file's triples, or None if the file could not be parsed
         """
-        import time
+        g = RDFLibGraph()
 
-        for attempt in range(max_retries):
-            try:
-                # Create brickschema Graph with Brick ontology (local or nightly)
-                g = self._create_brick_graph()
+        try:
+            with open(ttl_file_path, "rb") as f:
+                g.parse(source=f, format="turtle")
+        except Exception as e:
+            logger.error(f"Parsing failed for {ttl_file_path}: {e}")
+            return None
 
-                # Try to load the TTL file
-                try:
-                    # Parse with standard turtle parser
-                    g.parse(ttl_file_path, format="turtle")
-                except Exception as parse_error:
-                    # If parsing fails, try alternative approach
-                    logger.warning(f"Standard parsing failed for {ttl_file_path}: {parse_error}")
-                    try:
-                        # Try reading file content and parsing as string
-                        with open(ttl_file_path, "r", encoding="utf-8") as f:
-                            content = f.read()
-                        g.parse(data=content, format="turtle")
-                    except Exception as alt_error:
-                        if attempt < max_retries - 1:
-                            logger.warning(
-                                f"Retry attempt {attempt + 1}/{max_retries} for {ttl_file_path}"
-                            )
-                            time.sleep(0.05 * (attempt + 1))  # Brief pause before retry
-                            continue
-                        logger.error(f"Parsing failed for {ttl_file_path}: {alt_error}")
-                        return {"boiler_count": -1, "pump_count": -1, "weather_station_count": -1}
-
-                # SPARQL query to count all equipment types in one query
-                sparql_query = """
-                PREFIX brick: <https://brickschema.org/schema/Brick#>
-                PREFIX rdf:   <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-                PREFIX rdfs:  <http://www.w3.org/2000/01/rdf-schema#>
-
-                SELECT
-                  (COUNT(DISTINCT ?boiler) AS ?boiler_count)
-                  (COUNT(DISTINCT ?pump) AS ?pump_count)
-                  (COUNT(DISTINCT ?weather_station) AS ?weather_station_count)
-                WHERE {
-                  OPTIONAL {
-                    ?boiler rdf:type/rdfs:subClassOf* brick:Boiler .
-                  }
-                  OPTIONAL {
-                    ?pump rdf:type/rdfs:subClassOf* brick:Pump .
-                  }
-                  OPTIONAL {
-                    ?weather_station rdf:type/rdfs:subClassOf* brick:Weather_Station .
-                  }
-                }
-                """
+        return g
 
-                result = g.query(sparql_query)
-                for row in result:
-                    return {
-                        "boiler_count": int(row[0]),
-                        "pump_count": int(row[1]),
-                        "weather_station_count": int(row[2]),
-                    }
+    def _instances_of(self, g, cls) -> set:
+        """Instances of a counted class or any of its (transitive) subclasses
 
-                return {"boiler_count": 0, "pump_count": 0, "weather_station_count": 0}
+        Equivalent to ``?s rdf:type/rdfs:subClassOf* cls`` over the Brick ontology plus
+        the model. The subclasses defined by the ontology are precomputed when it is
+        loaded; subclasses the model declares itself (e.g. brick:Firing_Rate_Sensor) are
+        added from the model graph.
 
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    logger.warning(
-                        f"Error on attempt {attempt + 1}/{max_retries} for {ttl_file_path}: {e}"
-                    )
-                    time.sleep(0.05 * (attempt + 1))
-                    continue
+        Args:
+            g: Graph of the building model (without the ontology)
+            cls: One of the counted Brick classes
 
-                logger.error(
-                    f"Error counting equipment in TTL file {ttl_file_path} after {max_retries} attempts: {e}"
-                )
-                return {"boiler_count": -1, "pump_count": -1, "weather_station_count": -1}
+        Returns:
+            Set of instances
+        """
+        self._load_brick_ontology()
+        closure = _BRICK_CLASS_CLOSURES[(self.use_local_brick, self.local_brick_path)][cls]
+
+        declared = list(g.subject_objects(RDFS.subClassOf))
+        if declared:
+            closure = set(closure)
+            changed = True
+            while changed:
+                changed = False
+                for subclass, superclass in declared:
+                    if superclass in closure and subclass not in closure:
+                        closure.add(subclass)
+                        changed = True
+
+        return {s for c in closure for s in g.subjects(RDF.type, c)}
+
+    def _query_point_count(self, g) -> int:
+        """Count distinct points (owl:sameAs-deduplicated) with timeseries references"""
+        # Points with a complete ref:TimeseriesReference (timeseries id and storage)
+        referenced = (
+            point
+            for point in self._instances_of(g, _BRICK_POINT)
+            if any(
+                (ref, RDF.type, _REF_TIMESERIES_REFERENCE) in g
+                and g.value(ref, _REF_HAS_TIMESERIES_ID) is not None
+                and g.value(ref, _REF_STORED_AT) is not None
+                for ref in g.objects(point, _REF_HAS_EXTERNAL_REFERENCE)
+            )
+        )
+
+        # Handle owl:sameAs - a point with sameAs counts as its sameAs target(s),
+        # otherwise as itself
+        canonical = set()
+        for point in referenced:
+            same = set(g.objects(point, OWL.sameAs))
+            canonical.update(same or (point,))
+
+        return len(canonical)
 
-        return {"boiler_count": -1, "pump_count": -1, "weather_station_count": -1}
+    def _query_equipment_counts(self, g) -> Dict:
+        """Count distinct boilers, pumps and weather stations (any subclass)"""
+        return {
+            "boiler_count": len(self._instances_of(g, _BRICK_BOILER)),
+            "pump_count": len(self._instances_of(g, _BRICK_PUMP)),
+            "weather_station_count": len(self._instances_of(g, _BRICK_WEATHER_STATION)),
+        }
 
-    def validate_equipment_count(self, ttl_file_path: str, building_tag: str = None) -> Dict:
+    def validate_equipment_count(
+        self, ttl_file_path: str, building_tag: str = None, include_report: bool = True
+    ) -> Dict:
         """
         Validate equipment count by comparing TTL file against ground truth data
 
@@ -555,6 +931,8 @@ class BrickModelValidator:
             ttl_file_path: Path to the TTL file to validate
             building_tag: Building tag to look up in ground truth data.
                          If None, will try to extract from filename
+            include_report: If False, leave 'validation_report' empty instead of formatting
+                            it (for bulk runs that only need the counts and match status)
 
         Returns:
             Dict: {
@@ -599,13 +977,10 @@ class BrickModelValidator:
         try:
             # Extract building tag from filename if not provided
             if building_tag is None:
-                filename = os.path.basename(ttl_file_path)
-                # Remove .ttl extension first
-                filename_no_ext = filename.replace(".ttl", "")
                 # Assuming filename format like "building_105" or "building_105_non-condensing_h"
-                if filename_no_ext.startswith("building_"):
-                    parts = filename_no_ext.split("_")
-                    building_tag = parts[1]  # Extract the number part
+                match = _TAG_RE.match(os.path.basename(ttl_file_path))
+                if match:
+                    building_tag = match.group(1)  # Extract the number part
                 else:
                     return {
                         "ttl_file_path": ttl_file_path,
@@ -655,26 +1030,29 @@ class BrickModelValidator:
             overall_success = boiler_match and pump_match and weather_match
 
             # Generate validation report
-            report_lines = [
-                f"Equipment Count Validation for Building {building_tag}:",
-                f"",
-                f"Boiler:",
-                f"  Expected: {expected_boiler}",
-                f"  Actual: {actual_counts['boiler_count']}",
-                f"  Status: {'✓ PASS' if boiler_match else '✗ FAIL'}",
-                f"",
-                f"Pump:",
-                f"  Expected: {expected_pump}",
-                f"  Actual: {actual_counts['pump_count']}",
-                f"  Status: {'✓ PASS' if pump_match else '✗ FAIL'}",
-                f"",
-                f"Weather Station:",
-                f"  Expected: {expected_weather_station}",
-                f"  Actual: {actual_counts['weather_station_count']}",
-                f"  Status: {'✓ PASS' if weather_match else '✗ FAIL'}",
-                f"",
-                f"Overall: {'✓ ALL CHECKS PASSED' if overall_success else '✗ VALIDATION FAILED'}",
-            ]
+            validation_report = ""
+            if include_report:
+                report_lines = [
+                    f"Equipment Count Validation for Building {building_tag}:",
+                    f"",
+                    f"Boiler:",
+                    f"  Expected: {expected_boiler}",
+                    f"  Actual: {actual_counts['boiler_count']}",
+                    f"  Status: {'✓ PASS' if boiler_match else '✗ FAIL'}",
+                    f"",
+                    f"Pump:",
+                    f"  Expected: {expected_pump}",
+                    f"  Actual: {actual_counts['pump_count']}",
+                    f"  Status: {'✓ PASS' if pump_match else '✗ FAIL'}",
+                    f"",
+                    f"Weather Station:",
+                    f"  Expected: {expected_weather_station}",
+                    f"  Actual: {actual_counts['weather_station_count']}",
+                    f"  Status: {'✓ PASS' if weather_match else '✗ FAIL'}",
+                    f"",
+                    f"Overall: {'✓ ALL CHECKS PASSED' if overall_success else '✗ VALIDATION FAILED'}",
+                ]
+                validation_report = "\n".join(report_lines)
 
             result = {
                 "ttl_file_path": ttl_file_path,
@@ -695,7 +1073,7 @@ class BrickModelValidator:
                     "match": weather_match,
                 },
                 "overall_success": overall_success,
-                "validation_report": "\n".join(report_lines),
+                "validation_report": validation_report,
             }
 
             status = "PASSED" if overall_success else "FAILED"
@@ -711,7 +1089,9 @@ class BrickModelValidator:
                 "error": str(e),
             }
 
-    def validate_point_count(self, ttl_file_path: str, building_tag: str = None) -> Dict:
+    def validate_point_count(
+        self, ttl_file_path: str, building_tag: str = None, include_report: bool = True
+    ) -> Dict:
         """
         Validate point count by comparing TTL file against ground truth CSV
 
@@ -719,58 +1099,31 @@ class BrickModelValidator:
             ttl_file_path: Path to the TTL file to validate
             building_tag: Building tag to look up in ground truth data.
                          If None, will try to extract from filename
+            include_report: If False, leave 'validation_report' empty instead of formatting
+                            it (for bulk runs that only need the counts and match status)
 
         Returns:
             Dict: Validation results including expected/actual counts and match status
         """
         if not _BRICKSCHEMA_AVAILABLE:
-            return {
-                "ttl_file_path": ttl_file_path,
-                "building_tag": building_tag,
-                "expected_point_count": 0,
-                "actual_point_count": 0,
-                "match": False,
-                "accuracy_percentage": 0.0,
-                "success": False,
-                "validation_report": "",
-                "error": "brickschema is not available",
-            }
+            return _point_count_error(ttl_file_path, building_tag, "brickschema is not available")
 
         if not os.path.exists(ttl_file_path):
-            return {
-                "ttl_file_path": ttl_file_path,
-                "building_tag": building_tag,
-                "expected_point_count": 0,
-                "actual_point_count": 0,
-                "match": False,
-                "accuracy_percentage": 0.0,
-                "success": False,
-                "validation_report": "",
-                "error": f"TTL file not found: {ttl_file_path}",
-            }
+            return _point_count_error(
+                ttl_file_path, building_tag, f"TTL file not found: {ttl_file_path}"
+            )
 
         try:
             # Extract building tag from filename if not provided
             if building_tag is None:
-                filename = os.path.basename(ttl_file_path)
-                # Remove .ttl extension first
-                filename_no_ext = filename.replace(".ttl", "")
                 # Assuming filename format like "building_105" or "building_105_non-condensing_h"
-                if filename_no_ext.startswith("building_"):
-                    parts = filename_no_ext.split("_")
-                    building_tag = parts[1]  # Extract the number part
+                match = _TAG_RE.match(os.path.basename(ttl_file_path))
+                if match:
+                    building_tag = match.group(1)  # Extract the number part
                 else:
-                    return {
-                        "ttl_file_path": ttl_file_path,
-                        "building_tag": "unknown",
-                        "expected_point_count": 0,
-                        "actual_point_count": 0,
-                        "match": False,
-                        "accuracy_percentage": 0.0,
-                        "success": False,
-                        "validation_report": "",
-                        "error": "Could not extract building tag from filename",
-                    }
+                    return _point_count_error(
+                        ttl_file_path, "unknown", "Could not extract building tag from filename"
+                    )
 
             logger.info(
                 f"Starting point count validation for building {building_tag}: {ttl_file_path}"
@@ -780,17 +1133,11 @@ class BrickModelValidator:
             ground_truth = self._load_ground_truth_data()
 
             if building_tag not in ground_truth:
-                return {
-                    "ttl_file_path": ttl_file_path,
-                    "building_tag": building_tag,
-                    "expected_point_count": 0,
-                    "actual_point_count": 0,
-                    "match": False,
-                    "accuracy_percentage": 0.0,
-                    "success": False,
-                    "validation_report": "",
-                    "error": f"Building tag {building_tag} not found in ground truth data",
-                }
+                return _point_count_error(
+                    ttl_file_path,
+                    building_tag,
+                    f"Building tag {building_tag} not found in ground truth data",
+                )
 
             # Get expected point count from ground truth
             expected_count = ground_truth[building_tag]["point_count"]
@@ -800,30 +1147,28 @@ class BrickModelValidator:
 
             # Check if there was a parsing error
             if actual_count == -1:
-                return {
-                    "ttl_file_path": ttl_file_path,
-                    "building_tag": building_tag,
-                    "expected_point_count": expected_count,
-                    "actual_point_count": 0,
-                    "match": False,
-                    "accuracy_percentage": 0.0,
-                    "success": False,
-                    "validation_report": f"Expected points: {expected_count}\nActual points: ERROR (parsing failed)",
-                    "error": "TTL file parsing failed",
-                }
+                return _point_count_error(
+                    ttl_file_path,
+                    building_tag,
+                    "TTL file parsing failed",
+                    expected_point_count=expected_count,
+                    validation_report=f"Expected points: {expected_count}\nActual points: ERROR (parsing failed)",
+                )
 
             # Check if counts match
             match = expected_count == actual_count
             accuracy = 100.0 if match else 0.0
 
             # Generate validation report
-            validation_report = (
-                f"Expected points: {expected_count}\nActual points: {actual_count}\n"
-            )
-            if match:
-                validation_report += "✓ Point counts match"
-            else:
-                validation_report += f"✗ Point counts do not match (difference: {abs(expected_count - actual_count)})"
+            validation_report = ""
+            if include_report:
+                validation_report = (
+                    f"Expected points: {expected_count}\nActual points: {actual_count}\n"
+                )
+                if match:
+                    validation_report += "✓ Point counts match"
+                else:
+                    validation_report += f"✗ Point counts do not match (difference: {abs(expected_count - actual_count)})"
 
             result = {
                 "ttl_file_path": ttl_file_path,
@@ -843,20 +1188,78 @@ class BrickModelValidator:
 
         except Exception as e:
             logger.error(f"Point count validation failed: {e}")
-            return {
-                "ttl_file_path": ttl_file_path,
-                "building_tag": building_tag or "unknown",
-                "expected_point_count": 0,
-                "actual_point_count": 0,
-                "match": False,
-                "accuracy_percentage": 0.0,
-                "success": False,
-                "validation_report": "",
-                "error": str(e),
-            }
+            return _point_count_error(ttl_file_path, building_tag or "unknown", str(e))
+
+    def _preload_for_workers(self, ontology_validation: bool = False):
+        """Load the Brick ontology (for ontology validation: the Brick + QUDT validation
+        graph) before a fork-based pool is created, so that every worker inherits it
+        instead of loading it again; a no-op where pools do not fork
+
+        Args:
+            ontology_validation: Whether the pool validates ontology instead of counts
+        """
+        if _pool_context() is None:
+            return
+        try:
+            if ontology_validation:
+                with warnings.catch_warnings():
+                    warnings.filterwarnings("ignore", category=UserWarning, module="rdflib")
+                    self._load_validation_graph()
+            else:
+                self._load_brick_ontology()
+        except Exception as e:
+            # The workers report the error per file
+            logger.debug(f"Could not preload the Brick ontology: {e}")
+
+    def _results_cache_fingerprint(self, kind: str, include_report: bool = True) -> str:
+        """Identify the validator inputs and result version behind a cached result
+
+        Args:
+            kind: 'point_count', 'equipment_count' or 'ontology'
+            include_report: Whether the result includes the 'validation_report'
+
+        Returns:
+            JSON string, part of the cache key of each file's result
+        """
+        if kind == "ontology":
+            inputs = [self.use_local_brick, _file_key(self.local_brick_path)]
+        else:
+            inputs = [
+                _file_key(self.ground_truth_csv_path),
+                _file_key(self.metadata_csv_path),
+                include_report,
+            ]
+        return json.dumps([_RESULT_CACHE_VERSION, kind, inputs])
+
+    def _iter_with_result_cache(
+        self, kind: str, ttl_files: List[str], run, include_report: bool = True
+    ):
+        """Yield the validation results of ttl_files in order, reusing the results cached
+        in cache_path for files that have not changed (see
+        result_cache.iter_with_results_cache)
+
+        Args:
+            kind: 'point_count', 'equipment_count' or 'ontology'
+            ttl_files: Paths of the TTL files to validate
+            run: Function that validates a list of files and returns their results in order
+            include_report: Whether the results include the 'validation_report'
+
+        Yields:
+            Dict with validation results, one per file in ttl_files
+        """
+        yield from iter_with_results_cache(
+            self.cache_path,
+            ttl_files,
+            self._results_cache_fingerprint(kind, include_report),
+            run,
+        )
 
     def batch_validate_point_count(
-        self, test_data_dir: str, max_files: int = None, max_workers: int = None
+        self,
+        test_data_dir: str,
+        max_files: int = None,
+        max_workers: int = None,
+        include_report: bool = True,
     ) -> Dict:
         """
         Batch point count validation for TTL files in test directory
@@ -865,6 +1268,7 @@ class BrickModelValidator:
             test_data_dir: Path to directory containing test TTL files
             max_files: Maximum number of files to validate (None for all files)
             max_workers: Number of parallel workers (None = CPU count - 1)
+            include_report: If False, skip formatting each file's 'validation_report'
 
         Returns:
             Dict: {
@@ -888,10 +1292,7 @@ class BrickModelValidator:
             }
 
         # Find all TTL files in the directory
-        ttl_files = []
-        for file in os.listdir(test_data_dir):
-            if file.endswith(".ttl"):
-                ttl_files.append(os.path.join(test_data_dir, file))
+        ttl_files = _list_ttl_files(test_data_dir)
 
         if not ttl_files:
             return {
@@ -922,49 +1323,45 @@ class BrickModelValidator:
             max_workers = max(1, multiprocessing.cpu_count() - 1)
 
         logger.info(f"Using {max_workers} parallel workers for validation")
-        print(f"⚙️  Using {max_workers} parallel workers for faster processing")
+        if sys.stdout.isatty():
+            print(f"⚙️  Using {max_workers} parallel workers for faster processing")
 
         # Use parallel processing for faster validation
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_file = {
-                executor.submit(self.validate_point_count, ttl_file): ttl_file
-                for ttl_file in ttl_files
-            }
-
-            # Collect results with progress bar
-            for future in tqdm(
-                as_completed(future_to_file),
+        self._preload_for_workers()
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=_pool_context(),
+            initializer=_init_count_worker,
+            initargs=(self.ground_truth_csv_path, self.use_local_brick, self.metadata_csv_path),
+        ) as executor:
+            # Map files to workers in chunks to batch the inter-process overhead; each
+            # worker validates with its own validator, so the validator is not sent along
+            # with the tasks. Results come back in input order
+            for result in tqdm(
+                self._iter_with_result_cache(
+                    "point_count",
+                    ttl_files,
+                    lambda files: executor.map(
+                        partial(
+                            _validate_count_worker,
+                            method="validate_point_count",
+                            include_report=include_report,
+                        ),
+                        files,
+                        chunksize=_map_chunksize(len(files), max_workers),
+                    ),
+                    include_report=include_report,
+                ),
                 total=len(ttl_files),
                 desc="Validating point counts",
                 unit="file",
+                mininterval=0.5,
             ):
-                try:
-                    result = future.result()
-                    results.append(result)
-
-                    if result.get("success", False):
-                        matched_count += 1
-                    else:
-                        mismatched_count += 1
-
-                except Exception as e:
-                    ttl_file = future_to_file[future]
-                    logger.error(f"Error validating {os.path.basename(ttl_file)}: {e}")
-                    # Add error result
-                    results.append(
-                        {
-                            "ttl_file_path": ttl_file,
-                            "building_tag": "unknown",
-                            "expected_point_count": 0,
-                            "actual_point_count": 0,
-                            "match": False,
-                            "accuracy_percentage": 0.0,
-                            "success": False,
-                            "validation_report": "",
-                            "error": str(e),
-                        }
-                    )
+                results.append(result)
+
+                if result.get("success", False):
+                    matched_count += 1
+                else:
                     mismatched_count += 1
 
         # Calculate overall accuracy
@@ -994,7 +1391,11 @@ class BrickModelValidator:
         return batch_result
 
     def batch_validate_equipment_count(
-        self, test_data_dir: str, max_files: int = None, max_workers: int = None
+        self,
+        test_data_dir: str,
+        max_files: int = None,
+        max_workers: int = None,
+        include_report: bool = True,
     ) -> Dict:
         """
         Batch equipment count validation for TTL files in test directory
@@ -1003,6 +1404,7 @@ class BrickModelValidator:
             test_data_dir: Path to directory containing test TTL files
             max_files: Maximum number of files to validate (None for all files)
             max_workers: Number of parallel workers (None = CPU count - 1)
+            include_report: If False, skip formatting each file's 'validation_report'
 
         Returns:
             Dict: {
@@ -1028,10 +1430,7 @@ class BrickModelValidator:
             }
 
         # Find all TTL files in the directory
-        ttl_files = []
-        for file in os.listdir(test_data_dir):
-            if file.endswith(".ttl"):
-                ttl_files.append(os.path.join(test_data_dir, file))
+        ttl_files = _list_ttl_files(test_data_dir)
 
         if not ttl_files:
             return {
@@ -1054,89 +1453,73 @@ class BrickModelValidator:
         else:
             logger.info(f"Found {len(ttl_files)} TTL files for batch equipment count validation")
 
-        results = []
-        passed_count = 0
-        failed_count = 0
-        potential_errors = []
-
-        # Separate counters for each equipment type
-        boiler_matched = 0
-        boiler_total = 0
-        pump_matched = 0
-        pump_total = 0
-        weather_matched = 0
-        weather_total = 0
-
         # Determine number of workers
         if max_workers is None:
             max_workers = max(1, multiprocessing.cpu_count() - 1)
 
         logger.info(f"Using {max_workers} parallel workers for validation")
-        print(f"⚙️  Using {max_workers} parallel workers for faster processing")
+        if sys.stdout.isatty():
+            print(f"⚙️  Using {max_workers} parallel workers for faster processing")
 
         # Use parallel processing for faster validation
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_file = {
-                executor.submit(self.validate_equipment_count, ttl_file): ttl_file
-                for ttl_file in ttl_files
-            }
+        self._preload_for_workers()
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=_pool_context(),
+            initializer=_init_count_worker,
+            initargs=(self.ground_truth_csv_path, self.use_local_brick, self.metadata_csv_path),
+        ) as executor:
+            # Map files to workers in chunks to batch the inter-process overhead; each
+            # worker validates with its own validator, so the validator is not sent along
+            # with the tasks. Results come back in input order
+            results = list(
+                tqdm(
+                    self._iter_with_result_cache(
+                        "equipment_count",
+                        ttl_files,
+                        lambda files: executor.map(
+                            partial(
+                                _validate_count_worker,
+                                method="validate_equipment_count",
+                                include_report=include_report,
+                            ),
+                            files,
+                            chunksize=_map_chunksize(len(files), max_workers),
+                        ),
+                        include_report=include_report,
+                    ),
+                    total=len(ttl_files),
+                    desc="Validating equipment counts",
+                    unit="file",
+                    mininterval=0.5,
+                )
+            )
 
-            # Collect results with progress bar
-            for future in tqdm(
-                as_completed(future_to_file),
-                total=len(ttl_files),
-                desc="Validating equipment counts",
-                unit="file",
-            ):
-                try:
-                    result = future.result()
-                    results.append(result)
-
-                    if result.get("overall_success", False):
-                        passed_count += 1
-                    else:
-                        failed_count += 1
-
-                    # Count matches for each equipment type
-                    boiler_info = result.get("boiler", {})
-                    if boiler_info.get("expected", 0) is not None:
-                        boiler_total += 1
-                        if boiler_info.get("match", False):
-                            boiler_matched += 1
-
-                    pump_info = result.get("pump", {})
-                    if pump_info.get("expected", 0) is not None:
-                        pump_total += 1
-                        if pump_info.get("match", False):
-                            pump_matched += 1
-
-                    weather_info = result.get("weather_station", {})
-                    if weather_info.get("expected", 0) is not None:
-                        weather_total += 1
-                        if weather_info.get("match", False):
-                            weather_matched += 1
-
-                    # Check for potential pump configuration errors
-                    if pump_info.get("has_potential_error", False):
-                        building_tag = result.get("building_tag", "unknown")
-                        potential_errors.append(
-                            f"Building {building_tag}: All pump variables present (potential configuration error)"
-                        )
-
-                except Exception as e:
-                    ttl_file = future_to_file[future]
-                    logger.error(f"Error validating {os.path.basename(ttl_file)}: {e}")
-                    # Add error result
-                    results.append(
-                        {
-                            "ttl_file_path": ttl_file,
-                            "building_tag": "unknown",
-                            "overall_success": False,
-                            "error": str(e),
-                        }
-                    )
-                    failed_count += 1
+        passed_count = sum(1 for result in results if result.get("overall_success", False))
+        failed_count = len(results) - passed_count
+
+        # Count matches for each equipment type, over the files with an expected count
+        equipment_counts = {}
+        for equipment in ("boiler", "pump", "weather_station"):
+            checked = [
+                result.get(equipment, {})
+                for result in results
+                if result.get(equipment, {}).get("expected", 0) is not None
+            ]
+            equipment_counts[equipment] = (
+                sum(1 for info in checked if info.get("match", False)),
+                len(checked),
+            )
+        boiler_matched, boiler_total = equipment_counts["boiler"]
+        pump_matched, pump_total = equipment_counts["pump"]
+        weather_matched, weather_total = equipment_counts["weather_station"]
+
+        # Check for potential pump configuration errors
+        potential_errors = [
+            f"Building {result.get('building_tag', 'unknown')}: All pump variables present (potential configuration error)"
+            for result in results
+            if result.get("pump", {}).get("has_potential_error", False)
+        ]
 
         # Calculate overall accuracy
         total_files = len(ttl_files)
@@ -1232,6 +1615,22 @@ class BrickModelValidator:
                 "error": f"TTL file not found: {ttl_file_path}",
             }
 
+        # Parse the TTL file first, so a file with syntax errors is rejected before the
+        # ontology is loaded and the SHACL validation runs
+        data = RDFLibGraph()
+        try:
+            data.parse(ttl_file_path, format="turtle")
+        except Exception as e:
+            logger.error(f"Ontology validation failed, could not parse {ttl_file_path}: {e}")
+            return {
+                "ttl_file_path": ttl_file_path,
+                "valid": False,
+                "accuracy_percentage": 0.0,
+                "success": False,
+                "validation_report": f"TTL syntax error: {e}",
+                "error": str(e),
+            }
+
         try:
             logger.info(f"Starting ontology validation for: {ttl_file_path}")
 
@@ -1248,55 +1647,17 @@ class BrickModelValidator:
                 rdflib_logger.setLevel(logging.ERROR)
 
                 try:
-                    # Create brickschema Graph with Brick ontology (local or nightly)
-                    if self.use_local_brick:
-                        logger.info(f"Loading local Brick Schema from: {self.local_brick_path}")
-                    else:
-                        logger.info("Loading latest Brick Schema from GitHub nightly release...")
-                    g = self._create_brick_graph()
-
-                    # Load QUDT ontologies (schema, quantity kinds, and units) from online sources
-                    try:
-                        logger.info("Loading QUDT schema from online source...")
-                        g.load_file("http://qudt.org/schema/qudt/")
-                        logger.info("✓ QUDT schema loaded successfully")
-                    except Exception as e:
-                        logger.warning(f"Failed to load QUDT schema from online: {e}")
-
-                    try:
-                        logger.info("Loading QUDT quantity kinds from online source...")
-                        g.load_file("http://qudt.org/vocab/quantitykind")
-                        logger.info("✓ QUDT quantity kinds loaded successfully")
-                    except Exception as e:
-                        logger.warning(f"Failed to load QUDT quantity kinds from online: {e}")
-
-                    try:
-                        logger.info("Loading QUDT units from online source...")
-                        g.load_file("http://qudt.org/vocab/unit")
-                        logger.info("✓ QUDT units loaded successfully")
-                    except Exception as e:
-                        logger.warning(f"Failed to load QUDT units from online: {e}")
-                        # Fallback to local unit.ttl if online loading fails
-                        current_file_dir = os.path.dirname(__file__)
-                        unit_file_path = os.path.join(current_file_dir, "unit.ttl")
-                        if not os.path.exists(unit_file_path):
-                            project_root = os.path.dirname(
-                                os.path.dirname(os.path.dirname(__file__))
-                            )
-                            unit_file_path = os.path.join(project_root, "unit.ttl")
-                        if os.path.exists(unit_file_path):
-                            logger.info(
-                                f"Loading unit definitions from local file: {unit_file_path}"
-                            )
-                            g.load_file(unit_file_path, format="turtle")
-                        else:
-                            logger.warning(
-                                "unit.ttl not found locally, validation may fail for QUDT units"
-                            )
-
-                    # Load the TTL file to be validated
-                    g.load_file(ttl_file_path, format="turtle")
-                    logger.info(f"Loaded TTL file with {len(g)} triples")
+                    # Validate a copy of the cached Brick + QUDT graph: whatever pyshacl adds
+                    # to the graph during validation is discarded with the copy, and the
+                    # cached graph is only read (safe for concurrent calls)
+                    ontology = self._load_validation_graph()
+                    g = Graph()
+                    for prefix, namespace in chain(ontology.namespaces(), data.namespaces()):
+                        g.bind(prefix, namespace, override=False)
+                    g += ontology
+                    g += data
+                    total_triples = len(g)
+                    logger.info(f"Loaded TTL file with {total_triples} triples")
 
                     # Perform validation
                     valid, _, report = g.validate()
@@ -1325,7 +1686,7 @@ class BrickModelValidator:
                 "accuracy_percentage": accuracy,
                 "success": valid,
                 "validation_report": validation_report,
-                "total_triples": len(g),
+                "total_triples": total_triples,
             }
 
             logger.info(
@@ -1344,6 +1705,53 @@ class BrickModelValidator:
                 "error": str(e),
             }
 
+    def validate_batch(self, ttl_files: List[str], max_workers: int = None) -> List[Dict]:
+        """
+        Ontology validation of several TTL files in parallel
+
+        Each worker process parses the Brick ontology once (see _init_ontology_worker) and
+        builds its validation graph on the first file; files are handed to the workers in
+        chunks. With a cache_path, unchanged files reuse their cached result.
+
+        Args:
+            ttl_files: Paths of the TTL files to validate
+            max_workers: Number of parallel workers (None = CPU count - 1)
+
+        Returns:
+            List of validate_ontology results, in the order of ttl_files
+        """
+        if not ttl_files:
+            return []
+
+        if max_workers is None:
+            max_workers = max(1, multiprocessing.cpu_count() - 1)
+
+        self._preload_for_workers(ontology_validation=True)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=_pool_context(),
+            initializer=_init_ontology_worker,
+            initargs=(self.use_local_brick,),
+        ) as executor:
+            return list(
+                tqdm(
+                    self._iter_with_result_cache(
+                        "ontology",
+                        ttl_files,
+                        lambda files: executor.map(
+                            _validate_ontology_worker,
+                            files,
+                            repeat(self.use_local_brick),
+                            chunksize=_map_chunksize(len(files), max_workers),
+                        ),
+                    ),
+                    total=len(ttl_files),
+                    desc="Validating ontology",
+                    unit="file",
+                    mininterval=0.5,
+                )
+            )
+
     def batch_validate_ontology(self, test_data_dir: str, max_workers: int = None) -> Dict:
         """
         Batch ontology validation for all TTL files in test directory
@@ -1374,10 +1782,7 @@ class BrickModelValidator:
             }
 
         # Find all TTL files in the directory
-        ttl_files = []
-        for file in os.listdir(test_data_dir):
-            if file.endswith(".ttl"):
-                ttl_files.append(os.path.join(test_data_dir, file))
+        ttl_files = _list_ttl_files(test_data_dir)
 
         if not ttl_files:
             return {
@@ -1395,49 +1800,19 @@ class BrickModelValidator:
         if max_workers is None:
             max_workers = max(1, multiprocessing.cpu_count() - 1)
         logger.info(f"Using {max_workers} parallel workers for validation")
-        print(f"⚙️  Using {max_workers} parallel workers for faster processing")
+        if sys.stdout.isatty():
+            print(f"⚙️  Using {max_workers} parallel workers for faster processing")
 
-        results = []
         passed_count = 0
         failed_count = 0
 
         # Use parallel processing for faster validation
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_file = {
-                executor.submit(_validate_ontology_worker, ttl_file, self.use_local_brick): ttl_file
-                for ttl_file in ttl_files
-            }
-
-            # Collect results with progress bar
-            for future in tqdm(
-                as_completed(future_to_file),
-                total=len(ttl_files),
-                desc="Validating ontology",
-                unit="file",
-            ):
-                try:
-                    result = future.result()
-                    results.append(result)
-
-                    if result.get("success", False):
-                        passed_count += 1
-                    else:
-                        failed_count += 1
-
-                except Exception as e:
-                    ttl_file = future_to_file[future]
-                    logger.error(f"Error validating {os.path.basename(ttl_file)}: {e}")
-                    results.append(
-                        {
-                            "ttl_file_path": ttl_file,
-                            "valid": False,
-                            "success": False,
-                            "accuracy_percentage": 0.0,
-                            "error": str(e),
-                        }
-                    )
-                    failed_count += 1
+        results = self.validate_batch(ttl_files, max_workers=max_workers)
+        for result in results:
+            if result.get("success", False):
+                passed_count += 1
+            else:
+                failed_count += 1
 
         # Calculate overall accuracy
         total_files = len(ttl_files)
@@ -1467,118 +1842,159 @@ class BrickModelValidator:
 
     def print_ontology_validation_report(self, result: Dict):
         """Print ontology validation report"""
-        print(f"\n{'=' * 80}")
-        print("ONTOLOGY VALIDATION REPORT")
-        print(f"{'=' * 80}")
+        # Build the whole report and print it once
+        lines = [f"\n{_SEP}", "ONTOLOGY VALIDATION REPORT", _SEP]
 
         if "error" in result:
-            print(f"❌ Error: {result['error']}")
-            print(f"File: {result['ttl_file_path']}")
-            print(f"Accuracy: {result['accuracy_percentage']}%")
-            print(f"{'=' * 80}\n")
+            lines.append(f"❌ Error: {result['error']}")
+            lines.append(f"File: {result['ttl_file_path']}")
+            lines.append(f"Accuracy: {result['accuracy_percentage']}%")
+            lines.append(f"{_SEP}\n")
+            print("\n".join(lines))
             return
 
-        print(f"File: {os.path.basename(result['ttl_file_path'])}")
-        print(f"Total triples: {result.get('total_triples', 'N/A')}")
-        print(f"Validation result: {'✓ PASSED' if result['valid'] else '✗ FAILED'}")
-        print(f"Accuracy: {result['accuracy_percentage']}%")
+        lines.append(f"File: {os.path.basename(result['ttl_file_path'])}")
+        lines.append(f"Total triples: {result.get('total_triples', 'N/A')}")
+        lines.append(f"Validation result: {'✓ PASSED' if result['valid'] else '✗ FAILED'}")
+        lines.append(f"Accuracy: {result['accuracy_percentage']}%")
 
         if result["validation_report"]:
-            print(f"\nValidation Report:")
-            print("-" * 40)
+            lines.append(f"\nValidation Report:")
+            lines.append(_SUB40)
             # Truncate report if too long
             report = result["validation_report"]
             if len(report) > 1000:
                 report = report[:1000] + "\n... (report truncated)"
-            print(report)
+            lines.append(report)
 
-        print(f"\n{'=' * 80}\n")
+        lines.append(f"\n{_SEP}\n")
+        print("\n".join(lines))
 
-    def print_batch_validation_report(self, batch_result: Dict):
-        """Print batch ontology validation report"""
-        print(f"\n{'=' * 80}")
-        print("BATCH ONTOLOGY VALIDATION REPORT")
-        print(f"{'=' * 80}")
+    def print_batch_validation_report(
+        self, batch_result: Dict, chunk_size: int = _REPORT_CHUNK_SIZE
+    ):
+        """
+        Print batch ontology validation report
+
+        Args:
+            batch_result: Batch result dict; its "results" may be a list or any iterable
+                (e.g. a generator), which is consumed lazily
+            chunk_size: Number of result rows formatted and written at a time
+        """
+        # Header, summary and the first chunk of rows go out in one write, then one write per
+        # further chunk of rows instead of a print() per file
+        lines = [f"\n{_SEP}", "BATCH ONTOLOGY VALIDATION REPORT", _SEP]
 
         if "error" in batch_result:
-            print(f"❌ Error: {batch_result['error']}")
-            print(f"{'=' * 80}\n")
+            lines.append(f"❌ Error: {batch_result['error']}")
+            lines.append(f"{_SEP}\n")
+            print("\n".join(lines))
             return
 
-        print(batch_result["summary"])
+        lines.append(batch_result["summary"])
 
-        if batch_result["results"]:
-            print(f"\nIndividual Results:")
-            print("-" * 50)
+        chunks = _iter_chunks(batch_result["results"], chunk_size)
+        first_chunk = next(chunks, None)
+        if first_chunk:
+            lines.append(f"\nIndividual Results:")
+            lines.append(_SUB50)
 
-            for result in batch_result["results"]:
-                filename = os.path.basename(result["ttl_file_path"])
-                status = "✓ PASS" if result["success"] else "✗ FAIL"
-                accuracy = result["accuracy_percentage"]
-                print(f"{filename:<30} {status:<8} {accuracy:>6.1f}%")
+            for chunk in chain([first_chunk], chunks):
+                filenames = [os.path.basename(result["ttl_file_path"]) for result in chunk]
+                for filename, result in zip(filenames, chunk):
+                    status = "✓ PASS" if result["success"] else "✗ FAIL"
+                    accuracy = result["accuracy_percentage"]
+                    lines.append(f"{filename.ljust(30)} {status.ljust(8)} {accuracy:>6.1f}%")
 
-                if not result["success"] and "error" in result:
-                    print(f"  Error: {result['error']}")
+                    if not result["success"] and "error" in result:
+                        lines.append(f"  Error: {result['error']}")
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+                lines = []
 
-        print(f"\n{'=' * 80}\n")
+        lines.append(f"\n{_SEP}\n")
+        print("\n".join(lines))
 
     def print_point_count_validation_report(self, result: Dict):
         """Print point count validation report"""
-        print(f"\n{'=' * 80}")
-        print("POINT COUNT VALIDATION REPORT")
-        print(f"{'=' * 80}")
+        # Build the whole report and print it once
+        lines = [f"\n{_SEP}", "POINT COUNT VALIDATION REPORT", _SEP]
 
         if "error" in result:
-            print(f"❌ Error: {result['error']}")
-            print(f"File: {result['ttl_file_path']}")
-            print(f"Building: {result['building_tag']}")
-            print(f"Accuracy: {result['accuracy_percentage']}%")
-            print(f"{'=' * 80}\n")
+            lines.append(f"❌ Error: {result['error']}")
+            lines.append(f"File: {result['ttl_file_path']}")
+            lines.append(f"Building: {result['building_tag']}")
+            lines.append(f"Accuracy: {result['accuracy_percentage']}%")
+            lines.append(f"{_SEP}\n")
+            print("\n".join(lines))
             return
 
-        print(f"File: {os.path.basename(result['ttl_file_path'])}")
-        print(f"Building: {result['building_tag']}")
-        print(f"Expected points: {result['expected_point_count']}")
-        print(f"Actual points: {result['actual_point_count']}")
-        print(f"Match result: {'✓ MATCHED' if result['match'] else '✗ MISMATCHED'}")
-        print(f"Accuracy: {result['accuracy_percentage']}%")
+        lines.append(f"File: {os.path.basename(result['ttl_file_path'])}")
+        lines.append(f"Building: {result['building_tag']}")
+        lines.append(f"Expected points: {result['expected_point_count']}")
+        lines.append(f"Actual points: {result['actual_point_count']}")
+        lines.append(f"Match result: {'✓ MATCHED' if result['match'] else '✗ MISMATCHED'}")
+        lines.append(f"Accuracy: {result['accuracy_percentage']}%")
 
         if result["validation_report"]:
-            print(f"\nValidation Report:")
-            print("-" * 40)
-            print(result["validation_report"])
+            lines.append(f"\nValidation Report:")
+            lines.append(_SUB40)
+            lines.append(result["validation_report"])
+
+        lines.append(f"\n{_SEP}\n")
+        print("\n".join(lines))
 
-        print(f"\n{'=' * 80}\n")
+    def print_batch_point_count_report(
+        self, batch_result: Dict, chunk_size: int = _REPORT_CHUNK_SIZE
+    ):
+        """
+        Print batch point count validation report
 
-    def print_batch_point_count_report(self, batch_result: Dict):
-        """Print batch point count validation report"""
-        print(f"\n{'=' * 80}")
-        print("BATCH POINT COUNT VALIDATION REPORT")
-        print(f"{'=' * 80}")
+        Args:
+            batch_result: Batch result dict; its "results" may be a list or any iterable
+                (e.g. a generator), which is consumed lazily
+            chunk_size: Number of result rows formatted and written at a time
+        """
+        # Header, summary and the first chunk of rows go out in one write, then one write per
+        # further chunk of rows instead of a print() per file
+        lines = [f"\n{_SEP}", "BATCH POINT COUNT VALIDATION REPORT", _SEP]
 
         if "error" in batch_result:
-            print(f"❌ Error: {batch_result['error']}")
-            print(f"{'=' * 80}\n")
+            lines.append(f"❌ Error: {batch_result['error']}")
+            lines.append(f"{_SEP}\n")
+            print("\n".join(lines))
             return
 
-        print(batch_result["summary"])
+        lines.append(batch_result["summary"])
 
-        if batch_result["results"]:
-            print(f"\nIndividual Results:")
-            print("-" * 70)
-            print(f"{'Filename':<30} {'Building':<10} {'Expected':<8} {'Actual':<8} {'Status':<8}")
-            print("-" * 70)
-
-            for result in batch_result["results"]:
-                filename = os.path.basename(result["ttl_file_path"])
-                building = result["building_tag"]
-                expected = result["expected_point_count"]
-                actual = result["actual_point_count"]
-                status = "✓ MATCH" if result["success"] else "✗ MISMATCH"
-
-                print(f"{filename:<30} {building:<10} {expected:<8} {actual:<8} {status:<8}")
+        chunks = _iter_chunks(batch_result["results"], chunk_size)
+        first_chunk = next(chunks, None)
+        if first_chunk:
+            lines.append(f"\nIndividual Results:")
+            lines.append(_SUB70)
+            lines.append(
+                f"{'Filename':<30} {'Building':<10} {'Expected':<8} {'Actual':<8} {'Status':<8}"
+            )
+            lines.append(_SUB70)
+
+            for chunk in chain([first_chunk], chunks):
+                filenames = [os.path.basename(result["ttl_file_path"]) for result in chunk]
+                for filename, result in zip(filenames, chunk):
+                    building = str(result["building_tag"])
+                    expected = str(result["expected_point_count"])
+                    actual = str(result["actual_point_count"])
+                    status = "✓ MATCH" if result["success"] else "✗ MISMATCH"
+
+                    lines.append(
+                        f"{filename.ljust(30)} {building.ljust(10)} {expected.ljust(8)} "
+                        f"{actual.ljust(8)} {status.ljust(8)}"
+                    )
 
-                if not result["success"] and "error" in result:
-                    print(f"  Error: {result['error']}")
+                    if not result["success"] and "error" in result:
+                        lines.append(f"  Error: {result['error']}")
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+                lines = []
 
-        print(f"\n{'=' * 80}\n")
+        lines.append(f"\n{_SEP}\n")
+        print("\n".join(lines))
@@ -9,7 +9,7 @@ This script generates conceptual pattern diagrams showing:
 - Pattern 2: District System (no boiler, single loop)
 
 Features:
-- Curved lines (splines='curved')
+- Curved lines (splines='curved'; set HHW_SPLINES=line for a faster layout)
 - Ellipse nodes (shape='ellipse')
 - Black & white color scheme (white background nodes)
 - Dashed lines for optional elements
@@ -18,7 +18,10 @@ Author: Generated for HHWS Brick Application
 Date: 2025-10-29
 """
 
-from graphviz import Digraph
+import os
+import hashlib
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -26,6 +29,135 @@ from pathlib import Path
 OUTPUT_DIR = Path(__file__).parent / "Subgraph_Patterns"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Edge routing: 'curved' (default) or e.g. HHW_SPLINES=line / polyline, which
+# Graphviz lays out much faster; straight lines also use tighter spacing
+SPLINES = os.environ.get('HHW_SPLINES', 'curved')
+FAST_LAYOUT = SPLINES != 'curved'
+RANKSEP = '0.8' if FAST_LAYOUT else '1.5'
+NODESEP = '0.6' if FAST_LAYOUT else '1.2'
+
+# Output format: 'png' (300 dpi, default) or e.g. HHW_DIAGRAM_FMT=svg, which skips
+# rasterization and gives much smaller files for these line drawings
+DIAGRAM_FORMAT = os.environ.get('HHW_DIAGRAM_FMT', 'png')
+
+# Styles shared by both pattern diagrams (each adds its own 'label')
+_PATTERN_GRAPH_ATTR = {
+    'dpi': '300',
+    'bgcolor': 'white',
+    'rankdir': 'TB',
+    'ranksep': RANKSEP,
+    'nodesep': NODESEP,
+    'splines': SPLINES,  # Curved lines by default
+    'labelloc': 't',
+    'fontsize': '24',
+    'fontname': 'Helvetica-Bold',
+}
+
+_PATTERN_NODE_ATTR = {
+    'shape': 'ellipse',  # Ellipse nodes
+    'style': 'filled',
+    'fillcolor': 'white',  # All nodes white background
+    'color': 'black',
+    'fontname': 'Helvetica',
+    'fontsize': '14',
+    'penwidth': '2.0',
+    'margin': '0.2,0.1',
+}
+
+_PATTERN_EDGE_ATTR = {
+    'fontname': 'Helvetica',
+    'fontsize': '12',
+    'color': 'black',
+    'arrowsize': '1.0',
+    'penwidth': '1.5',
+}
+
+# Node styles: required entities, optional entities (dashed border), equipment
+_REQUIRED_NODE = {'fillcolor': 'white', 'penwidth': '3.0'}
+_OPTIONAL_NODE = {'fillcolor': 'white', 'penwidth': '2.0', 'style': 'filled,dashed'}
+_EQUIPMENT_NODE = {'fillcolor': 'white', 'penwidth': '2.5'}
+
+
+# ============== Rendering ==============
+
+@lru_cache(maxsize=1)
+def _pattern_template():
+    """
+    Empty Digraph with the shared pattern styles, built once; each pattern draws on a copy
+    """
+    from graphviz import Digraph  # imported here so loading the module needs no graphviz
+
+    dot = Digraph(format=DIAGRAM_FORMAT)
+
+    # Graph settings - curved lines, clean layout
+    dot.attr(rankdir='TB')
+    dot.graph_attr.update(_PATTERN_GRAPH_ATTR)
+
+    # Node style - ellipse nodes, white background
+    dot.node_attr.update(_PATTERN_NODE_ATTR)
+
+    # Edge style - curved black lines
+    dot.edge_attr.update(_PATTERN_EDGE_ATTR)
+
+    return dot
+
+
+# Output settings recorded in each .sha1 file, so changing them is never mistaken for up to date
+_SETTINGS = f'{DIAGRAM_FORMAT} {SPLINES}'
+
+
+def _cached(name):
+    """
+    Path of OUTPUT_DIR/<name>.<format> if it is newer than this script and was rendered
+    with the current settings, else None
+
+    A stat() check that lets the draw functions skip building the graph altogether.
+    """
+    image_path = OUTPUT_DIR / f'{name}.{DIAGRAM_FORMAT}'
+    hash_path = OUTPUT_DIR / f'{name}.sha1'
+    try:
+        if image_path.stat().st_mtime <= Path(__file__).stat().st_mtime:
+            return None
+        if hash_path.read_text().splitlines()[1:] != [_SETTINGS]:
+            return None
+    except OSError:
+        return None
+
+    print(f"↺ Cached: {image_path}")
+    return str(image_path)
+
+
+def _render(dot, name):
+    """
+    Render a diagram to OUTPUT_DIR/<name>.<format> (PNG unless HHW_DIAGRAM_FMT is set)
+
+    The SHA-1 of the output format and DOT source is stored next to the image
+    (<name>.sha1, followed by the output settings); when the image exists and was
+    rendered from the same source, Graphviz is not run again.
+    """
+    if dot.format == 'svg':
+        # Vector output: the raster resolution does not apply
+        dot.graph_attr.pop('dpi', None)
+
+    output_path = OUTPUT_DIR / name
+    image_path = OUTPUT_DIR / f'{name}.{dot.format}'
+    hash_path = OUTPUT_DIR / f'{name}.sha1'
+    source_hash = hashlib.sha1(f'{dot.format}\n{dot.source}'.encode('utf-8')).hexdigest()
+
+    stored_hash = hash_path.read_text().split('\n')[0] if hash_path.exists() else None
+    if image_path.exists() and stored_hash == source_hash:
+        # Refresh the mtime and settings so the next run can take the _cached() shortcut
+        hash_path.write_text(f'{source_hash}\n{_SETTINGS}\n')
+        image_path.touch()
+        print(f"✅ Up to date: {image_path}")
+        return str(image_path)
+
+    dot.render(str(output_path), cleanup=True)
+    hash_path.write_text(f'{source_hash}\n{_SETTINGS}\n')
+    print(f"✅ Generated: {image_path}")
+
+    return str(image_path)
+
 
 # ============== Pattern Drawing Functions ==============
 
@@ -52,77 +184,39 @@ def draw_pattern_1_boiler_system():
     - brick:Primary_Loop → brick:feeds → brick:Secondary_Loop (required)
     """
 
-    dot = Digraph(comment='Pattern 1: Boiler System', format='png')
-
-    # Graph settings - curved lines, clean layout
-    dot.attr(rankdir='TB')
-    dot.graph_attr.update({
-        'dpi': '300',
-        'bgcolor': 'white',
-        'rankdir': 'TB',
-        'ranksep': '1.5',
-        'nodesep': '1.2',
-        'splines': 'curved',  # Curved lines
-        'label': 'Pattern 1: Boiler System',
-        'labelloc': 't',
-        'fontsize': '24',
-        'fontname': 'Helvetica-Bold',
-    })
-
-    # Node style - ellipse nodes, white background
-    dot.node_attr.update({
-        'shape': 'ellipse',  # Ellipse nodes
-        'style': 'filled',
-        'fillcolor': 'white',  # All nodes white background
-        'color': 'black',
-        'fontname': 'Helvetica',
-        'fontsize': '14',
-        'penwidth': '2.0',
-        'margin': '0.2,0.1',
-    })
+    cached = _cached('pattern_1_boiler_system')
+    if cached:
+        return cached
 
-    # Edge style - curved black lines
-    dot.edge_attr.update({
-        'fontname': 'Helvetica',
-        'fontsize': '12',
-        'color': 'black',
-        'arrowsize': '1.0',
-        'penwidth': '1.5',
-    })
+    dot = _pattern_template().copy()
+    dot.comment = 'Pattern 1: Boiler System'
+    dot.graph_attr['label'] = 'Pattern 1: Boiler System'
 
     # ============== Nodes ==============
 
     # Building (required) - thick border
-    dot.node('Building', 'Building\\n(rec:Building)',
-             fillcolor='white', penwidth='3.0')
+    dot.node('Building', 'Building\\n(rec:Building)', **_REQUIRED_NODE)
 
     # Hot Water System (required) - thick border
-    dot.node('HWS', 'Hot_Water_System\\n(brick:Hot_Water_System)',
-             fillcolor='white', penwidth='3.0')
+    dot.node('HWS', 'Hot_Water_System\\n(brick:Hot_Water_System)', **_REQUIRED_NODE)
 
     # Weather Station (optional - dashed border)
-    dot.node('Weather', 'Weather_Station\\n(brick:Weather_Station)',
-             fillcolor='white', penwidth='2.0', style='filled,dashed')
+    dot.node('Weather', 'Weather_Station\\n(brick:Weather_Station)', **_OPTIONAL_NODE)
 
     # Primary Loop (required) - thick border
-    dot.node('PrimLoop', 'Primary_Loop\\n(brick:Hot_Water_Loop)',
-             fillcolor='white', penwidth='3.0')
+    dot.node('PrimLoop', 'Primary_Loop\\n(brick:Hot_Water_Loop)', **_REQUIRED_NODE)
 
     # Secondary Loop (required) - thick border
-    dot.node('SecLoop', 'Secondary_Loop\\n(brick:Hot_Water_Loop)',
-             fillcolor='white', penwidth='3.0')
+    dot.node('SecLoop', 'Secondary_Loop\\n(brick:Hot_Water_Loop)', **_REQUIRED_NODE)
 
     # Boiler in Primary Loop (required) - medium border
-    dot.node('Boiler', 'Boiler\\n(brick:Boiler)',
-             fillcolor='white', penwidth='2.5')
+    dot.node('Boiler', 'Boiler\\n(brick:Boiler)', **_EQUIPMENT_NODE)
 
     # Pump in Primary Loop (required) - medium border
-    dot.node('PrimPump', 'Pump\\n(brick:Pump)',
-             fillcolor='white', penwidth='2.5')
+    dot.node('PrimPump', 'Pump\\n(brick:Pump)', **_EQUIPMENT_NODE)
 
     # Pump in Secondary Loop (required) - medium border
-    dot.node('SecPump', 'Pump\\n(brick:Pump)',
-             fillcolor='white', penwidth='2.5')
+    dot.node('SecPump', 'Pump\\n(brick:Pump)', **_EQUIPMENT_NODE)
 
     # ============== Edges ==============
 
@@ -159,11 +253,7 @@ def draw_pattern_1_boiler_system():
              penwidth='2.5', color='black', style='bold')
 
     # ============== Render ==============
-    output_path = OUTPUT_DIR / 'pattern_1_boiler_system'
-    dot.render(str(output_path), cleanup=True)
-    print(f"✅ Generated: {output_path}.png")
-
-    return str(output_path) + '.png'
+    return _render(dot, 'pattern_1_boiler_system')
 
 
 def draw_pattern_2_district_system():
@@ -185,65 +275,30 @@ def draw_pattern_2_district_system():
     Note: Only ONE loop (Secondary), no Primary loop
     """
 
-    dot = Digraph(comment='Pattern 2: District System', format='png')
-
-    # Graph settings - curved lines, clean layout
-    dot.attr(rankdir='TB')
-    dot.graph_attr.update({
-        'dpi': '300',
-        'bgcolor': 'white',
-        'rankdir': 'TB',
-        'ranksep': '1.5',
-        'nodesep': '1.2',
-        'splines': 'curved',  # Curved lines
-        'label': 'Pattern 2: District System',
-        'labelloc': 't',
-        'fontsize': '24',
-        'fontname': 'Helvetica-Bold',
-    })
-
-    # Node style - ellipse nodes, white background
-    dot.node_attr.update({
-        'shape': 'ellipse',  # Ellipse nodes
-        'style': 'filled',
-        'fillcolor': 'white',  # All nodes white background
-        'color': 'black',
-        'fontname': 'Helvetica',
-        'fontsize': '14',
-        'penwidth': '2.0',
-        'margin': '0.2,0.1',
-    })
+    cached = _cached('pattern_2_district_system')
+    if cached:
+        return cached
 
-    # Edge style - curved black lines
-    dot.edge_attr.update({
-        'fontname': 'Helvetica',
-        'fontsize': '12',
-        'color': 'black',
-        'arrowsize': '1.0',
-        'penwidth': '1.5',
-    })
+    dot = _pattern_template().copy()
+    dot.comment = 'Pattern 2: District System'
+    dot.graph_attr['label'] = 'Pattern 2: District System'
 
     # ============== Nodes ==============
 
     # Building (required) - thick border
-    dot.node('Building', 'Building\\n(rec:Building)',
-             fillcolor='white', penwidth='3.0')
+    dot.node('Building', 'Building\\n(rec:Building)', **_REQUIRED_NODE)
 
     # Hot Water System (required) - thick border
-    dot.node('HWS', 'Hot_Water_System\\n(brick:Hot_Water_System)',
-             fillcolor='white', penwidth='3.0')
+    dot.node('HWS', 'Hot_Water_System\\n(brick:Hot_Water_System)', **_REQUIRED_NODE)
 
     # Weather Station (optional - dashed border)
-    dot.node('Weather', 'Weather_Station\\n(brick:Weather_Station)',
-             fillcolor='white', penwidth='2.0', style='filled,dashed')
+    dot.node('Weather', 'Weather_Station\\n(brick:Weather_Station)', **_OPTIONAL_NODE)
 
     # Secondary Loop (required) - thick border (only one loop in district system)
-    dot.node('SecLoop', 'Secondary_Loop\\n(brick:Hot_Water_Loop)',
-             fillcolor='white', penwidth='3.0')
+    dot.node('SecLoop', 'Secondary_Loop\\n(brick:Hot_Water_Loop)', **_REQUIRED_NODE)
 
     # Pump in Secondary Loop (required) - medium border
-    dot.node('SecPump', 'Pump\\n(brick:Pump)',
-             fillcolor='white', penwidth='2.5')
+    dot.node('SecPump', 'Pump\\n(brick:Pump)', **_EQUIPMENT_NODE)
 
     # ============== Edges ==============
 
@@ -264,11 +319,7 @@ def draw_pattern_2_district_system():
              penwidth='2.0', color='black')
 
     # ============== Render ==============
-    output_path = OUTPUT_DIR / 'pattern_2_district_system'
-    dot.render(str(output_path), cleanup=True)
-    print(f"✅ Generated: {output_path}.png")
-
-    return str(output_path) + '.png'
+    return _render(dot, 'pattern_2_district_system')
 
 
 def draw_legend():
@@ -276,18 +327,27 @@ def draw_legend():
     Draw a legend explaining the visual notation
     """
 
-    dot = Digraph(comment='Legend', format='png')
+    cached = _cached('pattern_legend')
+    if cached:
+        return cached
+
+    from graphviz import Digraph
+
+    dot = Digraph(comment='Legend', format=DIAGRAM_FORMAT)
 
     # Graph settings
     dot.graph_attr.update({
         'label': 'Legend',
         'bgcolor': 'white',
         'rankdir': 'TB',
-        'splines': 'curved',
+        'splines': SPLINES,
         'label': 'Legend: Pattern Diagram Notation',
         'labelloc': 't',
         'fontsize': '20',
         'fontname': 'Helvetica-Bold',
+        # Bounded canvas: a few nodes, no need for a large image (default 96 dpi)
+        'size': '6,4',
+        'ratio': 'compress',
     })
 
     # Node style - ellipse nodes, white background
@@ -300,15 +360,11 @@ def draw_legend():
     })
 
     # Legend items
-    dot.node('req_node', 'Required Entity',
-             fillcolor='white', penwidth='3.0', color='black')
+    dot.node('req_node', 'Required Entity', **_REQUIRED_NODE, color='black')
 
-    dot.node('opt_node', 'Optional Entity',
-             fillcolor='white', penwidth='2.0', color='black',
-             style='filled,dashed')
+    dot.node('opt_node', 'Optional Entity', **_OPTIONAL_NODE, color='black')
 
-    dot.node('eq_node', 'Equipment/Component',
-             fillcolor='white', penwidth='2.5', color='black')
+    dot.node('eq_node', 'Equipment/Component', **_EQUIPMENT_NODE, color='black')
 
     # Edge legend (using invisible nodes for alignment)
     with dot.subgraph(name='cluster_edges') as c:
@@ -324,11 +380,7 @@ def draw_legend():
                style='dashed', penwidth='2.0', color='black')
 
     # Render
-    output_path = OUTPUT_DIR / 'pattern_legend'
-    dot.render(str(output_path), cleanup=True)
-    print(f"✅ Generated: {output_path}.png")
-
-    return str(output_path) + '.png'
+    return _render(dot, 'pattern_legend')
 
 
 # ============== Main Execution ==============
@@ -341,17 +393,14 @@ def main():
     print("=" * 80)
     print(f"\nOutput Directory: {OUTPUT_DIR}\n")
 
-    # Generate Pattern 1: Boiler System
-    print("Drawing Pattern 1: Boiler System...")
-    pattern1_file = draw_pattern_1_boiler_system()
-
-    # Generate Pattern 2: District System
-    print("\nDrawing Pattern 2: District System...")
-    pattern2_file = draw_pattern_2_district_system()
-
-    # Generate Legend
-    print("\nDrawing Legend...")
-    legend_file = draw_legend()
+    # Generate Pattern 1 (Boiler System), Pattern 2 (District System) and the Legend.
+    # Each render runs its own Graphviz process, so the three are drawn concurrently
+    print("Drawing Pattern 1: Boiler System, Pattern 2: District System and Legend...")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        pattern1_file, pattern2_file, legend_file = executor.map(
+            lambda draw: draw(),
+            [draw_pattern_1_boiler_system, draw_pattern_2_district_system, draw_legend],
+        )
 
     # Summary
     print("\n" + "=" * 80)
@@ -363,7 +412,7 @@ def main():
     print(f"  3. Legend: {Path(legend_file).name}")
     print(f"\nAll files saved to: {OUTPUT_DIR}")
     print(f"\nDesign features:")
-    print(f"  • Curved lines (splines='curved')")
+    print(f"  • {'Straight' if FAST_LAYOUT else 'Curved'} lines (splines='{SPLINES}')")
     print(f"  • Ellipse nodes (shape='ellipse')")
     print(f"  • Black & white color scheme")
     print(f"  • White background for all nodes")
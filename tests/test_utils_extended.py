@@ -9,6 +9,7 @@ from pathlib import Path
 from rdflib import Graph
 
 from hhw_brick.utils import brick_query, file_utils, logger as logger_module
+from hhw_brick.utils import testbed
 
 
 class TestBrickQueryExtended:
@@ -303,7 +304,163 @@ class TestConfig:
             pass
 
 
+class TestTestbed:
+    """Tests for testbed module."""
+
+    HW_TEMP_QUERY = """
+    SELECT ?sup ?ret WHERE {
+        ?loop brick:hasPart ?sup .
+        ?loop brick:hasPart ?ret .
+        ?sup rdf:type brick:Leaving_Hot_Water_Temperature_Sensor .
+        ?ret rdf:type brick:Entering_Hot_Water_Temperature_Sensor .
+    }
+    """
+
+    def test_filter_buildings_by_query(self, fixture_dataset):
+        """Test filtering buildings with a SPARQL query (PREFIX omitted)."""
+        qualified = fixture_dataset.filter_buildings_by_query(self.HW_TEMP_QUERY)
+
+        assert len(qualified) > 0
+        assert all(b["query_results"] for b in qualified)
+
+    def test_query_results_cached(self, fixture_dataset):
+        """Test that repeated queries are served from the query cache."""
+        first = fixture_dataset.filter_buildings_by_query(self.HW_TEMP_QUERY)
+        cache_size = len(fixture_dataset._query_cache)
+        assert cache_size > 0
+
+        # Same query with different surrounding whitespace hits the same entries
+        second = fixture_dataset.filter_buildings_by_query("\n" + self.HW_TEMP_QUERY.strip())
+        assert len(fixture_dataset._query_cache) == cache_size
+        assert [b["id"] for b in first] == [b["id"] for b in second]
+
+    def test_query_with_partial_prefixes(self, fixture_dataset):
+        """Test queries declaring some PREFIXes can still use the predefined and model ones."""
+        query = """
+        PREFIX brick: <https://brickschema.org/schema/Brick#>
+        SELECT ?sensor WHERE {
+            ?sensor rdf:type brick:Leaving_Hot_Water_Temperature_Sensor .
+            ?sensor ref:hasExternalReference ?ref .
+        }
+        """
+        assert fixture_dataset.filter_buildings_by_query(query)
+
+        model_prefix_query = """
+        PREFIX rec: <https://w3id.org/rec#>
+        SELECT ?org WHERE { hhws:building29 hhws:belongsToOrganization ?org . }
+        """
+        assert [b["id"] for b in fixture_dataset.filter_buildings_by_query(model_prefix_query)] == [
+            "29"
+        ]
+
+    def test_sensor_columns_cached(self, fixture_dataset):
+        """Test that sensor column mappings are computed once per building."""
+        graph = fixture_dataset.load_brick_model("29")
+
+        mapping = fixture_dataset.get_sensor_columns("29", graph=graph)
+        assert mapping
+        assert "29" in fixture_dataset._sensor_col_cache
+
+        mapping.clear()
+        assert fixture_dataset.get_sensor_columns("29") == fixture_dataset._sensor_col_cache["29"]
+
+    def test_buildings_with_sensors_uses_subclasses(self, fixture_dataset):
+        """Test that sensor type filtering matches Brick subclasses of the requested type."""
+        exact = fixture_dataset.get_buildings_with_sensors(["Leaving_Hot_Water_Temperature_Sensor"])
+        general = fixture_dataset.get_buildings_with_sensors(["Temperature_Sensor"])
+
+        assert exact
+        assert {b["id"] for b in exact} <= {b["id"] for b in general}
+
+    def test_sample_buildings_reproducible(self, fixture_dataset):
+        """Test that seeded sampling is reproducible and leaves the global RNG alone."""
+        import random
+
+        random.seed(0)
+        expected_next = random.random()
+        random.seed(0)
+
+        first = fixture_dataset.sample_buildings(n=3, random_seed=42)
+        second = fixture_dataset.sample_buildings(n=3, random_seed=42)
+
+        assert [b["id"] for b in first] == [b["id"] for b in second]
+        assert len({b["id"] for b in first}) == 3
+        assert random.random() == expected_next
+
+    def test_list_buildings_index(self, fixture_dataset):
+        """Test system type filtering through the building index."""
+        district = fixture_dataset.list_buildings("district")
+        assert {b["system_type"] for b in district} == {"district_hw", "district_steam"}
+        assert [b["id"] for b in district] == sorted((b["id"] for b in district), key=int)
+
+        # Returned records are copies, the index itself is not modified
+        district[0]["query_results"] = []
+        assert "query_results" not in fixture_dataset.get_building(district[0]["id"])
+
+    def test_graph_cache_bounded(self, fixture_dataset):
+        """Test that the in-memory graph cache evicts least recently used models."""
+        fixture_dataset.graph_cache_size = 2
+
+        for building_id in ["29", "34", "53"]:
+            fixture_dataset.load_brick_model(building_id)
+
+        assert list(fixture_dataset._graph_cache) == ["34", "53"]
+
+    def test_load_timeseries_returns_copy(self, fixture_dataset):
+        """Test that modifying a loaded frame does not change the cached data."""
+        df = fixture_dataset.load_timeseries("29")
+        df["extra"] = 1.0
+
+        assert "extra" not in fixture_dataset.load_timeseries("29").columns
+
+    def test_read_timeseries_csv_empty_column(self, tmp_path):
+        """Test that a column without readings is read like pd.read_csv (float NaN)."""
+        import pandas as pd
+
+        csv_path = tmp_path / "29.csv"
+        csv_path.write_text(
+            "datetime_UTC,a,b\n2020-01-01 00:00:00,1.5,\n2020-01-01 00:15:00,2.5,\n"
+        )
+
+        df = testbed._read_timeseries_csv(str(csv_path))
+        expected = pd.read_csv(csv_path)
+        expected["datetime_UTC"] = pd.to_datetime(expected["datetime_UTC"])
+
+        pd.testing.assert_frame_equal(df, expected)
+        assert df["b"].diff().isna().all()
+
+    def test_query_with_data(self, fixture_dataset):
+        """Test extracting timeseries columns for query results."""
+        df = fixture_dataset.query_with_data("29", self.HW_TEMP_QUERY)
+
+        assert df is not None
+        assert list(df.columns) == ["sup", "ret"]
+        assert len(df) > 0
+
+    def test_query_with_data_partial_uri_match(self, fixture_dataset):
+        """Test columns mapped to URIs that only partly match the query results."""
+        mapping = fixture_dataset.get_sensor_columns("29")
+        fixture_dataset._sensor_col_cache["29"] = {
+            f"{uri}_point": column for uri, column in mapping.items()
+        }
+
+        df = fixture_dataset.query_with_data("29", self.HW_TEMP_QUERY)
+
+        assert df is not None
+        assert list(df.columns) == ["sup", "ret"]
+
+
 # Fixtures
+@pytest.fixture
+def fixture_dataset():
+    """TestDataset pointed at the test fixture directories."""
+    fixtures_dir = Path(__file__).parent / "fixtures"
+    dataset = testbed.TestDataset()
+    dataset.brick_models_dir = fixtures_dir / "Brick_Model_File"
+    dataset.timeseries_data_dir = fixtures_dir / "TimeSeriesData"
+    return dataset
+
+
 @pytest.fixture
 def sample_brick_model():
     """Get sample Brick model path."""
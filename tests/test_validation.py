@@ -4,6 +4,10 @@ Tests for Brick model validation module.
 
 import pytest
 import os
+import json
+import shutil
+import sys
+import sqlite3
 import pandas as pd
 from pathlib import Path
 import urllib.error
@@ -92,6 +96,23 @@ class TestBrickModelValidator:
                 result.get("valid") is False or result.get("is_valid") is False or "error" in result
             )
 
+    def test_validate_ontology_syntax_error(self, temp_output_dir):
+        """Test a malformed TTL file is rejected without loading the ontology."""
+        ttl_path = os.path.join(temp_output_dir, "building_1_broken.ttl")
+        with open(ttl_path, "w") as f:
+            f.write(
+                "@prefix brick: <https://brickschema.org/schema/Brick#> .\nthis is not turtle\n"
+            )
+
+        validator = BrickModelValidator(use_local_brick=True)
+        validator._load_validation_graph = lambda: pytest.fail("ontology should not be loaded")
+
+        result = validator.validate_ontology(ttl_path)
+
+        assert result["valid"] is False
+        assert "error" in result
+        assert result["validation_report"].startswith("TTL syntax error")
+
     def test_load_ground_truth_data(self, ground_truth_csv):
         """Test loading ground truth data."""
         if ground_truth_csv is None:
@@ -107,6 +128,30 @@ class TestBrickModelValidator:
         assert isinstance(gt_data, dict)
         assert len(gt_data) > 0
 
+    def test_load_count_data_cached_per_file(self, metadata_csv, vars_csv, temp_output_dir):
+        """Test CSV loaders are shared between validators and reload when the file changes."""
+        from hhw_brick.validation.validator import _read_pump_counts
+
+        vars_copy = os.path.join(temp_output_dir, "vars.csv")
+        shutil.copy(vars_csv, vars_copy)
+
+        first = BrickModelValidator(ground_truth_csv_path=vars_copy, metadata_csv_path=metadata_csv)
+        second = BrickModelValidator(
+            ground_truth_csv_path=vars_copy, metadata_csv_path=metadata_csv
+        )
+        pump_data = first._load_pump_count_data()
+        assert len(pump_data) > 0
+        assert second._load_pump_count_data() is pump_data
+        assert len(first._load_boiler_count_data()) == len(pump_data)
+
+        # Rewriting the file invalidates the cached result
+        with open(vars_copy, "a") as f:
+            f.write("\n")
+        stat = os.stat(vars_copy)
+        os.utime(vars_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert second._load_pump_count_data() is not pump_data
+        assert _read_pump_counts.cache_info().currsize >= 2
+
     def test_validate_point_count(self, sample_ttl_file, ground_truth_csv):
         """Test point count validation."""
         if ground_truth_csv is None:
@@ -123,6 +168,24 @@ class TestBrickModelValidator:
         except AttributeError:
             pytest.skip("validate_point_count method not implemented")
 
+    def test_validate_point_count_without_report(self, sample_ttl_file, ground_truth_csv):
+        """Test that include_report=False skips the text report only."""
+        if ground_truth_csv is None:
+            pytest.skip("ground_truth.csv not found")
+
+        validator = BrickModelValidator(
+            ground_truth_csv_path=ground_truth_csv, use_local_brick=True
+        )
+
+        full = validator.validate_point_count(sample_ttl_file, building_tag="29")
+        bare = validator.validate_point_count(
+            sample_ttl_file, building_tag="29", include_report=False
+        )
+
+        assert bare["validation_report"] == ""
+        assert bare["success"] == full["success"]
+        assert bare["match"] == full["match"]
+
     def test_validator_with_ground_truth(self, metadata_csv, vars_csv, temp_output_dir):
         """Test validator with ground truth CSV."""
         from hhw_brick import GroundTruthCalculator
@@ -149,6 +212,183 @@ class TestBrickModelValidator:
         except FileNotFoundError:
             pytest.skip("Local Brick schema not found")
 
+    def test_init_ontology_worker_loads_brick_once(self):
+        """Test the pool initializer sets up a worker validator with Brick preloaded."""
+        from hhw_brick.validation import validator as validator_module
+
+        validator_module._init_ontology_worker(True)
+        worker_validator = validator_module._WORKER_VALIDATOR
+        try:
+            assert worker_validator is not None
+            assert worker_validator.use_local_brick is True
+            brick = worker_validator._load_brick_ontology()
+            assert BrickModelValidator(use_local_brick=True)._load_brick_ontology() is brick
+        finally:
+            validator_module._WORKER_VALIDATOR = None
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="fork pools on Linux only")
+    def test_pool_workers_inherit_preloaded_ontology(self):
+        """Test validation pools fork, with the Brick ontology loaded before the fork."""
+        from hhw_brick.validation import validator as validator_module
+
+        assert validator_module._pool_context().get_start_method() == "fork"
+
+        validator = BrickModelValidator(use_local_brick=True)
+        validator._preload_for_workers()
+        key = (validator.use_local_brick, validator.local_brick_path)
+        assert key in validator_module._BRICK_GRAPH_CACHE
+
+    def test_count_worker_uses_initialized_validator(self, sample_ttl_file, metadata_csv):
+        """Test count workers validate with the validator set up by the pool initializer."""
+        from hhw_brick.validation import validator as validator_module
+
+        validator_module._init_count_worker(None, True, metadata_csv)
+        try:
+            worker_validator = validator_module._WORKER_VALIDATOR
+            assert worker_validator.metadata_csv_path == metadata_csv
+
+            result = validator_module._validate_count_worker(
+                sample_ttl_file, method="validate_equipment_count", include_report=False
+            )
+            expected = worker_validator.validate_equipment_count(
+                sample_ttl_file, include_report=False
+            )
+            assert result == expected
+        finally:
+            validator_module._WORKER_VALIDATOR = None
+
+    def test_result_cache_skips_unchanged_files(self, sample_ttl_file, tmp_path, monkeypatch):
+        """Test batch results are reused from the results cache until the TTL file changes."""
+        from hhw_brick.validation import result_cache
+
+        ttl_path = str(tmp_path / os.path.basename(sample_ttl_file))
+        shutil.copy(sample_ttl_file, ttl_path)
+        validator = BrickModelValidator(cache_path=str(tmp_path / "cache" / "results.db"))
+
+        calls = []
+
+        def run(files):
+            calls.append(list(files))
+            return [{"ttl_file_path": path, "success": True} for path in files]
+
+        first = list(validator._iter_with_result_cache("point_count", [ttl_path], run))
+        with monkeypatch.context() as m:
+            # Unchanged mtime and size: the file is not read again
+            m.setattr(result_cache, "open", lambda *args: pytest.fail("file read"), raising=False)
+            second = list(validator._iter_with_result_cache("point_count", [ttl_path], run))
+        assert first == second
+        assert calls == [[ttl_path]]
+
+        # A newer mtime with the same content still hits the cache
+        stat = os.stat(ttl_path)
+        os.utime(ttl_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        list(validator._iter_with_result_cache("point_count", [ttl_path], run))
+        assert len(calls) == 1
+
+        # Results are keyed on the file content, and on the validator inputs
+        with open(ttl_path, "a") as f:
+            f.write("\n")
+        list(validator._iter_with_result_cache("point_count", [ttl_path], run))
+        list(validator._iter_with_result_cache("point_count", [ttl_path], run, False))
+        assert len(calls) == 3
+
+    def test_validate_ontology_reuses_validation_graph(self, sample_ttl_file, monkeypatch):
+        """Test ontology validation leaves the shared Brick + QUDT graph unchanged."""
+        from brickschema import Graph
+        from rdflib import OWL, RDFS, Literal
+
+        validator = BrickModelValidator(use_local_brick=True)
+        graph = validator._load_validation_graph()
+        triples = set(graph)
+
+        def validate(self):
+            # Like pyshacl's axioms: triples written into the validated graph
+            self.add((OWL.Class, RDFS.comment, Literal("added during validation")))
+            return True, None, ""
+
+        monkeypatch.setattr(Graph, "validate", validate)
+
+        first = validator.validate_ontology(sample_ttl_file)
+        second = validator.validate_ontology(sample_ttl_file)
+
+        assert first["valid"] is True
+        assert first["total_triples"] == second["total_triples"] > len(triples)
+        assert validator._load_validation_graph() is graph
+        assert set(graph) == triples
+
+    def test_print_batch_report_streams_results(self, capsys):
+        """Test batch reports accept a results generator and print it in chunks."""
+        validator = BrickModelValidator()
+        rows = [
+            {
+                "ttl_file_path": f"/models/building_{i}.ttl",
+                "building_tag": str(i),
+                "expected_point_count": 3,
+                "actual_point_count": 3 if i != 2 else 1,
+                "success": i != 2,
+            }
+            for i in range(5)
+        ]
+        as_list = {"summary": "summary", "results": rows}
+        as_generator = {"summary": "summary", "results": (row for row in rows)}
+
+        validator.print_batch_point_count_report(as_list)
+        expected = capsys.readouterr().out
+        validator.print_batch_point_count_report(as_generator, chunk_size=2)
+
+        assert capsys.readouterr().out == expected
+        assert "building_2.ttl" in expected and "✗ MISMATCH" in expected
+
+        validator.print_batch_point_count_report({"summary": "summary", "results": iter(())})
+        assert "Individual Results" not in capsys.readouterr().out
+
+    def test_count_points_and_equipment_parse_once(self, sample_ttl_file):
+        """Test point and equipment counts of the same file share one parse."""
+        validator = BrickModelValidator(use_local_brick=True)
+
+        calls = []
+        original = validator._parse_ttl_for_counting
+        validator._parse_ttl_for_counting = lambda *args: calls.append(args) or original(*args)
+
+        point_count = validator._count_points_in_ttl(sample_ttl_file)
+        equipment = validator._count_equipment_in_ttl(sample_ttl_file)
+
+        assert len(calls) == 1
+        assert point_count == validator._count_all_in_ttl(sample_ttl_file)["point_count"]
+        assert set(equipment) == {"boiler_count", "pump_count", "weather_station_count"}
+
+    def test_count_points_with_model_declared_subclass(self, temp_output_dir):
+        """Test points typed with a subclass declared in the model itself are counted."""
+        ttl_path = os.path.join(temp_output_dir, "building_1.ttl")
+        with open(ttl_path, "w") as f:
+            f.write(
+                "@prefix brick: <https://brickschema.org/schema/Brick#> .\n"
+                "@prefix ref: <https://brickschema.org/schema/Brick/ref#> .\n"
+                "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n"
+                "@prefix : <urn:building_1#> .\n"
+                ":Custom_Sensor rdfs:subClassOf brick:Temperature_Sensor .\n"
+                ":s1 a :Custom_Sensor ; ref:hasExternalReference [ a ref:TimeseriesReference ;"
+                ' ref:hasTimeseriesId "s1" ; ref:storedAt :db ] .\n'
+                ":s2 a brick:Point ; ref:hasExternalReference [ a ref:TimeseriesReference ;"
+                ' ref:hasTimeseriesId "s2" ; ref:storedAt :db ] .\n'
+                ":s3 a :Custom_Sensor .\n"
+            )
+
+        validator = BrickModelValidator(use_local_brick=True)
+
+        assert validator._count_points_in_ttl(ttl_path) == 2
+
+    def test_count_equipment_district_system_without_boilers(self, fixtures_dir):
+        """Test equipment counts for a district system, which has no boilers."""
+        validator = BrickModelValidator(use_local_brick=True)
+        ttl_path = str(fixtures_dir / "Brick_Model_File" / "building_29_district_hw_z.ttl")
+
+        counts = validator._count_equipment_in_ttl(ttl_path)
+
+        assert counts["boiler_count"] == 0
+        assert counts["pump_count"] >= 0
+        assert counts["weather_station_count"] >= 0
+
     @skip_if_network_error
     def test_create_brick_graph_github(self):
         """Test creating brick graph with GitHub schema."""
@@ -206,6 +446,93 @@ class TestSubgraphPatternValidator:
         except Exception as e:
             pytest.skip(f"Pattern loading not implemented: {e}")
 
+    def test_parse_relative_iris(self, temp_output_dir):
+        """Test relative IRIs resolve against the file location, whichever parser is used."""
+        from pathlib import Path
+        from rdflib import URIRef
+
+        ttl_path = os.path.join(temp_output_dir, "relative.ttl")
+        with open(ttl_path, "w", encoding="utf-8") as f:
+            f.write(
+                "@prefix brick: <https://brickschema.org/schema/Brick#> .\n"
+                "<#pump1> a brick:Pump .\n"
+            )
+
+        g, error = SubgraphPatternValidator()._parse_ttl_file(ttl_path)
+
+        assert error is None
+        assert (URIRef(Path(ttl_path).absolute().as_uri() + "#pump1"), None, None) in g
+
+    def test_validate_inverse_relations_and_model_subclasses(self, fixtures_dir, temp_output_dir):
+        """Test models using isPartOf/isFedBy and model-declared subclasses still match."""
+        from rdflib import Graph, Namespace, RDF, RDFS
+
+        brick = Namespace("https://brickschema.org/schema/Brick#")
+        custom_pump = Namespace("https://example.org/model#")["Custom_Pump"]
+        source = str(fixtures_dir / "Brick_Model_File" / "building_53_condensing_x.ttl")
+
+        model = Graph()
+        model.parse(source, format="turtle")
+        rewritten = Graph()
+        rewritten.add((custom_pump, RDFS.subClassOf, brick.Pump))
+        for s, p, o in model:
+            if p == brick.hasPart:
+                rewritten.add((o, brick.isPartOf, s))
+            elif p == brick.feeds:
+                rewritten.add((o, brick.isFedBy, s))
+            elif p == RDF.type and o == brick.Pump:
+                rewritten.add((s, p, custom_pump))
+            else:
+                rewritten.add((s, p, o))
+        assert not set(rewritten.triples((None, brick.hasPart, None)))
+
+        ttl_path = os.path.join(temp_output_dir, "building_53_inverse.ttl")
+        rewritten.serialize(ttl_path, format="turtle")
+
+        validator = SubgraphPatternValidator()
+        expected = validator.validate_building(source)
+        result = validator.validate_building(ttl_path)
+
+        assert result["primary_pattern"] == expected["primary_pattern"]
+        assert result["matched_patterns"] == expected["matched_patterns"]
+
+    def test_batch_validate_streams_jsonl(self, fixtures_dir, temp_output_dir):
+        """Test batch validation streaming per-building results to JSONL."""
+        validator = SubgraphPatternValidator()
+        jsonl_path = os.path.join(temp_output_dir, "results.jsonl")
+
+        batch = validator.batch_validate_all_buildings(
+            str(fixtures_dir / "Brick_Model_File"), max_workers=1, results_jsonl=jsonl_path
+        )
+
+        assert batch["results"] == []
+        assert batch["results_jsonl"] == jsonl_path
+        with open(jsonl_path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        assert len(records) == batch["total_files"]
+        assert sum(batch["pattern_distribution"].values()) == len(records)
+
+    def test_batch_validate_results_cache(self, fixtures_dir, temp_output_dir):
+        """Test that a second batch run is served from the results cache."""
+        validator = SubgraphPatternValidator()
+        cache_path = os.path.join(temp_output_dir, "cache", "results.db")
+        ttl_dir = str(fixtures_dir / "Brick_Model_File")
+
+        first = validator.batch_validate_all_buildings(
+            ttl_dir, max_workers=1, cache_path=cache_path
+        )
+        with sqlite3.connect(cache_path) as conn:
+            (cached,) = conn.execute("SELECT COUNT(*) FROM results").fetchone()
+        assert cached == first["total_files"]
+
+        second = validator.batch_validate_all_buildings(
+            ttl_dir, max_workers=1, cache_path=cache_path
+        )
+        assert sorted(second["results"], key=lambda r: r["filename"]) == sorted(
+            first["results"], key=lambda r: r["filename"]
+        )
+        assert second["pattern_distribution"] == first["pattern_distribution"]
+
 
 class TestGroundTruthCalculator:
     """Test cases for GroundTruthCalculator class."""
@@ -298,6 +625,74 @@ class TestGroundTruthCalculator:
             # District systems should have 0 boilers
             assert (district_systems["boiler_count"] == 0).all()
 
+    def test_ground_truth_counts_with_missing_values(self, temp_output_dir):
+        """Test counts when source CSVs contain NA, empty and non-numeric values."""
+        metadata_path = os.path.join(temp_output_dir, "metadata.csv")
+        vars_path = os.path.join(temp_output_dir, "vars.csv")
+        pd.DataFrame(
+            {
+                "tag": [1, 2, 3],
+                "system": ["District HW", "Condensing", " Boiler "],
+                "b_number": ["NA", "1", "x"],
+            }
+        ).to_csv(metadata_path, index=False)
+        pd.DataFrame(
+            {
+                "tag": [1, 2, 3],
+                "datetime": [1, 1, 1],
+                "sup": ["1", "NA", "abc"],
+                "fire3": ["1", "1.0", ""],
+                "pmp2_vfd": ["1", "0", "NULL"],
+                "oper": ["", "1", "0"],
+            }
+        ).to_csv(vars_path, index=False)
+
+        calculator = GroundTruthCalculator()
+        result = calculator.calculate(
+            metadata_csv=metadata_path,
+            vars_csv=vars_path,
+            output_csv=os.path.join(temp_output_dir, "gt.csv"),
+        )
+
+        assert result["tag"].tolist() == ["1", "2", "3"]
+        assert result["system"].tolist() == ["District HW", "Condensing", "Boiler"]
+        assert result["point_count"].tolist() == [3, 2, 0]
+        assert result["boiler_count"].tolist() == [0, 3, 1]
+        assert result["pump_count"].tolist() == [2, 2, 2]
+        assert result["weather_station_count"].tolist() == [0, 1, 0]
+
+    def test_ground_truth_parquet_output(self, metadata_csv, vars_csv, temp_output_dir):
+        """Test writing ground truth as Parquet and loading it in the validator."""
+        pytest.importorskip("pyarrow")
+
+        calculator = GroundTruthCalculator()
+        output_path = os.path.join(temp_output_dir, "ground_truth.parquet")
+
+        result = calculator.calculate(
+            metadata_csv=metadata_csv, vars_csv=vars_csv, output_csv=output_path, chunk_size=3
+        )
+
+        df_readback = pd.read_parquet(output_path)
+        pd.testing.assert_frame_equal(df_readback, result)
+
+        validator = BrickModelValidator(ground_truth_csv_path=output_path)
+        ground_truth = validator._load_ground_truth_data()
+        assert len(ground_truth) == len(result)
+
+    def test_ground_truth_chunked_output(self, metadata_csv, vars_csv, temp_output_dir):
+        """Test that chunked calculation writes the same result as a single chunk."""
+        calculator = GroundTruthCalculator()
+        full = calculator.calculate(
+            metadata_csv, vars_csv, os.path.join(temp_output_dir, "gt_full.csv")
+        )
+
+        output_path = os.path.join(temp_output_dir, "gt_chunked.csv")
+        chunked = calculator.calculate(metadata_csv, vars_csv, output_path, chunk_size=3)
+
+        pd.testing.assert_frame_equal(chunked, full)
+        df_readback = pd.read_csv(output_path, dtype={"tag": str})
+        pd.testing.assert_frame_equal(df_readback, full)
+
     def test_ground_truth_output_file_format(self, metadata_csv, vars_csv, temp_output_dir):
         """Test that output CSV file is properly formatted."""
         calculator = GroundTruthCalculator()